@@ -1,147 +1,3311 @@
-import csv
-import tkinter as tk
-from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
+from __future__ import annotations
+
+import time
+_IMPORT_START = time.perf_counter()  # --startup-profile için
+
+import numpy as np
+from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import datetime
+import atexit
+import base64
+import hashlib
+import importlib
+import io
+import json
 import logging
+import logging.handlers
 import os
-from typing import List, Dict, Optional, Union
+import queue
+import re
+import shutil
+import sys
+import threading
+import tracemalloc
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Union, Iterable, Iterator, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from pandas import DataFrame
+
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+except ImportError:  # Tk olmayan sunucularda toplu raporlama (toplu_rapor.py) için
+    tk = ttk = messagebox = None
+
+# --- Ertelenmiş İçe Aktarmalar ---
+IMPORT_TIMES: Dict[str, float] = {}
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde içe aktarılan modül vekili
+    
+    pandas ve matplotlib açılışta değil, ilk analizde / ilk grafikte yüklenir;
+    yükleme süreleri IMPORT_TIMES'a yazılır.
+    """
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def _load(self):
+        if self._module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self._name)
+            elapsed = time.perf_counter() - start
+            if self._name not in IMPORT_TIMES:
+                IMPORT_TIMES[self._name] = elapsed
+                logging.debug(f"{self._name} {elapsed * 1000:.0f} ms'de yüklendi")
+            self._module = module
+        return self._module
+    
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+
+pd = LazyModule('pandas')
+plt = LazyModule('matplotlib.pyplot')
+mpl_style = LazyModule('matplotlib.style')
+mpl_figure = LazyModule('matplotlib.figure')
+backend_agg = LazyModule('matplotlib.backends.backend_agg')
+backend_tkagg = LazyModule('matplotlib.backends.backend_tkagg')
+
+
+def close_pyplot_figure(fig):
+    """Figür pyplot kaydındaysa oradan düşürür (pyplot hiç yüklenmediyse bir şey yapmaz)"""
+    if 'matplotlib.pyplot' in sys.modules:
+        plt.close(fig)
+
+
+def startup_report() -> str:
+    """Açılış süresinin nereye gittiğini özetler (--startup-profile)"""
+    lines = [f"Modül içe aktarma: {(_IMPORT_END - _IMPORT_START) * 1000:.0f} ms",
+             f"Geçen süre: {(time.perf_counter() - _IMPORT_START) * 1000:.0f} ms"]
+    if IMPORT_TIMES:
+        lines.append("Ertelenmiş içe aktarmalar:")
+        lines.extend(f"  {name}: {seconds * 1000:.0f} ms" for name, seconds in IMPORT_TIMES.items())
+    else:
+        lines.append("Ertelenmiş içe aktarma henüz yapılmadı")
+    return "\n".join(lines)
 
 # --- Logging Konfigürasyonu ---
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('data_analysis.log'),
-        logging.StreamHandler()
-    ]
-)
+class RepeatFilter(logging.Filter):
+    """Birebir tekrar eden log kayıtlarını sınırlar
+    
+    Aynı mesaj (seviye, msg, args) bir pencere içinde en fazla burst kez
+    geçer; fazlası kuyruğa hiç girmez ve sayılır. Sayım, pencere yenilendikten
+    sonraki ilk kayda özet olarak eklenir. Farklı mesajlar aynı satırdan
+    gelse de birbirini bastırmaz.
+    """
+    MAX_KEYS = 1024  # izlenen farklı mesaj sayısı sınırı
+    
+    def __init__(self, window: float = 5.0, burst: int = 5):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self._sites: Dict[tuple, list] = {}  # mesaj -> [pencere başı, sayı, bastırılan]
+        self._dropped = 0  # sınır nedeniyle unutulan mesajların bastırılmış kayıtları
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, str(record.msg), repr(record.args))
+        now = record.created
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None and len(self._sites) >= self.MAX_KEYS:
+                self._prune(now)
+            if site is None or now - site[0] >= self.window:
+                suppressed = site[2] if site else 0
+                self._sites[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = (f"{record.getMessage()} (önceki {self.window:g} sn içinde "
+                                  f"{suppressed} benzer kayıt bastırıldı)")
+                    record.args = ()
+                return True
+            site[1] += 1
+            if site[1] <= self.burst:
+                return True
+            site[2] += 1
+            return False
+    
+    def _prune(self, now: float):
+        """Penceresi dolan mesajları unutur; hâlâ sınırdaysa en eskileri atar"""
+        for key in [key for key, site in self._sites.items() if now - site[0] >= self.window]:
+            self._dropped += self._sites.pop(key)[2]
+        while len(self._sites) >= self.MAX_KEYS:
+            self._dropped += self._sites.pop(next(iter(self._sites)))[2]
+    
+    def drain(self) -> int:
+        """Henüz özetlenmemiş bastırılmış kayıt sayısını döndürüp sıfırlar"""
+        with self._lock:
+            suppressed = self._dropped + sum(site[2] for site in self._sites.values())
+            self._sites.clear()
+            self._dropped = 0
+        return suppressed
+
+
+class BatchFlushMixin:
+    """Her kayıtta değil, yazıcının toplu yazımı sonunda flush eder"""
+    def flush(self):
+        pass  # StreamHandler.emit her kayıttan sonra çağırır
+    
+    def flush_batch(self):
+        super().flush()
+
+
+class BatchRotatingFileHandler(BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+
+class BatchStreamHandler(BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class LogWriter(threading.Thread):
+    """Kuyruktaki kayıtları toplu halde işleyicilere yazan arka plan iş parçacığı"""
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler],
+                 batch_size: int = 512, flush_interval: float = 0.5):
+        super().__init__(name='log-writer', daemon=True)
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+    
+    def run(self):
+        running = True
+        while running:
+            try:
+                batch = [self.queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            for record in batch:
+                if record is None:  # durdurma işareti
+                    running = False
+                    continue
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            for handler in self.handlers:
+                handler.flush_batch()
+        
+        for handler in self.handlers:
+            handler.close()
+    
+    def stop(self, timeout: float = 5.0):
+        self.queue.put(None)
+        self.join(timeout)
+
+
+_log_writer: Optional[LogWriter] = None
+_repeat_filter: Optional[RepeatFilter] = None
+_log_config: Dict = {}
+
+
+def setup_logging(log_file: Optional[str] = 'data_analysis.log', level: int = logging.INFO,
+                  console: bool = True, max_bytes: int = 5 * 1024 * 1024, backup_count: int = 3,
+                  repeat_window: float = 5.0, repeat_burst: int = 5):
+    """Kuyruk tabanlı loglamayı kurar (içe aktarmada değil, uygulama başlarken çağrılır)
+    
+    Çağıran iş parçacığı yalnızca kaydı kuyruğa koyar; biçimlendirme, disk
+    yazımı, boyuta göre döndürme ve flush arka plandaki LogWriter'da toplu yapılır.
+    Tekrar çağrılırsa önceki yazıcı durdurulup yerine yenisi kurulur.
+    """
+    global _log_writer, _repeat_filter
+    shutdown_logging()
+    _log_config.update(log_file=log_file, level=level, console=console, max_bytes=max_bytes,
+                       backup_count=backup_count, repeat_window=repeat_window,
+                       repeat_burst=repeat_burst)
+    
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers: List[logging.Handler] = []
+    if log_file:
+        handlers.append(BatchRotatingFileHandler(log_file, maxBytes=max_bytes,
+                                                 backupCount=backup_count, encoding='utf-8'))
+    if console:
+        handlers.append(BatchStreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue: queue.Queue = queue.Queue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    _repeat_filter = RepeatFilter(repeat_window, repeat_burst)
+    queue_handler.addFilter(_repeat_filter)
+    
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(level)
+    
+    _log_writer = LogWriter(log_queue, handlers)
+    _log_writer.start()
+
+
+def shutdown_logging():
+    """Kuyrukta bekleyen kayıtları yazıp arka plan yazıcısını durdurur"""
+    global _log_writer
+    if _log_writer is not None and _log_writer.is_alive():
+        suppressed = _repeat_filter.drain()
+        if suppressed:
+            logging.warning(f"Toplam {suppressed} tekrar eden log kaydı bastırıldı")
+        _log_writer.stop()
+    _log_writer = None
+
+
+def _restart_logging_in_child():
+    # Çatallanan süreçte yazıcı iş parçacığı yoktur; kuyruk boşalmaz, yeniden kur.
+    # Ortak dosyayı yalnızca ana süreç döndürür.
+    global _log_writer
+    if _log_writer is not None:
+        _log_writer = None
+        setup_logging(**dict(_log_config, max_bytes=0))
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_logging_in_child)
+
+# --- Ölçüm ve Tanılama ---
+class _NullStage:
+    """Ölçüm kapalıyken dönen, hiçbir şey yapmayan bağlam"""
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def add_rows(self, rows: int):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def current_rss() -> int:
+    """Anlık yerleşik bellek (bayt); /proc yoksa sürecin en yüksek değeri"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return peak_rss()
+
+
+def peak_rss() -> int:
+    """Sürecin en yüksek yerleşik belleği (bayt)"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class _Stage:
+    """Bir aşamanın süresini, satır sayısını, RSS ve ayırma farkını ölçer"""
+    __slots__ = ('metrics', 'name', 'rows', 'start', 'rss', 'allocated')
+    
+    def __init__(self, metrics: 'Metrics', name: str, rows: int):
+        self.metrics = metrics
+        self.name = name
+        self.rows = rows
+    
+    def add_rows(self, rows: int):
+        self.rows += rows
+    
+    def __enter__(self):
+        self.rss = current_rss()
+        self.allocated = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        allocated = (tracemalloc.get_traced_memory()[0] - self.allocated
+                     if self.allocated is not None and tracemalloc.is_tracing() else 0)
+        self.metrics._record(self.name, elapsed, self.rows, current_rss() - self.rss, allocated)
+        return False
+
+
+class Metrics:
+    """Aşama süreleri, satır hızı, bellek ve önbellek isabetleri için ölçüm kaydı
+    
+    Kapalıyken stage() paylaşılan boş bir bağlam döndürür ve cache() hemen
+    döner; ölçüm noktaları satır başına değil işlem/parça başınadır.
+    """
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._profile_next = False
+        self.last_profile: Optional[str] = None
+        self.reset()
+    
+    def enable(self, track_allocations: bool = False):
+        """Ölçümü açar; track_allocations tracemalloc'u da başlatır (yavaşlatır)"""
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self.enabled = True
+    
+    def disable(self):
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    def reset(self):
+        with self._lock:
+            self._stages: Dict[str, Dict] = {}
+            self._caches: Dict[str, List[int]] = {}
+    
+    def stage(self, name: str, rows: int = 0):
+        """with METRICS.stage('ayrıştırma', rows): ... — aşamayı ölçer"""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, rows)
+    
+    def cache(self, name: str, hit: bool):
+        """Bir önbellek erişimini isabet/ıska olarak sayar"""
+        if not self.enabled:
+            return
+        with self._lock:
+            counts = self._caches.setdefault(name, [0, 0])
+            counts[0 if hit else 1] += 1
+    
+    def _record(self, name: str, elapsed: float, rows: int, rss_delta: int, allocated: int):
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = {'çağrı': 0, 'toplam_sn': 0.0, 'en_uzun_sn': 0.0,
+                                              'satır': 0, 'rss_artışı': 0, 'ayrılan_bayt': 0}
+            stats['çağrı'] += 1
+            stats['toplam_sn'] += elapsed
+            stats['en_uzun_sn'] = max(stats['en_uzun_sn'], elapsed)
+            stats['son_sn'] = elapsed
+            stats['satır'] += rows
+            stats['rss_artışı'] = max(stats['rss_artışı'], rss_delta)
+            stats['ayrılan_bayt'] = max(stats['ayrılan_bayt'], allocated)
+    
+    def snapshot(self) -> Dict:
+        """Ölçümlerin JSON'a yazılabilir kopyası"""
+        with self._lock:
+            stages = {}
+            for name, stats in self._stages.items():
+                stats = dict(stats)
+                stats['ortalama_sn'] = stats['toplam_sn'] / stats['çağrı']
+                stats['satır_per_sn'] = (stats['satır'] / stats['toplam_sn']
+                                         if stats['satır'] and stats['toplam_sn'] else None)
+                stages[name] = stats
+            caches = {name: {'isabet': hits, 'ıska': misses,
+                             'oran': hits / (hits + misses) if hits + misses else 0.0}
+                      for name, (hits, misses) in self._caches.items()}
+        memory = {'rss': current_rss(), 'en_yüksek_rss': peak_rss()}
+        if tracemalloc.is_tracing():
+            memory['izlenen'], memory['izlenen_en_yüksek'] = tracemalloc.get_traced_memory()
+        return {'açık': self.enabled, 'aşamalar': stages, 'önbellekler': caches, 'bellek': memory}
+    
+    def profile_next(self):
+        """Bir sonraki profile() çağrısını (ör. sıradaki arka plan işi) cProfile ile yakalar"""
+        self._profile_next = True
+    
+    def profile(self, func: Callable, *args, force: bool = False, limit: int = 30):
+        """func(*args)'ı çalıştırır; istenmişse cProfile özetini last_profile'a yazar"""
+        if not (force or self._profile_next):
+            return func(*args)
+        self._profile_next = False
+        
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+            self.last_profile = output.getvalue()
+
+
+METRICS = Metrics()
 
 # --- Veri Doğrulama Sınıfı ---
+class ValidationReport:
+    """Reddedilen satırların indekslerini ve nedenlerini tutan doğrulama raporu"""
+    def __init__(self):
+        self.total_rows = 0
+        self.missing_columns: List[str] = []
+        self._errors: Dict[str, List[np.ndarray]] = {}
+    
+    def add(self, rows: np.ndarray, reason: str):
+        """Bir kurala takılan satır indekslerini (0 tabanlı) ekler"""
+        if len(rows):
+            self._errors.setdefault(reason, []).append(np.asarray(rows, dtype=np.int64))
+    
+    def merge(self, other: 'ValidationReport'):
+        """Başka bir parçanın raporunu bu rapora ekler"""
+        self.total_rows += other.total_rows
+        for column in other.missing_columns:
+            if column not in self.missing_columns:
+                self.missing_columns.append(column)
+        for reason, blocks in other._errors.items():
+            self._errors.setdefault(reason, []).extend(blocks)
+    
+    @property
+    def is_valid(self) -> bool:
+        return not self.missing_columns and not self._errors
+    
+    @property
+    def rejected_rows(self) -> np.ndarray:
+        """Reddedilen tüm satır indeksleri (sıralı, tekrarsız)"""
+        if not self._errors:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate([block for blocks in self._errors.values()
+                                         for block in blocks]))
+    
+    def rows_for(self, reason: str) -> np.ndarray:
+        """Belirli bir nedenle reddedilen satır indeksleri"""
+        blocks = self._errors.get(reason)
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+    
+    def summary(self) -> Dict[str, int]:
+        """Neden başına reddedilen satır sayısı"""
+        return {reason: int(sum(len(block) for block in blocks))
+                for reason, blocks in self._errors.items()}
+    
+    def reasons_by_row(self) -> Dict[int, List[str]]:
+        """Satır indeksi -> neden listesi (küçük raporlar için)"""
+        result: Dict[int, List[str]] = {}
+        for reason in self._errors:
+            for row in self.rows_for(reason).tolist():
+                result.setdefault(row, []).append(reason)
+        return dict(sorted(result.items()))
+    
+    def log(self, sample_size: int = 10):
+        """Raporu neden başına tek satır olarak loglar"""
+        for column in self.missing_columns:
+            logging.error(f"Eksik sütun: {column}")
+        for reason, count in self.summary().items():
+            sample = ', '.join(str(row + 1) for row in self.rows_for(reason)[:sample_size])
+            more = " ..." if count > sample_size else ""
+            logging.error(f"{count} satır geçersiz ({reason}): satır {sample}{more}")
+
+
 class DataValidator:
+    REQUIRED_COLUMNS = ['isim', 'yaş', 'maaş', 'departman']
+    MIN_AGE = 15
+    MAX_AGE = 100
+
+    def __init__(self, min_age: int = MIN_AGE, max_age: int = MAX_AGE,
+                 allowed_departments: Optional[Iterable[str]] = None):
+        self.min_age = min_age
+        self.max_age = max_age
+        self.allowed_departments = (None if allowed_departments is None
+                                    else list(allowed_departments))
+    
+    def rules(self) -> Dict:
+        """Doğrulama kurallarını (önbellek anahtarı için) döndürür"""
+        return {'min_age': self.min_age, 'max_age': self.max_age,
+                'allowed_departments': self.allowed_departments}
+    
+    def validate_frame(self, frame: DataFrame, start_row: int = 0):
+        """Metin sütunlu bir parçayı sütun bazında (vektörel) doğrular
+        
+        (rapor, geçerli satırların tipli sütunları) döndürür; satır indeksleri
+        start_row ile kaydırılır. Eksik sütun varsa sütunlar None olur.
+        """
+        with METRICS.stage('doğrulama', len(frame)):
+            report = ValidationReport()
+            report.total_rows = len(frame)
+            report.missing_columns = [column for column in self.REQUIRED_COLUMNS
+                                      if column not in frame.columns]
+            if report.missing_columns:
+                return report, None
+            
+            row_ids = np.arange(start_row, start_row + len(frame))
+            names = frame['isim'].fillna('').astype(str)
+            departments = frame['departman'].fillna('').astype(str)
+            ages = pd.to_numeric(frame['yaş'], errors='coerce').to_numpy(dtype=np.float64)
+            salaries = pd.to_numeric(frame['maaş'], errors='coerce').to_numpy(dtype=np.float64)
+            
+            with np.errstate(invalid='ignore'):
+                rules = [
+                    ('boş isim', (names == '').to_numpy()),
+                    ('boş departman', (departments == '').to_numpy()),
+                    ('yaş tam sayı değil', ~np.isfinite(ages) | (np.mod(ages, 1) != 0)),
+                    ('yaş aralık dışı', (ages < self.min_age) | (ages > self.max_age)),
+                    ('maaş sayı değil', ~np.isfinite(salaries)),
+                    ('negatif maaş', salaries < 0),
+                ]
+                if self.allowed_departments is not None:
+                    rules.append(('geçersiz departman',
+                                  ~departments.isin(self.allowed_departments).to_numpy()))
+            
+            valid = np.ones(len(frame), dtype=bool)
+            for reason, mask in rules:
+                report.add(row_ids[mask], reason)
+                valid &= ~mask
+            
+            columns = {
+                'isim': names.to_numpy(dtype=object)[valid],
+                'yaş': ages[valid].astype(np.int32),
+                'maaş': salaries[valid],
+                'departman': departments.to_numpy(dtype=object)[valid],
+            }
+            return report, columns
+    
     @staticmethod
-    def validate_csv_data(data: List[Dict]) -> bool:
-        """CSV verisini doğrular"""
-        required_columns = ['isim', 'yaş', 'maaş', 'departman']
+    def validate_csv_data(data: List[Dict], start_row: int = 0) -> bool:
+        """CSV verisini varsayılan kurallarla doğrular (start_row: satır numarası ofseti)
+        
+        Özel kurallar için bir örneğin validate_frame metodu kullanılır.
+        """
         if not data:
             return False
         
-        for column in required_columns:
-            if column not in data[0]:
-                logging.error(f"Eksik sütun: {column}")
-                return False
+        report, _ = DEFAULT_VALIDATOR.validate_frame(pd.DataFrame.from_records(data), start_row)
+        report.log()
+        return report.is_valid
+
+
+DEFAULT_VALIDATOR = DataValidator()
+
+# --- Sütunlu Veri Deposu ---
+class ColumnarDataset:
+    """Yükleme anında bir kez ayrıştırılan tipli, sütunlu veri deposu"""
+    columns = ('isim', 'yaş', 'maaş', 'departman')
+
+    def __init__(self, names: np.ndarray, ages: np.ndarray, salaries: np.ndarray,
+                 dept_codes: np.ndarray, departments: List[str]):
+        self.names = names              # interned str, dtype=object
+        self.ages = ages                # int32
+        self.salaries = salaries        # float64
+        self.dept_codes = dept_codes    # int32, departments listesine indeks
+        self.departments = departments  # kategori sözlüğü (ilk görülme sırası)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'ColumnarDataset':
+        """csv.DictReader satırlarını tipli sütunlara dönüştürür"""
+        builder = ColumnarBuilder()
+        builder.append_records(list(records))
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.salaries)
+
+    @property
+    def department_labels(self) -> np.ndarray:
+        """Departman kodlarını etiket dizisine açar"""
+        return np.array(self.departments, dtype=object)[self.dept_codes]
+
+    def column(self, name: str) -> np.ndarray:
+        """Sütunu tipli NumPy dizisi olarak döndürür"""
+        if name == 'isim':
+            return self.names
+        if name == 'yaş':
+            return self.ages
+        if name == 'maaş':
+            return self.salaries
+        if name == 'departman':
+            return self.department_labels
+        raise KeyError(name)
+
+    def record(self, index: int) -> Dict[str, str]:
+        """Tek satırı eski csv.DictReader biçiminde döndürür"""
+        return {
+            'isim': self.names[index],
+            'yaş': str(int(self.ages[index])),
+            'maaş': _format_number(self.salaries[index]),
+            'departman': self.departments[self.dept_codes[index]]
+        }
+
+    def take(self, indices: np.ndarray) -> 'ColumnarDataset':
+        """Verilen satır indekslerinden yeni bir veri kümesi oluşturur"""
+        return ColumnarDataset(self.names[indices], self.ages[indices],
+                               self.salaries[indices], self.dept_codes[indices],
+                               self.departments)
+
+
+class ColumnarBuilder:
+    """Parça parça gelen satırları büyüyen sütun tamponlarında biriktirir"""
+    GROWTH_FACTOR = 1.5
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self.departments: List[str] = []
+        self._dept_lookup: Dict[str, int] = {}
+        self._string_bytes = 0
+        self._names = np.empty(capacity, dtype=object)
+        self._ages = np.empty(capacity, dtype=np.int32)
+        self._salaries = np.empty(capacity, dtype=np.float64)
+        self._codes = np.empty(capacity, dtype=np.int32)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._salaries)
+
+    @property
+    def nbytes(self) -> int:
+        """Tamponların ve isim dizelerinin yaklaşık bellek kullanımı"""
+        per_row = (self._names.itemsize + self._ages.itemsize
+                   + self._salaries.itemsize + self._codes.itemsize)
+        return self.capacity * per_row + self._string_bytes
+
+    def reserve(self, capacity: int):
+        """Tamponları en az verilen satır sayısına büyütür"""
+        if capacity <= self.capacity:
+            return
+        for attr in ('_names', '_ages', '_salaries', '_codes'):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, attr, new)
+
+    def append_records(self, records: List[Dict]):
+        """csv.DictReader satırlarını dönüştürüp ekler"""
+        self.append_columns([row['isim'] for row in records],
+                            [int(row['yaş']) for row in records],
+                            [float(row['maaş']) for row in records],
+                            [row['departman'] for row in records])
+
+    def append_columns(self, names: Sequence, ages: Sequence, salaries: Sequence,
+                       departments: Sequence):
+        """Zaten dönüştürülmüş bir parça sütunu ekler"""
+        count = len(names)
+        end = self.size + count
+        if end > self.capacity:
+            self.reserve(max(end, int(self.capacity * self.GROWTH_FACTOR)))
         
-        for i, row in enumerate(data):
-            try:
-                float(row['maaş'])
-                int(row['yaş'])
-            except (ValueError, KeyError) as e:
-                logging.error(f"Satır {i+1} geçersiz veri: {e}")
-                return False
+        interned = [sys.intern(name) for name in names]
+        self._string_bytes += sum(map(sys.getsizeof, interned))
+        self._names[self.size:end] = interned
+        self._ages[self.size:end] = ages
+        self._salaries[self.size:end] = salaries
+        chunk_codes, uniques = pd.factorize(np.asarray(departments, dtype=object))
+        mapping = np.array([self._dept_code(dept) for dept in uniques], dtype=np.int32)
+        self._codes[self.size:end] = mapping[chunk_codes] if count else chunk_codes
+        self.size = end
+
+    def _dept_code(self, dept: str) -> int:
+        code = self._dept_lookup.get(dept)
+        if code is None:
+            code = self._dept_lookup[dept] = len(self.departments)
+            self.departments.append(dept)
+        return code
+
+    @classmethod
+    def from_dataset(cls, dataset: ColumnarDataset) -> 'ColumnarBuilder':
+        """Mevcut veri kümesini kopyalayıp üzerine ekleme yapılabilen tampon kurar"""
+        n = len(dataset)
+        builder = cls(capacity=max(int(n * cls.GROWTH_FACTOR), 1024))
+        builder._names[:n] = dataset.names
+        builder._ages[:n] = dataset.ages
+        builder._salaries[:n] = dataset.salaries
+        builder._codes[:n] = dataset.dept_codes
+        builder.size = n
+        builder.departments = list(dataset.departments)
+        builder._dept_lookup = {dept: code for code, dept in enumerate(builder.departments)}
+        # Bellek hesabı için isim boyutu örneklemle tahmin edilir (tümünü gezmek O(n))
+        sample = dataset.names[::max(n // 1000, 1)]
+        builder._string_bytes = int(np.mean([sys.getsizeof(name) for name in sample]) * n) if n else 0
+        return builder
+
+    def snapshot(self) -> ColumnarDataset:
+        """Kopyalamadan mevcut satırların görünümünü döndürür"""
+        n = self.size
+        return ColumnarDataset(self._names[:n], self._ages[:n], self._salaries[:n],
+                               self._codes[:n], self.departments)
+
+    def build(self) -> ColumnarDataset:
+        """Tamponlardan veri kümesini oluşturur"""
+        n = self.size
+        columns = [self._names[:n], self._ages[:n], self._salaries[:n], self._codes[:n]]
+        if self.capacity - n > n // 8:
+            # Boşluk büyükse kırp; küçükse kopya yerine görünümleri kullan
+            columns = [column.copy() for column in columns]
+        return ColumnarDataset(*columns, self.departments)
+
+
+def _format_number(value: float) -> str:
+    """Sayıyı CSV'deki gibi gereksiz ondalık olmadan yazar"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class RecordView(Sequence):
+    """Sütunlu depo üzerinde eski `.data` sözlük listesi görünümü"""
+    def __init__(self, dataset: ColumnarDataset, indices: Optional[np.ndarray] = None):
+        self.dataset = dataset
+        self.indices = indices
+    
+    def __len__(self) -> int:
+        return len(self.dataset) if self.indices is None else len(self.indices)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            positions = np.arange(len(self))[item]
+            if self.indices is not None:
+                positions = self.indices[positions]
+            return RecordView(self.dataset, positions)
         
-        return True
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(item)
+        index = item if self.indices is None else self.indices[item]
+        return self.dataset.record(index)
+    
+    def to_dataset(self) -> ColumnarDataset:
+        """Görünümün kapsadığı satırları sütunlu veri olarak döndürür"""
+        if self.indices is None:
+            return self.dataset
+        return self.dataset.take(self.indices)
+    
+    def __repr__(self) -> str:
+        return f"RecordView({len(self)} kayıt)"
 
-# --- Veri Yöneticisi Sınıfı ---
-class DataManager:
-    def __init__(self):
-        self.data = None
-        self.validator = DataValidator()
+
+def as_dataset(data) -> ColumnarDataset:
+    """Sütunlu depo, görünüm ya da sözlük listesini sütunlu veriye çevirir"""
+    if isinstance(data, (ColumnarDataset, ChunkedDataset)):
+        return data
+    if isinstance(data, RecordView):
+        return data.to_dataset()
+    return ColumnarDataset.from_records(data)
+
+# --- İkili Veri Önbelleği ---
+class DatasetCache:
+    """Ayrıştırılmış sütunları kaynak CSV'nin yanında .npy olarak saklar
+    
+    Anahtar: dosya yolu, boyutu, mtime ve örneklenmiş içerik özeti (+ doğrulama
+    kuralları). Sayısal sütunlar bellek eşlemeli (mmap) açılır.
+    """
+    FORMAT_VERSION = 1
+    SAMPLE_BLOCK = 1 << 16      # özet için okunan blok boyutu
+    SAMPLE_COUNT = 16           # baş ve son dahil örneklenen blok sayısı
+    NAME_SEPARATOR = '\x00'
+
+    def __init__(self, source: str, cache_dir: Optional[str] = None):
+        self.source = os.path.abspath(source)
+        directory, name = os.path.split(self.source)
+        self.cache_dir = cache_dir or os.path.join(directory, f".{name}.cache")
+        self.meta_path = os.path.join(self.cache_dir, 'meta.json')
+    
+    def key(self, rules: Dict, stat: Optional[os.stat_result] = None) -> Dict:
+        """Kaynak dosyanın parmak izini oluşturur (stat verilirse o anki boyutla)"""
+        stat = stat or os.stat(self.source)
+        return {
+            'format': self.FORMAT_VERSION,
+            'path': self.source,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'hash': self._content_hash(stat.st_size),
+            'rules': rules
+        }
+    
+    def _content_hash(self, size: int) -> str:
+        """Dosyanın baş, son ve eşit aralıklı bloklarından içerik özeti"""
+        digest = hashlib.blake2b(digest_size=16)
+        step = max(size // (self.SAMPLE_COUNT - 1), 1)
+        with open(self.source, 'rb') as file:
+            for offset in sorted({min(i * step, max(size - self.SAMPLE_BLOCK, 0))
+                                  for i in range(self.SAMPLE_COUNT)}):
+                file.seek(offset)
+                digest.update(file.read(self.SAMPLE_BLOCK))
+        return digest.hexdigest()
     
-    def load_data(self, filename: str) -> bool:
-        """Veriyi yükler ve doğrular"""
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+    
+    def load(self, key: Dict) -> Optional[ColumnarDataset]:
+        """Anahtar eşleşirse önbellekten veri kümesini döndürür"""
         try:
-            if not os.path.exists(filename):
-                logging.error(f"Dosya bulunamadı: {filename}")
-                return False
+            with open(self.meta_path, 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            if meta.get('key') != key:
+                return None
             
-            with open(filename, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                data = list(reader)
+            ages = np.load(self._path('yaş.npy'), mmap_mode='r')
+            salaries = np.load(self._path('maaş.npy'), mmap_mode='r')
+            codes = np.load(self._path('departman.npy'), mmap_mode='r')
+            with open(self._path('isim.bin'), 'rb') as file:
+                text = file.read().decode('utf-8')
+            names = np.array(list(map(sys.intern, text.split(self.NAME_SEPARATOR)))
+                             if text or meta['rows'] else [], dtype=object)
             
-            if self.validator.validate_csv_data(data):
-                self.data = data
-                logging.info(f"Veri başarıyla yüklendi: {len(data)} kayıt")
-                return True
+            if not len(names) == len(ages) == len(salaries) == len(codes) == meta['rows']:
+                logging.warning(f"Bozuk önbellek yok sayıldı: {self.cache_dir}")
+                return None
+            return ColumnarDataset(names, ages, salaries, codes, meta['departments'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Önbellek okunamadı: {e}")
+            return None
+    
+    def save(self, dataset: ColumnarDataset, key: Dict) -> bool:
+        """Veri kümesini önbelleğe yazar (meta.json en son yazılır)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.invalidate()
+            
+            np.save(self._path('yaş.npy'), np.ascontiguousarray(dataset.ages))
+            np.save(self._path('maaş.npy'), np.ascontiguousarray(dataset.salaries))
+            np.save(self._path('departman.npy'), np.ascontiguousarray(dataset.dept_codes))
+            with open(self._path('isim.bin'), 'wb') as file:
+                file.write(self.NAME_SEPARATOR.join(dataset.names.tolist()).encode('utf-8'))
+            
+            meta = {'key': key, 'rows': len(dataset), 'departments': dataset.departments}
+            temp_path = self.meta_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(meta, file, ensure_ascii=False)
+            os.replace(temp_path, self.meta_path)
+            return True
+        except OSError as e:
+            logging.warning(f"Önbellek yazılamadı: {e}")
+            return False
+    
+    def invalidate(self):
+        """Önbelleği geçersiz kılar"""
+        if os.path.exists(self.meta_path):
+            os.remove(self.meta_path)
+
+# --- Bellek Dışı Parçalı Depo ---
+class DiskChunk(ColumnarDataset):
+    """Diskteki tek parça: sayısal sütunlar bellek eşlemeli, isimler gerektiğinde çözülür"""
+    def __init__(self, prefix: str, departments: List[str]):
+        self.prefix = prefix
+        self._offsets: Optional[np.ndarray] = None
+        super().__init__(None, np.load(prefix + 'yaş.npy', mmap_mode='r'),
+                         np.load(prefix + 'maaş.npy', mmap_mode='r'),
+                         np.load(prefix + 'departman.npy', mmap_mode='r'), departments)
+    
+    @property
+    def names(self) -> np.ndarray:
+        if self._names is None:
+            with open(self.prefix + 'isim.bin', 'rb') as file:
+                text = file.read().decode('utf-8')
+            self._names = np.array(text.split(ChunkWriter.NAME_SEPARATOR), dtype=object)
+        return self._names
+    
+    @names.setter
+    def names(self, names: Optional[np.ndarray]):
+        self._names = names
+    
+    def name(self, index: int) -> str:
+        """Tek ismi parçanın tümünü çözmeden okur"""
+        if self._names is not None:
+            return self._names[index]
+        if self._offsets is None:
+            self._offsets = np.load(self.prefix + 'isim_ofset.npy', mmap_mode='r')
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1]) - 1
+        with open(self.prefix + 'isim.bin', 'rb') as file:
+            file.seek(start)
+            return file.read(end - start).decode('utf-8')
+    
+    def record(self, index: int) -> Dict[str, str]:
+        return {
+            'isim': self.name(index),
+            'yaş': str(int(self.ages[index])),
+            'maaş': _format_number(self.salaries[index]),
+            'departman': self.departments[self.dept_codes[index]]
+        }
+    
+    def values(self, column: str, rows: np.ndarray) -> np.ndarray:
+        """Sütunun verilen yerel satırlarını okur"""
+        if column == 'isim':
+            if self._names is None and len(rows) < len(self) // 16:
+                return np.array([self.name(row) for row in rows.tolist()], dtype=object)
+            return self.names[rows]
+        if column == 'departman_kodu':
+            return np.asarray(self.dept_codes[rows])
+        return np.asarray(self.column(column)[rows])
+
+
+class ChunkWriter(ColumnarBuilder):
+    """ColumnarBuilder gibi satır biriktirir; her chunk_rows satırda bir parçayı diske yazar
+    
+    Departman sözlüğü parçalar arasında ortaktır, kodlar tüm veri kümesinde
+    geçerlidir. Her parça için sayısal sütunların min/max değerleri ve içerdiği
+    departman kodları (bölge haritası) tutulur.
+    """
+    DEFAULT_CHUNK_ROWS = 1 << 18   # yazım tamponu ve parça başına çalışma belleği bununla sınırlı
+    NAME_SEPARATOR = '\x00'
+    
+    def __init__(self, directory: str, chunk_rows: int = DEFAULT_CHUNK_ROWS):
+        super().__init__(capacity=min(chunk_rows, 1 << 16))
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.chunks: List[Dict] = []
+        self.written = 0
+    
+    def __len__(self) -> int:
+        return self.written + self.size
+    
+    def reserve(self, capacity: int):
+        super().reserve(min(capacity, self.chunk_rows))
+    
+    def append_columns(self, names: Sequence, ages: Sequence, salaries: Sequence,
+                       departments: Sequence):
+        start, count = 0, len(names)
+        while start < count:
+            end = start + min(self.chunk_rows - self.size, count - start)
+            super().append_columns(names[start:end], ages[start:end],
+                                   salaries[start:end], departments[start:end])
+            start = end
+            if self.size >= self.chunk_rows:
+                self.flush()
+    
+    def flush(self):
+        """Tampondaki satırları yeni bir parça olarak yazar"""
+        n = self.size
+        if not n:
+            return
+        prefix = os.path.join(self.directory, f"{len(self.chunks):05d}_")
+        ages, salaries, codes = self._ages[:n], self._salaries[:n], self._codes[:n]
+        np.save(prefix + 'yaş.npy', ages)
+        np.save(prefix + 'maaş.npy', salaries)
+        np.save(prefix + 'departman.npy', codes)
+        
+        encoded = [name.encode('utf-8') for name in self._names[:n]]
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=n) + 1, out=offsets[1:])
+        with open(prefix + 'isim.bin', 'wb') as file:
+            file.write(self.NAME_SEPARATOR.encode().join(encoded))
+        np.save(prefix + 'isim_ofset.npy', offsets)
+        
+        self.chunks.append({
+            'rows': n,
+            'yaş': [int(ages.min()), int(ages.max())],
+            'maaş': [float(salaries.min()), float(salaries.max())],
+            'departman': np.unique(codes).tolist(),
+        })
+        self.written += n
+        self.size = 0
+        self._string_bytes = 0
+    
+    def build(self) -> 'ChunkedDataset':
+        self.flush()
+        return ChunkedDataset(self.directory, self.chunks, self.departments)
+    
+    def discard(self):
+        """Yarım kalan yazımın parçalarını siler"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class ChunkedColumn:
+    """Parçalı sütunun satır erişimi: dataset.salaries[i] ya da dataset.salaries[indeksler]"""
+    DTYPES = {'isim': object, 'yaş': np.int32, 'maaş': np.float64,
+              'departman_kodu': np.int32, 'departman': object}
+    
+    def __init__(self, dataset: 'ChunkedDataset', name: str):
+        self.dataset = dataset
+        self.name = name
+    
+    def __len__(self) -> int:
+        return len(self.dataset)
+    
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            item = np.arange(*item.indices(len(self)))
+        if np.ndim(item) == 0:
+            index = int(item) + (len(self) if item < 0 else 0)
+            chunk, local = self.dataset.locate(index)
+            return chunk.values(self.name, np.array([local]))[0]
+        
+        indices = np.asarray(item, dtype=np.int64)
+        result = np.empty(len(indices), dtype=self.DTYPES[self.name])
+        if not len(indices):
+            return result
+        # İndeksleri parçalara göre grupla; her parça bir kez açılır, sonuç sırası korunur
+        chunk_ids = np.searchsorted(self.dataset.offsets, indices, side='right') - 1
+        order = np.argsort(chunk_ids, kind='stable')
+        sorted_ids = chunk_ids[order]
+        starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+        for start, end in zip(starts.tolist(), np.r_[starts[1:], len(order)].tolist()):
+            positions = order[start:end]
+            chunk_id = int(sorted_ids[start])
+            local = indices[positions] - self.dataset.offsets[chunk_id]
+            result[positions] = self.dataset.cached_chunk(chunk_id).values(self.name, local)
+        return result
+    
+    def __repr__(self) -> str:
+        return f"ChunkedColumn({self.name!r}, {len(self):,} satır)"
+
+
+_chunk_dir_users: Dict[str, int] = {}   # parça klasörü -> açık ChunkedDataset sayısı
+_stale_chunk_dirs: set = set()           # yerine yenisi yazılmış, son kullanıcısını bekleyen klasörler
+_chunk_dir_lock = threading.Lock()
+
+
+def _open_chunk_dir(directory: str):
+    with _chunk_dir_lock:
+        _chunk_dir_users[directory] = _chunk_dir_users.get(directory, 0) + 1
+
+
+def _close_chunk_dir(directory: str):
+    """Klasörün son kullanıcısı gidince, eskimişse klasörü siler"""
+    with _chunk_dir_lock:
+        users = _chunk_dir_users.pop(directory, 1) - 1
+        if users:
+            _chunk_dir_users[directory] = users
+            return
+        stale = directory in _stale_chunk_dirs
+        _stale_chunk_dirs.discard(directory)
+    if stale:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _retire_chunk_dir(directory: str):
+    """Eski yazımı siler; açık bir veri kümesi hâlâ kullanıyorsa silmeyi ona bırakır"""
+    with _chunk_dir_lock:
+        if _chunk_dir_users.get(directory):
+            _stale_chunk_dirs.add(directory)
+            return
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+class ChunkedDataset:
+    """Diskte bellek eşlemeli parçalar halinde duran, bellekten büyük veri kümesi
+    
+    ColumnarDataset ile aynı sütun adlarını ve satır erişimini sunar; sütunlar
+    ChunkedColumn'dur. İstatistik, gruplama, filtre ve grafik kutulama parça
+    parça yapılır, çalışma belleği parça boyutuyla sınırlı kalır.
+    """
+    columns = ColumnarDataset.columns
+    OPEN_CHUNKS = 8   # rastgele erişim için açık tutulan parça sayısı
+    
+    def __init__(self, directory: str, chunks: List[Dict], departments: List[str]):
+        self.directory = directory
+        self.chunk_info = chunks
+        self.departments = departments
+        self.offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([chunk['rows'] for chunk in chunks], out=self.offsets[1:])
+        self.names = ChunkedColumn(self, 'isim')
+        self.ages = ChunkedColumn(self, 'yaş')
+        self.salaries = ChunkedColumn(self, 'maaş')
+        self.dept_codes = ChunkedColumn(self, 'departman_kodu')
+        self._open: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        # Parça dosyaları tembel açılır; klasör bu nesne yaşadıkça silinmemeli
+        _open_chunk_dir(directory)
+        weakref.finalize(self, _close_chunk_dir, directory)
+    
+    def __len__(self) -> int:
+        return int(self.offsets[-1])
+    
+    def __repr__(self) -> str:
+        return f"ChunkedDataset({len(self):,} satır, {len(self.chunk_info)} parça)"
+    
+    def chunk(self, index: int) -> DiskChunk:
+        """index'inci parçayı açar (sayısal sütunlar diskten sayfa sayfa okunur)"""
+        return DiskChunk(os.path.join(self.directory, f"{index:05d}_"), self.departments)
+    
+    def cached_chunk(self, index: int) -> DiskChunk:
+        """Rastgele satır erişimi için son kullanılan parçaları açık tutar"""
+        with self._lock:
+            chunk = self._open.get(index)
+            if chunk is not None:
+                self._open.move_to_end(index)
+                return chunk
+        chunk = self.chunk(index)
+        with self._lock:
+            self._open[index] = chunk
+            while len(self._open) > self.OPEN_CHUNKS:
+                self._open.popitem(last=False)
+        return chunk
+    
+    def chunks(self, start: int = 0) -> Iterator[tuple]:
+        """start satırını içeren parçadan itibaren (ilk_satır, parça) çiftleri"""
+        for index in range(len(self.chunk_info)):
+            if self.offsets[index + 1] > start:
+                yield int(self.offsets[index]), self.chunk(index)
+    
+    def locate(self, index: int) -> tuple:
+        """Genel satır indeksinin (parça, yerel indeks) karşılığı"""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk_id = int(np.searchsorted(self.offsets, index, side='right')) - 1
+        return self.cached_chunk(chunk_id), index - int(self.offsets[chunk_id])
+    
+    def column(self, name: str) -> ChunkedColumn:
+        if name not in self.columns:
+            raise KeyError(name)
+        return ChunkedColumn(self, name)
+    
+    def column_range(self, name: str) -> tuple:
+        """Sayısal sütunun (min, max) değeri; veriyi okumadan bölge haritasından"""
+        ranges = [chunk[name] for chunk in self.chunk_info]
+        return min(low for low, _ in ranges), max(high for _, high in ranges)
+    
+    def record(self, index: int) -> Dict[str, str]:
+        chunk, local = self.locate(index)
+        return chunk.record(local)
+    
+    def take(self, indices: np.ndarray) -> ColumnarDataset:
+        """Seçilen satırları bellekte bir ColumnarDataset olarak toplar"""
+        return ColumnarDataset(self.names[indices], self.ages[indices], self.salaries[indices],
+                               self.dept_codes[indices], self.departments)
+    
+    def evaluate(self, predicate: Predicate) -> np.ndarray:
+        """Koşulu sağlayan satırlar; bölge haritası dışladığı parçaları hiç okumaz"""
+        engine = FilterEngine()
+        rows = []
+        for index, info in enumerate(self.chunk_info):
+            zone = self._zone_match(predicate, info)
+            if zone is False:
+                continue
+            start = int(self.offsets[index])
+            if zone is True:
+                rows.append(np.arange(start, start + info['rows']))
+                continue
+            chunk = self.chunk(index)
+            engine.sync(chunk, index)
+            rows.append(np.flatnonzero(engine.matches(predicate, None)) + start)
+        return np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    
+    def _zone_match(self, predicate: Predicate, info: Dict) -> Optional[bool]:
+        """Parçanın tümü eşleşir (True), hiçbiri eşleşmez (False) ya da bilinmez (None)"""
+        if isinstance(predicate, (And, Or)):
+            results = [self._zone_match(child, info) for child in predicate.children]
+            decisive, other = (False, True) if isinstance(predicate, And) else (True, False)
+            if decisive in results:
+                return decisive
+            return other if all(result is other for result in results) else None
+        if isinstance(predicate, Not):
+            result = self._zone_match(predicate.child, info)
+            return None if result is None else not result
+        
+        op, value = predicate.op, predicate.value
+        if predicate.column == 'departman':
+            if op not in ('==', '!=', 'in'):
+                return None
+            present = {self.departments[code] for code in info['departman']}
+            wanted = set(value) if op == 'in' else {value}
+            if present.isdisjoint(wanted):
+                matched = False
+            elif present <= wanted:
+                matched = True
             else:
-                logging.error("Veri doğrulama başarısız")
+                return None
+            return not matched if op == '!=' else matched
+        if predicate.column not in info:
+            return None
+        
+        low, high = info[predicate.column]
+        if op == 'between':
+            if high < value[0] or low > value[1]:
                 return False
-                
-        except Exception as e:
-            logging.error(f"Veri yükleme hatası: {e}")
+            return True if value[0] <= low and high <= value[1] else None
+        if op == 'in':
+            return False if all(item < low or item > high for item in value) else None
+        if op == '==':
+            return False if value < low or value > high else (True if low == high else None)
+        if op == '!=':
+            return True if value < low or value > high else (False if low == high else None)
+        everything, nothing = {
+            '>': (low > value, high <= value), '>=': (low >= value, high < value),
+            '<': (high < value, low >= value), '<=': (high <= value, low > value),
+        }[op]
+        return True if everything else (False if nothing else None)
+
+
+class ChunkedStore(DatasetCache):
+    """Bellek dışı mod için parçalı sütun deposu; anahtar DatasetCache ile aynıdır
+    
+    Her yazım yeni bir alt klasöre yapılır ve meta.json ona işaret eder; açık
+    bir veri kümesinin bellek eşlemeli dosyaları yerinde değiştirilmez. Eski
+    yazımlar, onları kullanan son veri kümesi kapanınca silinir.
+    """
+    FORMAT_VERSION = 1
+    
+    def __init__(self, source: str, cache_dir: Optional[str] = None):
+        directory, name = os.path.split(os.path.abspath(source))
+        super().__init__(source, cache_dir or os.path.join(directory, f".{name}.chunks"))
+    
+    def writer(self, chunk_rows: int = ChunkWriter.DEFAULT_CHUNK_ROWS) -> ChunkWriter:
+        return ChunkWriter(self._path(f"v{time.time_ns()}"), chunk_rows)
+    
+    def load(self, key: Dict) -> Optional[ChunkedDataset]:
+        """Anahtar eşleşirse parçalı veri kümesini açar"""
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as file:
+                meta = json.load(file)
+            if meta.get('key') != key:
+                return None
+            dataset = ChunkedDataset(self._path(meta['directory']), meta['chunks'], meta['departments'])
+            if len(dataset) != meta['rows'] or any(
+                    len(dataset.chunk(index).salaries) != info['rows']
+                    for index, info in enumerate(dataset.chunk_info)):
+                logging.warning(f"Bozuk parçalı depo yok sayıldı: {self.cache_dir}")
+                return None
+            return dataset
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Parçalı depo okunamadı: {e}")
+            return None
+    
+    def save(self, dataset: ChunkedDataset, key: Dict) -> bool:
+        """Yazılan parçaları meta.json ile kalıcı yapar, kullanılmayan eski yazımları siler"""
+        try:
+            current = os.path.basename(dataset.directory)
+            meta = {'key': key, 'rows': len(dataset), 'directory': current,
+                    'chunks': dataset.chunk_info, 'departments': dataset.departments}
+            temp_path = self.meta_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(meta, file, ensure_ascii=False)
+            os.replace(temp_path, self.meta_path)
+            
+            for entry in os.listdir(self.cache_dir):
+                if entry != current and os.path.isdir(self._path(entry)):
+                    _retire_chunk_dir(self._path(entry))
+            return True
+        except OSError as e:
+            logging.warning(f"Parçalı depo yazılamadı: {e}")
             return False
+
+# --- Veri Yöneticisi Sınıfı ---
+class _BoundedReader(io.RawIOBase):
+    """Dosyayı en fazla limit bayta kadar okuyan ham akış
+    
+    Yükleme sırasında büyüyen dosyada okuyucu başlangıçtaki boyutta durur;
+    böylece izleme ofseti okunan baytlarla birebir örtüşür.
+    """
+    def __init__(self, raw, limit: int):
+        self._raw = raw
+        self.remaining = limit
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer)[:self.remaining]
+        count = self._raw.readinto(view) or 0
+        self.remaining -= count
+        return count
+    
+    def tell(self) -> int:
+        return self._raw.tell()
+
+
+class WatchedFile:
+    """Yüklenen dosyanın izleme durumu: okunan bayt ofseti ve yeniden yazım parmak izi
+    
+    Ofset, yükleyicinin gerçekten okuduğu bayt sayısıdır (stat yüklemeden önce
+    alınır). Ofsete kadar olan içeriğin başı ve sonu özetlenir; dosya büyüse
+    de bu baytlar değişmediyse yalnızca sona ekleme yapılmış kabul edilir.
+    """
+    FINGERPRINT_BYTES = 4096
+    
+    def __init__(self, filename: str, lenient: bool, stat: os.stat_result):
+        self.filename = filename
+        self.lenient = lenient
+        with open(filename, 'rb') as f:
+            header_line = f.readline()
+            f.seek(max(stat.st_size - 1, 0))
+            # Son satır satır sonuyla bitmiyorsa yazım sürüyor olabilir
+            self.terminated = f.read(1) in (b'\n', b'')
+        self.header = header_line.decode('utf-8-sig').strip().split(',')
+        self.inode = stat.st_ino
+        self.offset = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.rows = 0  # başlık hariç okunan satır sayısı (reddedilenler dahil)
+        self.digest = self.fingerprint()
+    
+    def fingerprint(self) -> str:
+        """Ofsetten önceki ilk ve son FINGERPRINT_BYTES baytın özeti"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self.filename, 'rb') as f:
+            digest.update(f.read(min(self.offset, self.FINGERPRINT_BYTES)))
+            f.seek(max(self.offset - self.FINGERPRINT_BYTES, 0))
+            digest.update(f.read(min(self.offset, self.FINGERPRINT_BYTES)))
+        return digest.hexdigest()
+
+
+class DataManager:
+    DEFAULT_CHUNK_SIZE = 50_000
+    IN_MEMORY_EXPANSION = 3   # CSV baytı başına tipli sütunların yaklaşık bellek kullanımı
+
+    def __init__(self):
+        self.version = 0      # veri her değiştiğinde artar
+        self.generation = 0   # veri kümesi tümden değiştiğinde artar (eklemede artmaz)
+        self._dataset: Optional[ColumnarDataset] = None
+        self._builder: Optional[ColumnarBuilder] = None
+        self._lock = threading.RLock()  # veri kümesi ve sürüm sayaçları birlikte değişir
+        self.validator = DataValidator()
+        self.last_report: Optional[ValidationReport] = None
+        self.quarantine: Optional[DataFrame] = None  # lenient modda reddedilen satırlar
+        self.source: Optional[WatchedFile] = None       # refresh() ile izlenen dosya
+    
+    @property
+    def dataset(self) -> Optional[ColumnarDataset]:
+        return self._dataset
+    
+    @dataset.setter
+    def dataset(self, dataset: Optional[ColumnarDataset]):
+        with self._lock:
+            self._dataset = dataset
+            self._builder = None
+            self.source = None
+            self.generation += 1
+            self.version += 1
+    
+    def snapshot(self) -> tuple:
+        """(veri kümesi, nesil, sürüm) üçlüsünü tutarlı olarak döndürür"""
+        with self._lock:
+            return self._dataset, self.generation, self.version
+    
+    def append_columns(self, names: Sequence, ages: Sequence, salaries: Sequence,
+                       departments: Sequence):
+        """Doğrulanmış satırları mevcut veri kümesinin sonuna ekler"""
+        if isinstance(self._dataset, ChunkedDataset):
+            raise TypeError("Bellek dışı veri kümesine satır eklenemez; dosyayı yeniden yükleyin")
+        with self._lock:
+            if self._builder is None:
+                if self._dataset is None:
+                    self.generation += 1
+                    self._builder = ColumnarBuilder()
+                else:
+                    self._builder = ColumnarBuilder.from_dataset(self._dataset)
+            
+            self._builder.append_columns(names, ages, salaries, departments)
+            self._dataset = self._builder.snapshot()
+            self.version += 1
+    
+    def append_records(self, records: List[Dict], lenient: bool = False) -> ValidationReport:
+        """Satır sözlüklerini doğrulayıp ekler; katı modda hatalı parti hiç eklenmez"""
+        start_row = len(self._dataset) if self._dataset is not None else 0
+        report, columns = self.validator.validate_frame(pd.DataFrame.from_records(records), start_row)
+        if columns is not None and (report.is_valid or lenient) and len(columns['isim']):
+            self.append_columns(columns['isim'], columns['yaş'], columns['maaş'], columns['departman'])
+        return report
+    
+    @property
+    def data(self) -> Optional[RecordView]:
+        """Eski çağıranlar için sözlük listesi görünümü"""
+        if self.dataset is None:
+            return None
+        return RecordView(self.dataset)
+    
+    @data.setter
+    def data(self, records: Optional[Iterable[Dict]]):
+        self.dataset = None if records is None else as_dataset(records)
+    
+    def load_data(self, filename: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  memory_limit: Optional[int] = None,
+                  progress_callback: Optional[Callable[[int, int, int], None]] = None,
+                  lenient: bool = False, use_cache: bool = True, out_of_core: bool = False) -> bool:
+        """Veriyi parça parça okur, doğrular ve sütunlu depoya ekler
+        
+        memory_limit: tipli sütunlar için bayt cinsinden üst sınır
+        progress_callback(yüklenen_satır, okunan_bayt, toplam_bayt)
+        lenient: geçersiz satırları atlayıp karantinaya al (yoksa ilk hatalı parçada dur)
+        use_cache: geçerli ikili önbellek varsa metni ayrıştırmadan onu kullan
+        out_of_core: sütunları diske parça parça yazıp bellek eşlemeli aç (ChunkedDataset);
+                     bellekten büyük dosyalar için, dosya izleme bu modda kapalıdır
+        """
+        builder = None
+        try:
+            if not os.path.exists(filename):
+                logging.error(f"Dosya bulunamadı: {filename}")
+                return False
+            
+            # Önbellek anahtarı, okuma sınırı ve izleme ofseti aynı stat'tan gelir
+            stat = os.stat(filename)
+            total_bytes = stat.st_size
+            store = ChunkedStore(filename) if out_of_core else None
+            cache = (store or DatasetCache(filename)) if use_cache else None
+            if cache:
+                cache_key = cache.key(self.validator.rules(), stat)
+                with METRICS.stage('okuma') as stage:
+                    dataset = cache.load(cache_key)
+                    stage.add_rows(len(dataset) if dataset is not None else 0)
+                METRICS.cache('veri_önbelleği', dataset is not None)
+                if dataset is not None:
+                    self.dataset = dataset
+                    self.source = None if out_of_core else self._watch(filename, lenient, len(dataset), stat)
+                    self.last_report = ValidationReport()
+                    self.last_report.total_rows = len(dataset)
+                    self.quarantine = None
+                    if progress_callback:
+                        progress_callback(len(dataset), total_bytes, total_bytes)
+                    logging.info(f"Veri önbellekten yüklendi: {len(dataset)} kayıt")
+                    return True
+            
+            builder = store.writer() if out_of_core else ColumnarBuilder(capacity=chunk_size)
+            report = ValidationReport()
+            quarantine = []
+            
+            with open(filename, 'rb', buffering=0) as raw:
+                file = io.BufferedReader(_BoundedReader(raw, total_bytes))
+                chunks = iter(pd.read_csv(file, chunksize=chunk_size, dtype=str,
+                                          keep_default_na=False, encoding='utf-8'))
+                while True:
+                    # pandas okuma ve ayrıştırmayı birlikte yapar; tek aşama olarak ölçülür
+                    with METRICS.stage('ayrıştırma') as stage:
+                        frame = next(chunks, None)
+                        stage.add_rows(len(frame) if frame is not None else 0)
+                    if frame is None:
+                        break
+                    
+                    chunk_report, columns = self.validator.validate_frame(frame, report.total_rows)
+                    report.merge(chunk_report)
+                    
+                    if columns is None or not (chunk_report.is_valid or lenient):
+                        # İlk geçersiz parçada dur, kalan dosyayı okuma
+                        self.last_report = report
+                        report.log()
+                        logging.error("Veri doğrulama başarısız")
+                        return False
+                    
+                    if not chunk_report.is_valid:
+                        rejected = chunk_report.rejected_rows
+                        bad = frame.iloc[rejected - (report.total_rows - len(frame))].copy()
+                        bad.insert(0, 'satır', rejected + 1)
+                        bad['neden'] = [', '.join(reasons) for reasons
+                                        in chunk_report.reasons_by_row().values()]
+                        quarantine.append(bad)
+                    
+                    bytes_read = file.tell()
+                    if len(builder) == 0 and 0 < bytes_read < total_bytes:
+                        # İlk parçadan satır başına bayt tahmini ile tamponu önceden ayır
+                        builder.reserve(int(total_bytes * len(frame) / bytes_read * 1.05))
+                    with METRICS.stage('dönüştürme', len(columns['isim'])):
+                        builder.append_columns(columns['isim'], columns['yaş'],
+                                               columns['maaş'], columns['departman'])
+                    
+                    if memory_limit is not None and builder.nbytes > memory_limit:
+                        logging.error(f"Bellek sınırı aşıldı: {builder.nbytes:,} > {memory_limit:,} bayt")
+                        return False
+                    
+                    if progress_callback:
+                        progress_callback(len(builder), bytes_read, total_bytes)
+            
+            self.last_report = report
+            self.quarantine = pd.concat(quarantine, ignore_index=True) if quarantine else None
+            if not report.is_valid:
+                report.log()
+                logging.warning(f"{len(report.rejected_rows)} geçersiz satır karantinaya alındı")
+            
+            if len(builder) == 0:
+                logging.error("Veri doğrulama başarısız")
+                return False
+            
+            with METRICS.stage('dönüştürme'):
+                self.dataset = builder.build()
+            builder = None
+            if not out_of_core:
+                self.source = self._watch(filename, lenient, report.total_rows, stat)
+            if store:
+                # Parçalı depo verinin kendisidir; use_cache kapalıyken ve satır reddedildiğinde
+                # de kalıcı yapılır. Reddedilen satırlı yazım anahtarla eşleşmez, önbellek sayılmaz.
+                store_key = cache_key if cache else store.key(self.validator.rules(), stat)
+                if not report.is_valid:
+                    store_key = dict(store_key, reddedilen=len(report.rejected_rows))
+                store.save(self.dataset, store_key)
+            elif cache and report.is_valid:
+                cache.save(self.dataset, cache_key)
+            logging.info(f"Veri başarıyla yüklendi: {len(self.dataset)} kayıt")
+            return True
+                
+        except TaskCancelled:
+            logging.info(f"Veri yükleme iptal edildi: {filename}")
+            raise
+        except Exception as e:
+            logging.error(f"Veri yükleme hatası: {e}")
+            return False
+        finally:
+            if isinstance(builder, ChunkWriter):
+                builder.discard()  # başarısız ya da iptal edilen yüklemenin parçaları
+    
+    @classmethod
+    def needs_out_of_core(cls, filename: str) -> bool:
+        """Dosya belleğe alınınca fiziksel belleğin yarısını aşacaksa True"""
+        try:
+            memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+            return os.path.getsize(filename) * cls.IN_MEMORY_EXPANSION > memory / 2
+        except (AttributeError, ValueError, OSError):
+            return False
+    
+    @staticmethod
+    def _watch(filename: str, lenient: bool, rows: int,
+               stat: os.stat_result) -> Optional[WatchedFile]:
+        try:
+            source = WatchedFile(filename, lenient, stat)
+        except OSError:
+            return None
+        source.rows = rows
+        return source
+    
+    def refresh(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+        """İzlenen dosyaya eklenen satırları yükler
+        
+        Yalnızca son okunan bayttan sonraki tam satırlar ayrıştırılıp doğrulanır
+        ve veri kümesine eklenir; dosya kısaldıysa ya da yeniden yazıldıysa tam
+        yükleme yapılır. Katı modda eklenen satırlardan biri bile geçersizse
+        hiçbiri eklenmez, ofset ilerlemez ve 'hata' döner (load_data gibi).
+        'izlenmiyor', 'değişmedi', 'eklendi', 'yeniden_yüklendi' ya da 'hata' döndürür.
+        """
+        source = self.source
+        if source is None:
+            return 'izlenmiyor'
+        try:
+            stat = os.stat(source.filename)
+            if stat.st_size == source.offset and stat.st_mtime_ns == source.mtime_ns:
+                return 'değişmedi'
+            # Yarım kalan son satır yüklenmişse devamı eklenemez; tam yükleme gerekir
+            rewritten = (stat.st_ino != source.inode or stat.st_size < source.offset
+                         or not source.terminated or source.fingerprint() != source.digest)
+        except OSError as e:
+            logging.warning(f"İzlenen dosya okunamadı: {e}")
+            return 'hata'
+        
+        if rewritten:
+            logging.info(f"Dosya yeniden yazılmış, tam yükleme yapılıyor: {source.filename}")
+            loaded = self.load_data(source.filename, chunk_size, lenient=source.lenient)
+            return 'yeniden_yüklendi' if loaded else 'hata'
+        
+        with open(source.filename, 'rb') as f:
+            f.seek(source.offset)
+            appended = f.read(stat.st_size - source.offset)
+        # Yazılmakta olan son yarım satır bir sonraki kontrole kalır
+        complete = appended.rfind(b'\n') + 1
+        source.mtime_ns = stat.st_mtime_ns
+        if not complete:
+            return 'değişmedi'
+        
+        report = ValidationReport()
+        quarantine = []
+        batches = []
+        rows = source.rows
+        frames = pd.read_csv(io.BytesIO(appended[:complete]), header=None, names=source.header,
+                             chunksize=chunk_size, dtype=str, keep_default_na=False,
+                             encoding='utf-8')
+        for frame in frames:
+            chunk_report, columns = self.validator.validate_frame(frame, rows)
+            report.merge(chunk_report)
+            rows += len(frame)
+            if columns is None or not (chunk_report.is_valid or source.lenient):
+                # Katı mod: eklemenin tamamı reddedilir, satırlar bir sonraki kontrolde yeniden denenir
+                self.last_report = report
+                report.log()
+                logging.error("Eklenen satırlar doğrulanamadı; hiçbiri eklenmedi")
+                return 'hata'
+            if not chunk_report.is_valid:
+                rejected = chunk_report.rejected_rows
+                bad = frame.iloc[rejected - (rows - len(frame))].copy()
+                bad.insert(0, 'satır', rejected + 1)
+                bad['neden'] = [', '.join(reasons) for reasons
+                                in chunk_report.reasons_by_row().values()]
+                quarantine.append(bad)
+            if len(columns['isim']):
+                batches.append(columns)
+        
+        for columns in batches:
+            self.append_columns(columns['isim'], columns['yaş'],
+                                columns['maaş'], columns['departman'])
+        source.rows = rows
+        source.offset += complete
+        source.terminated = True
+        source.digest = source.fingerprint()
+        self.last_report = report
+        if quarantine:
+            self.quarantine = pd.concat([self.quarantine] + quarantine if self.quarantine is not None
+                                        else quarantine, ignore_index=True)
+        if not report.is_valid:
+            report.log()
+            logging.warning(f"{len(report.rejected_rows)} geçersiz satır karantinaya alındı")
+        logging.info(f"İzlenen dosyaya {report.total_rows} satır eklendi")
+        return 'eklendi'
+    
+    def get_data_as_dataframe(self) -> DataFrame:
+        """Veriyi tipli pandas DataFrame olarak döndürür (bellek dışı veride tümü belleğe alınır)"""
+        dataset = self.dataset
+        if isinstance(dataset, ChunkedDataset):
+            dataset = dataset.take(np.arange(len(dataset)))
+        if dataset:
+            return pd.DataFrame({
+                'isim': dataset.names,
+                'yaş': dataset.ages,
+                'maaş': dataset.salaries,
+                'departman': pd.Categorical.from_codes(dataset.dept_codes, dataset.departments)
+            })
+        return pd.DataFrame()
+
+# --- Filtre İndeksleri ---
+class Predicate:
+    """Filtre koşullarının ortak tabanı; & ve | ile birleştirilebilir"""
+    def __and__(self, other: 'Predicate') -> 'And':
+        return And([self, other])
+    
+    def __or__(self, other: 'Predicate') -> 'Or':
+        return Or([self, other])
+    
+    def __invert__(self) -> 'Not':
+        return Not(self)
+
+
+class Condition(Predicate):
+    """Tek sütun koşulu: >, >=, <, <=, ==, !=, between (alt, üst), in [değerler]"""
+    OPERATORS = ('>', '>=', '<', '<=', '==', '!=', 'between', 'in')
+    
+    def __init__(self, column: str, op: str, value):
+        self.column = column
+        self.op = op
+        self.value = value
+    
+    def __repr__(self) -> str:
+        return f"Condition({self.column!r}, {self.op!r}, {self.value!r})"
+
+
+class And(Predicate):
+    def __init__(self, children: List[Predicate]):
+        self.children = children
+    
+    def __repr__(self) -> str:
+        return f"And({self.children!r})"
+
+
+class Or(Predicate):
+    def __init__(self, children: List[Predicate]):
+        self.children = children
+    
+    def __repr__(self) -> str:
+        return f"Or({self.children!r})"
+
+
+class Not(Predicate):
+    def __init__(self, child: Predicate):
+        self.child = child
+    
+    def __repr__(self) -> str:
+        return f"Not({self.child!r})"
+
+
+class SortedIndex:
+    """Sayısal sütun için ikili aramayla aralık sorgusu yapan sıralı indeks"""
+    def __init__(self, values: np.ndarray):
+        values = np.asarray(values)
+        self.order = np.argsort(values, kind='stable')
+        self.sorted_values = values[self.order]
+        self.rows = len(values)
+    
+    def extend(self, values: np.ndarray):
+        """Sütuna sonradan eklenen satırları sıralı konumlarına yerleştirir"""
+        new = np.asarray(values[self.rows:])
+        if not len(new):
+            return
+        new_order = np.argsort(new, kind='stable')
+        new_sorted = new[new_order]
+        positions = np.searchsorted(self.sorted_values, new_sorted, side='right')
+        self.sorted_values = np.insert(self.sorted_values, positions, new_sorted)
+        self.order = np.insert(self.order, positions, new_order + self.rows)
+        self.rows = len(values)
+    
+    def bounds(self, op: str, value) -> Optional[tuple]:
+        """Koşulu sağlayan satırların sıralı dizideki [lo, hi) aralığı"""
+        search = self.sorted_values.searchsorted
+        if op == '>':
+            return search(value, 'right'), self.rows
+        if op == '>=':
+            return search(value, 'left'), self.rows
+        if op == '<':
+            return 0, search(value, 'left')
+        if op == '<=':
+            return 0, search(value, 'right')
+        if op == '==':
+            return search(value, 'left'), search(value, 'right')
+        if op == 'between':
+            low, high = value
+            return search(low, 'left'), max(search(high, 'right'), search(low, 'left'))
+        return None
+    
+    def rows_for(self, lo: int, hi: int) -> np.ndarray:
+        return np.sort(self.order[lo:hi])
+
+
+class CategoryIndex:
+    """Departman kodu -> satır indeksleri (ters indeks)"""
+    def __init__(self):
+        self.rows = 0
+        self._blocks: Dict[int, List[np.ndarray]] = {}
+    
+    def extend(self, codes: np.ndarray):
+        """Yeni satırları kod gruplarına ekler (yalnızca eklenen satırlar işlenir)"""
+        new = np.asarray(codes[self.rows:])
+        if not len(new):
+            return
+        order = np.argsort(new, kind='stable')
+        boundaries = np.flatnonzero(np.diff(new[order])) + 1
+        for group in np.split(order, boundaries):
+            self._blocks.setdefault(int(new[group[0]]), []).append(group + self.rows)
+        self.rows = len(codes)
+    
+    def rows_for(self, code: int) -> np.ndarray:
+        blocks = self._blocks.get(code)
+        if not blocks:
+            return np.empty(0, dtype=np.intp)
+        if len(blocks) > 1:
+            blocks[:] = [np.concatenate(blocks)]
+        return blocks[0]
+    
+    def count(self, code: int) -> int:
+        return sum(len(block) for block in self._blocks.get(code, ()))
+
+
+class FilterEngine:
+    """Sıralı ve ters indekslerle bileşik koşulları değerlendirir
+    
+    İndeksler ilk ihtiyaçta kurulur, satır eklemelerinde artımlı güncellenir,
+    veri kümesi değiştiğinde atılır. Sonuç her zaman artan satır indeksleridir.
+    """
+    NUMERIC_COLUMNS = ('yaş', 'maaş')
+    
+    def __init__(self):
+        self._dataset: Optional[ColumnarDataset] = None
+        self._generation = None
+        self._sorted: Dict[str, SortedIndex] = {}
+        self._categories: Optional[CategoryIndex] = None
+    
+    def sync(self, dataset: ColumnarDataset, generation: int):
+        """İndeksleri veri kümesinin güncel haline getirir"""
+        if generation != self._generation or len(dataset) < len(self._dataset or ()):
+            self._sorted = {}
+            self._categories = None
+            self._generation = generation
+        self._dataset = dataset
+    
+    def _sorted_index(self, column: str) -> SortedIndex:
+        values = self._dataset.column(column)
+        index = self._sorted.get(column)
+        if index is None:
+            index = self._sorted[column] = SortedIndex(values)
+        elif index.rows < len(values):
+            index.extend(values)
+        return index
+    
+    def _category_index(self) -> CategoryIndex:
+        if self._categories is None:
+            self._categories = CategoryIndex()
+        self._categories.extend(self._dataset.dept_codes)
+        return self._categories
+    
+    def _dept_codes(self, condition: Condition) -> Optional[List[int]]:
+        """departman ==/in koşulunu kategori kodlarına çevirir (indekslenemiyorsa None)"""
+        if condition.column != 'departman' or condition.op not in ('==', 'in'):
+            return None
+        values = [condition.value] if condition.op == '==' else condition.value
+        departments = self._dataset.departments
+        return [departments.index(value) for value in values if value in departments]
+    
+    def estimate(self, predicate: Predicate) -> int:
+        """Sonuç boyutu tahmini (indeksli koşullarda kesin, diğerlerinde satır sayısı)"""
+        n = len(self._dataset)
+        if isinstance(predicate, Condition):
+            codes = self._dept_codes(predicate)
+            if codes is not None:
+                index = self._category_index()
+                return sum(index.count(code) for code in codes)
+            if predicate.column in self.NUMERIC_COLUMNS:
+                bounds = self._sorted_index(predicate.column).bounds(predicate.op, predicate.value)
+                if bounds is not None:
+                    return max(bounds[1] - bounds[0], 0)
+            return n
+        if isinstance(predicate, And):
+            return min((self.estimate(child) for child in predicate.children), default=n)
+        if isinstance(predicate, Or):
+            return min(sum(self.estimate(child) for child in predicate.children), n)
+        return n
+    
+    def evaluate(self, predicate: Predicate) -> np.ndarray:
+        """Koşulu sağlayan satır indekslerini (artan sırada) döndürür"""
+        if isinstance(predicate, Condition):
+            return self._evaluate_condition(predicate)
+        if isinstance(predicate, And):
+            if not predicate.children:
+                return np.arange(len(self._dataset))
+            # En seçici koşuldan başla, kalanları yalnızca aday satırlarda dene
+            children = sorted(predicate.children, key=self.estimate)
+            rows = self.evaluate(children[0])
+            for child in children[1:]:
+                if not len(rows):
+                    break
+                rows = rows[self.matches(child, rows)]
+            return rows
+        if isinstance(predicate, Or):
+            mask = np.zeros(len(self._dataset), dtype=bool)
+            for child in predicate.children:
+                mask[self.evaluate(child)] = True
+            return np.flatnonzero(mask)
+        if isinstance(predicate, Not):
+            mask = np.ones(len(self._dataset), dtype=bool)
+            mask[self.evaluate(predicate.child)] = False
+            return np.flatnonzero(mask)
+        raise TypeError(f"Bilinmeyen koşul: {predicate!r}")
+    
+    def _evaluate_condition(self, condition: Condition) -> np.ndarray:
+        codes = self._dept_codes(condition)
+        if codes is not None:
+            index = self._category_index()
+            if len(codes) == 1:
+                return index.rows_for(codes[0])
+            return np.sort(np.concatenate([index.rows_for(code) for code in codes]
+                                          or [np.empty(0, dtype=np.intp)]))
+        
+        if condition.column in self.NUMERIC_COLUMNS:
+            index = self._sorted_index(condition.column)
+            bounds = index.bounds(condition.op, condition.value)
+            if bounds is not None:
+                return index.rows_for(*bounds)
+        
+        return np.flatnonzero(self.matches(condition, None))
+    
+    def matches(self, predicate: Predicate, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Koşulu verilen satırlarda (None ise tüm satırlarda) maske olarak değerlendirir"""
+        if isinstance(predicate, And):
+            mask = np.ones(len(self._dataset) if rows is None else len(rows), dtype=bool)
+            for child in predicate.children:
+                mask &= self.matches(child, rows)
+            return mask
+        if isinstance(predicate, Or):
+            mask = np.zeros(len(self._dataset) if rows is None else len(rows), dtype=bool)
+            for child in predicate.children:
+                mask |= self.matches(child, rows)
+            return mask
+        if isinstance(predicate, Not):
+            return ~self.matches(predicate.child, rows)
+        
+        condition = predicate
+        if condition.column == 'departman' and condition.op in ('==', 'in'):
+            values = self._dataset.dept_codes
+            codes = self._dept_codes(condition)
+            return np.isin(values if rows is None else values[rows], codes)
+        
+        values = self._dataset.column(condition.column)
+        if rows is not None:
+            values = values[rows]
+        op, value = condition.op, condition.value
+        if op == 'between':
+            return (values >= value[0]) & (values <= value[1])
+        if op == 'in':
+            return np.isin(values, list(value))
+        comparisons = {
+            ">": np.greater, ">=": np.greater_equal, "<": np.less,
+            "<=": np.less_equal, "==": np.equal, "!=": np.not_equal
+        }
+        if op not in comparisons:
+            raise ValueError(f"Bilinmeyen operatör: {op}")
+        return np.asarray(comparisons[op](values, value), dtype=bool)
+
+# --- Gruplama ve Toplulaştırma ---
+class Band:
+    """Sayısal sütunu [alt, üst) aralıklarına bölen grup anahtarı"""
+    def __init__(self, column: str, edges: Sequence[float]):
+        self.column = column
+        self.edges = [float(edge) for edge in edges]
+        self.name = f"{column}_bandı"
+    
+    def labels(self) -> List[str]:
+        labels = []
+        for low, high in zip(self.edges[:-1], self.edges[1:]):
+            if low == -np.inf:
+                labels.append(f"<{high:g}")
+            elif high == np.inf:
+                labels.append(f"{low:g}+")
+            else:
+                labels.append(f"{low:g}-{high:g}")
+        return labels
+    
+    def codes(self, dataset: ColumnarDataset) -> np.ndarray:
+        return np.digitize(dataset.column(self.column), self.edges[1:-1])
+    
+    def __repr__(self) -> str:
+        return f"Band({self.column!r}, {self.edges!r})"
+
+
+DEFAULT_BANDS = {
+    'yaş_bandı': Band('yaş', [-np.inf, 25, 35, 45, 55, np.inf]),
+    'maaş_bandı': Band('maaş', [-np.inf, 10000, 20000, 30000, 50000, np.inf]),
+}
+
+
+class AggregationResult:
+    """Grup anahtarları ve metrik sütunlarından oluşan toplulaştırma sonucu"""
+    def __init__(self, keys: List[str], groups: List[tuple], metrics: Dict[str, np.ndarray]):
+        self.keys = keys
+        self.groups = groups
+        self.metrics = metrics
+    
+    def __len__(self) -> int:
+        return len(self.groups)
+    
+    def column(self, key: str) -> List:
+        """Bir grup anahtarının etiket sütunu"""
+        position = self.keys.index(key)
+        return [group[position] for group in self.groups]
+    
+    def to_dict(self) -> Dict[tuple, Dict[str, float]]:
+        return {group: {name: values[i].item() for name, values in self.metrics.items()}
+                for i, group in enumerate(self.groups)}
+    
+    def to_dataframe(self) -> DataFrame:
+        frame = pd.DataFrame(self.groups, columns=self.keys)
+        for name, values in self.metrics.items():
+            frame[name] = values
+        return frame
+
+
+def _group_codes(dataset: ColumnarDataset, keys: Sequence[Union[str, Band]]) -> tuple:
+    """Grup anahtarlarını karışık tabanlı tek grup kimliğine çevirir
+    
+    (grup_kimlikleri, anahtar_etiketleri, anahtar_adları) döndürür. Kimlikler
+    yalnızca etiket listelerine bağlıdır; aynı departman listesini paylaşan
+    parçalarda aynı grup aynı kimliği alır.
+    """
+    key_codes, key_labels, key_names = [], [], []
+    for key in keys:
+        if isinstance(key, str) and key in DEFAULT_BANDS:
+            key = DEFAULT_BANDS[key]
+        if isinstance(key, Band):
+            key_codes.append(key.codes(dataset))
+            key_labels.append(key.labels())
+            key_names.append(key.name)
+        elif key == 'departman':
+            # Kodları ada göre sıraya çevir: sonuç groupby gibi alfabetik olur
+            ranking = sorted(range(len(dataset.departments)), key=dataset.departments.__getitem__)
+            rank_of_code = np.empty(len(ranking), dtype=np.int64)
+            rank_of_code[ranking] = np.arange(len(ranking))
+            key_codes.append(rank_of_code[dataset.dept_codes])
+            key_labels.append([dataset.departments[code] for code in ranking])
+            key_names.append('departman')
+        else:
+            raise KeyError(f"Bilinmeyen grup anahtarı: {key}")
+    
+    group_ids = np.zeros(len(dataset), dtype=np.int64)
+    for codes, labels in zip(key_codes, key_labels):
+        group_ids = group_ids * len(labels) + codes
+    return group_ids, key_labels, key_names
+
+
+def _sorted_groups(group_ids: np.ndarray, values: np.ndarray, by_value: bool) -> tuple:
+    """Değerleri gruba (by_value ise grup içinde değere) göre sıralar
+    
+    (grup_kimlikleri, başlangıçlar, sayılar, sıralı_değerler) döndürür.
+    """
+    if by_value:
+        order = np.lexsort((values, group_ids))
+    else:
+        order = np.argsort(group_ids, kind='stable')
+    sorted_ids = group_ids[order]
+    sorted_values = values[order]
+    
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]]) if len(order) else np.empty(0, dtype=np.intp)
+    counts = np.diff(np.r_[starts, len(order)])
+    return sorted_ids[starts], starts, counts, sorted_values
+
+
+def _group_labels(group_ids: np.ndarray, key_labels: List[List[str]]) -> List[tuple]:
+    """Grup kimliklerini etiket demetlerine açar"""
+    groups = []
+    for group_id in group_ids.tolist():
+        labels = []
+        for key_label in reversed(key_labels):
+            group_id, code = divmod(group_id, len(key_label))
+            labels.append(key_label[code])
+        groups.append(tuple(reversed(labels)))
+    return groups
+
+
+def group_aggregate(dataset: ColumnarDataset, keys: Sequence[Union[str, Band]],
+                    metrics: Sequence[str] = ('count', 'mean'),
+                    value_column: str = 'maaş') -> AggregationResult:
+    """Tipli sütunlar üzerinde tek sıralama geçişinde çok anahtarlı gruplama
+    
+    keys: 'departman', 'yaş_bandı', 'maaş_bandı' ya da Band nesneleri
+    metrics: count, sum, mean, min, max, std ve p50/p90 gibi yüzdelikler
+    """
+    if isinstance(dataset, ChunkedDataset):
+        return chunked_group_aggregate(dataset, keys, metrics, value_column)
+    
+    group_ids, key_labels, key_names = _group_codes(dataset, keys)
+    values = np.asarray(dataset.column(value_column), dtype=np.float64)
+    percentiles = [metric for metric in metrics if metric.startswith('p')]
+    unique_ids, starts, counts, sorted_values = _sorted_groups(group_ids, values, bool(percentiles))
+    
+    result: Dict[str, np.ndarray] = {}
+    sums = np.add.reduceat(sorted_values, starts) if len(starts) else np.empty(0)
+    means = sums / counts if len(starts) else np.empty(0)
+    for metric in metrics:
+        if metric == 'count':
+            result[metric] = counts
+        elif metric == 'sum':
+            result[metric] = sums
+        elif metric == 'mean':
+            result[metric] = means
+        elif metric == 'min':
+            result[metric] = np.minimum.reduceat(sorted_values, starts) if len(starts) else np.empty(0)
+        elif metric == 'max':
+            result[metric] = np.maximum.reduceat(sorted_values, starts) if len(starts) else np.empty(0)
+        elif metric == 'std':
+            deviations = np.square(sorted_values - np.repeat(means, counts))
+            m2 = np.add.reduceat(deviations, starts) if len(starts) else np.empty(0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[metric] = np.sqrt(m2 / (counts - 1))
+        elif metric in percentiles:
+            # numpy'nin varsayılan doğrusal ara değerlemesi, grup başına
+            position = starts + float(metric[1:]) / 100 * (counts - 1)
+            lower = np.floor(position).astype(np.intp)
+            upper = np.ceil(position).astype(np.intp)
+            fraction = position - lower
+            result[metric] = sorted_values[lower] * (1 - fraction) + sorted_values[upper] * fraction
+        else:
+            raise KeyError(f"Bilinmeyen metrik: {metric}")
+    
+    return AggregationResult(key_names, _group_labels(unique_ids, key_labels), result)
+
+
+def chunked_group_aggregate(dataset: 'ChunkedDataset', keys: Sequence[Union[str, Band]],
+                            metrics: Sequence[str] = ('count', 'mean'), value_column: str = 'maaş',
+                            rank_error: Optional[float] = None) -> AggregationResult:
+    """group_aggregate'in parça parça çalışan karşılığı (bellek dışı veri kümeleri için)
+    
+    Sayı, toplam, min/max ve M2 (Chan birleştirmesi) grup başına kesin olarak
+    birleştirilir; yüzdelikler grup başına KLL taslağından gelir (yaklaşık).
+    """
+    percentiles = [metric for metric in metrics if metric.startswith('p')]
+    unknown = [metric for metric in metrics if metric not in
+               ('count', 'sum', 'mean', 'min', 'max', 'std') and metric not in percentiles]
+    if unknown:
+        raise KeyError(f"Bilinmeyen metrik: {unknown[0]}")
+    
+    key_labels, key_names = None, None
+    counts = sums = means = m2 = mins = maxs = None
+    sketches: Dict[int, KLLSketch] = {}
+    for _, chunk in dataset.chunks():
+        group_ids, key_labels, key_names = _group_codes(chunk, keys)
+        if counts is None:
+            size = int(np.prod([len(labels) for labels in key_labels]))
+            counts = np.zeros(size, dtype=np.int64)
+            sums, means, m2 = np.zeros(size), np.zeros(size), np.zeros(size)
+            mins, maxs = np.full(size, np.inf), np.full(size, -np.inf)
+        
+        values = np.asarray(chunk.column(value_column), dtype=np.float64)
+        ids, starts, batch, sorted_values = _sorted_groups(group_ids, values, False)
+        if not len(ids):
+            continue
+        batch_sums = np.add.reduceat(sorted_values, starts)
+        batch_means = batch_sums / batch
+        batch_m2 = np.add.reduceat(np.square(sorted_values - np.repeat(batch_means, batch)), starts)
+        
+        total = counts[ids] + batch
+        delta = batch_means - means[ids]
+        m2[ids] += batch_m2 + delta * delta * counts[ids] * batch / total
+        means[ids] += delta * batch / total
+        counts[ids] = total
+        sums[ids] += batch_sums
+        mins[ids] = np.minimum(mins[ids], np.minimum.reduceat(sorted_values, starts))
+        maxs[ids] = np.maximum(maxs[ids], np.maximum.reduceat(sorted_values, starts))
+        if percentiles:
+            for group_id, start, count in zip(ids.tolist(), starts.tolist(), batch.tolist()):
+                sketch = sketches.get(group_id)
+                if sketch is None:
+                    sketch = sketches[group_id] = KLLSketch(rank_error or KLLSketch.DEFAULT_RANK_ERROR)
+                sketch.update(sorted_values[start:start + count])
+    
+    if counts is None:
+        # Parçasız veri kümesi: anahtar adları boş bir veri kümesinden gelir
+        return group_aggregate(ColumnarBuilder().build(), keys, metrics, value_column)
+    
+    present = np.flatnonzero(counts)
+    result: Dict[str, np.ndarray] = {}
+    for metric in metrics:
+        if metric == 'count':
+            result[metric] = counts[present]
+        elif metric == 'sum':
+            result[metric] = sums[present]
+        elif metric == 'mean':
+            result[metric] = sums[present] / counts[present]
+        elif metric == 'min':
+            result[metric] = mins[present]
+        elif metric == 'max':
+            result[metric] = maxs[present]
+        elif metric == 'std':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[metric] = np.sqrt(m2[present] / (counts[present] - 1))
+        else:
+            q = float(metric[1:]) / 100
+            result[metric] = np.array([sketches[group_id].quantile(q) for group_id in present.tolist()])
+    
+    return AggregationResult(key_names, _group_labels(present, key_labels), result)
+
+
+class AggregationEngine:
+    """Gruplama sonuçlarını veri sürümü başına önbellekler"""
+    def __init__(self):
+        self._version = None
+        self._cache: Dict[tuple, AggregationResult] = {}
+    
+    def aggregate(self, dataset: ColumnarDataset, version: int, keys: Sequence[Union[str, Band]],
+                  metrics: Sequence[str], value_column: str) -> AggregationResult:
+        if version != self._version:
+            self._cache = {}
+            self._version = version
+        
+        cache_key = (tuple(map(repr, keys)), tuple(metrics), value_column)
+        result = self._cache.get(cache_key)
+        METRICS.cache('gruplama_önbelleği', result is not None)
+        if result is None:
+            result = self._cache[cache_key] = group_aggregate(dataset, keys, metrics, value_column)
+        return result
+
+# --- Sorgu Dili ---
+class QuerySyntaxError(ValueError):
+    """Sorgu metni ayrıştırılamadığında; position hatalı belirtecin karakter konumudur"""
+    def __init__(self, message: str, position: Optional[int] = None):
+        super().__init__(message if position is None else f"{message} (konum {position})")
+        self.position = position
+
+
+class DerivedColumn:
+    """Temel sütundan türetilen sorgu sütunu
+    
+    Koşullar değerlendirmeden önce temel sütuna yeniden yazılır; böylece
+    türetilmiş sütun hiç oluşturulmaz ve temel sütunun indeksi kullanılır.
+    """
+    def __init__(self, source: str, scale: float = 1.0, band: Optional[Band] = None):
+        if scale <= 0:
+            raise ValueError("Ölçek pozitif olmalı (koşul yönü korunmalı)")
+        self.source = source
+        self.scale = scale
+        self.band = band
+    
+    @property
+    def numeric(self) -> bool:
+        return self.band is None
+    
+    def rewrite(self, op: str, value) -> Predicate:
+        """'türetilmiş op değer' koşulunu temel sütun üzerindeki koşula çevirir"""
+        if self.band is None:
+            if op == 'between':
+                return Condition(self.source, op, (value[0] / self.scale, value[1] / self.scale))
+            if op == 'in':
+                return Condition(self.source, op, [item / self.scale for item in value])
+            return Condition(self.source, op, value / self.scale)
+        
+        if op == '==':
+            return self._band_range(value)
+        if op == '!=':
+            return Not(self._band_range(value))
+        if op == 'in':
+            return Or([self._band_range(label) for label in value])
+        raise QuerySyntaxError(f"Bant sütunu yalnızca ==, != ve in ile karşılaştırılabilir: {op}")
+    
+    def _band_range(self, label: str) -> Predicate:
+        labels = self.band.labels()
+        if label not in labels:
+            raise QuerySyntaxError(f"Bilinmeyen bant '{label}'; geçerli bantlar: {', '.join(labels)}")
+        position = labels.index(label)
+        low, high = self.band.edges[position], self.band.edges[position + 1]
+        bounds = []
+        if low != -np.inf:
+            bounds.append(Condition(self.source, '>=', low))
+        if high != np.inf:
+            bounds.append(Condition(self.source, '<', high))
+        return bounds[0] if len(bounds) == 1 else And(bounds)
+
+
+QUERY_COLUMNS = {'isim': False, 'yaş': True, 'maaş': True, 'departman': False}  # sütun -> sayısal mı
+
+DERIVED_COLUMNS = {
+    'yıllık_maaş': DerivedColumn('maaş', scale=12),
+    'yaş_bandı': DerivedColumn('yaş', band=DEFAULT_BANDS['yaş_bandı']),
+    'maaş_bandı': DerivedColumn('maaş', band=DEFAULT_BANDS['maaş_bandı']),
+}
+
+_QUERY_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?!\w)
+      | (?P<string>'[^']*'|"[^"]*")
+      | (?P<op>>=|<=|==|!=|=|>|<|\(|\)|,)
+      | (?P<word>\w+)
+    )""", re.VERBOSE)
+
+_QUERY_KEYWORDS = {'and': 'and', 've': 'and', 'or': 'or', 'veya': 'or',
+                   'not': 'not', 'değil': 'not', 'in': 'in', 'between': 'between'}
+
+
+def tokenize_query(text: str) -> List[tuple]:
+    """Sorgu metnini (tür, değer, konum) belirteçlerine böler"""
+    tokens, position = [], 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _QUERY_TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise QuerySyntaxError(f"Beklenmeyen karakter '{text[position:].lstrip()[:1]}'", position)
+        kind = match.lastgroup
+        value = match.group(kind)
+        start = match.start(kind)
+        if kind == 'number':
+            value = float(value)
+        elif kind == 'string':
+            value = value[1:-1]
+        elif kind == 'word' and value.lower() in _QUERY_KEYWORDS:
+            kind, value = 'keyword', _QUERY_KEYWORDS[value.lower()]
+        elif kind == 'op' and value == '=':
+            value = '=='
+        tokens.append((kind, value, start))
+        position = match.end()
+    return tokens
+
+
+class _QueryParser:
+    """Özyinelemeli iniş ayrıştırıcısı; öncelik: not > and > or
+    
+    sorgu  := and_ifadesi ('or' and_ifadesi)*
+    and    := not_ifadesi ('and' not_ifadesi)*
+    not    := 'not' not_ifadesi | '(' sorgu ')' | koşul
+    koşul  := sütun op değer | sütun 'between' değer 'and' değer
+            | sütun ['not'] 'in' '(' değer (',' değer)* ')'
+    """
+    def __init__(self, compiler: 'QueryCompiler', text: str):
+        self.compiler = compiler
+        self.tokens = tokenize_query(text)
+        self.position = 0
+        self.end = len(text)
+    
+    def parse(self) -> Predicate:
+        if not self.tokens:
+            raise QuerySyntaxError("Sorgu boş")
+        predicate = self._or()
+        if self.position < len(self.tokens):
+            _, value, start = self.tokens[self.position]
+            raise QuerySyntaxError(f"Fazladan belirteç '{value}'", start)
+        return predicate
+    
+    def _peek(self, kind: str, value=None) -> bool:
+        if self.position >= len(self.tokens):
+            return False
+        token_kind, token_value, _ = self.tokens[self.position]
+        return token_kind == kind and (value is None or token_value == value)
+    
+    def _take(self, kind: str, value=None, expected: Optional[str] = None):
+        if not self._peek(kind, value):
+            found = self.tokens[self.position] if self.position < len(self.tokens) else None
+            what = f"'{found[1]}'" if found else "sorgu sonu"
+            raise QuerySyntaxError(f"{expected or value or kind} bekleniyordu, {what} bulundu",
+                                   found[2] if found else self.end)
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+    
+    def _or(self) -> Predicate:
+        children = [self._and()]
+        while self._peek('keyword', 'or'):
+            self.position += 1
+            children.append(self._and())
+        return children[0] if len(children) == 1 else Or(children)
+    
+    def _and(self) -> Predicate:
+        children = [self._not()]
+        while self._peek('keyword', 'and'):
+            self.position += 1
+            children.append(self._not())
+        return children[0] if len(children) == 1 else And(children)
+    
+    def _not(self) -> Predicate:
+        if self._peek('keyword', 'not'):
+            self.position += 1
+            return Not(self._not())
+        if self._peek('op', '('):
+            self.position += 1
+            predicate = self._or()
+            self._take('op', ')')
+            return predicate
+        return self._condition()
+    
+    def _value(self):
+        if self._peek('number') or self._peek('string') or self._peek('word'):
+            return self._take(self.tokens[self.position][0])
+        return self._take('number', expected="değer")
+    
+    def _condition(self) -> Predicate:
+        _, column, start = self._take('word', expected="sütun adı")
+        negate = False
+        if self._peek('keyword', 'not'):
+            self.position += 1
+            negate = True
+            if not self._peek('keyword', 'in'):
+                self._take('keyword', 'in')
+        
+        if self._peek('keyword', 'in'):
+            self.position += 1
+            self._take('op', '(')
+            values = [self._value()]
+            while self._peek('op', ','):
+                self.position += 1
+                values.append(self._value())
+            self._take('op', ')')
+            predicate = self.compiler.condition(column, 'in', [token[1] for token in values], start)
+            return Not(predicate) if negate else predicate
+        
+        if self._peek('keyword', 'between'):
+            self.position += 1
+            low = self._value()[1]
+            self._take('keyword', 'and')
+            high = self._value()[1]
+            return self.compiler.condition(column, 'between', (low, high), start)
+        
+        _, op, _ = self._take('op', expected="karşılaştırma operatörü")
+        if op not in Condition.OPERATORS:
+            raise QuerySyntaxError(f"Karşılaştırma operatörü bekleniyordu, '{op}' bulundu", start)
+        return self.compiler.condition(column, op, self._value()[1], start)
+
+
+class QueryCompiler:
+    """Sorgu metnini FilterEngine'in değerlendirdiği koşul ağacına derler
+    
+    Derleme metin başına bir kez yapılır (LRU önbellek); koşul ağacı veri
+    kümesinden bağımsız olduğundan veri değişse de önbellekteki sonuç geçerlidir.
+    Değerlendirme FilterEngine'e kalır: indeksli koşullar indeksten, diğerleri
+    vektörel maskelerle çözülür.
+    """
+    def __init__(self, max_entries: int = 256, columns: Optional[Dict[str, bool]] = None,
+                 derived: Optional[Dict[str, DerivedColumn]] = None):
+        self.max_entries = max_entries
+        self.columns = dict(QUERY_COLUMNS if columns is None else columns)
+        self.derived = dict(DERIVED_COLUMNS if derived is None else derived)
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns) + list(self.derived)
+    
+    def compile(self, text: str) -> Predicate:
+        """Sorgu metnini koşul ağacına çevirir; hatalı sorguda QuerySyntaxError
+        
+        Önbellek anahtarı ham metindir: tırnaklı değerlerdeki boşluklar anlamlıdır.
+        """
+        with self._lock:
+            predicate = self._cache.get(text)
+            if predicate is not None:
+                self._cache.move_to_end(text)
+        METRICS.cache('sorgu_önbelleği', predicate is not None)
+        if predicate is None:
+            predicate = _QueryParser(self, text).parse()
+            with self._lock:
+                self._cache[text] = predicate
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return predicate
+    
+    def condition(self, column: str, op: str, value, position: Optional[int] = None) -> Predicate:
+        """Tek koşulu doğrular, değerini sütun tipine çevirir ve türetilmiş sütunları açar"""
+        derived = self.derived.get(column)
+        if derived is None and column not in self.columns:
+            raise QuerySyntaxError(f"Bilinmeyen sütun '{column}'; geçerli sütunlar: "
+                                   f"{', '.join(self.column_names)}", position)
+        if op not in Condition.OPERATORS:
+            raise QuerySyntaxError(f"Bilinmeyen operatör: {op}", position)
+        
+        numeric = derived.numeric if derived is not None else self.columns[column]
+        convert = self._number if numeric else str
+        try:
+            if op == 'between':
+                value = (convert(value[0]), convert(value[1]))
+            elif op == 'in':
+                value = [convert(item) for item in value]
+            else:
+                value = convert(value)
+        except ValueError:
+            raise QuerySyntaxError(f"'{column}' sayısal bir sütun; geçersiz değer: {value!r}",
+                                   position) from None
+        if not numeric and op not in ('==', '!=', 'in'):
+            raise QuerySyntaxError(f"'{column}' metin sütunu; yalnızca ==, != ve in kullanılabilir",
+                                   position)
+        
+        if derived is not None:
+            return derived.rewrite(op, value)
+        return Condition(column, op, value)
+    
+    @staticmethod
+    def _number(value) -> float:
+        return float(value.strip() if isinstance(value, str) else value)
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+
+# --- Birleştirilebilir Taslaklar ---
+class KLLSketch:
+    """Birleştirilebilir yaklaşık yüzdelik taslağı (KLL)
+    
+    Her seviye bir sıkıştırıcıdır: dolduğunda sıralanır ve rastgele ofsetle
+    her iki öğeden biri bir üst seviyeye (iki kat ağırlıkla) taşınır. Bellek
+    O(k) kalır; sıra hatası yaklaşık 1.7 / k'dır.
+    """
+    ERROR_CONSTANT = 1.7
+    DEFAULT_RANK_ERROR = 0.005
+    
+    def __init__(self, rank_error: float = DEFAULT_RANK_ERROR, seed: Optional[int] = None):
+        self.k = max(int(np.ceil(self.ERROR_CONSTANT / rank_error)), 8)
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+    
+    @property
+    def rank_error(self) -> float:
+        """Beklenen en büyük sıra hatası (0-1 arası oran)"""
+        return self.ERROR_CONSTANT / self.k
+    
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+    
+    def update(self, values: np.ndarray):
+        """Bir değer dizisini taslağa ekler"""
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+    
+    def merge(self, other: 'KLLSketch'):
+        """Başka bir taslağı (ör. başka bir parçanınkini) bu taslağa katar"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.k = min(self.k, other.k)
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+    
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                # Tek sayıda öğede biri bu seviyede kalır; toplam ağırlık korunur
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                paired = items[:len(items) - len(keep)]
+                promoted = paired[int(self._rng.integers(2))::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+    
+    def _weighted(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 1 << level, dtype=np.int64)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], np.cumsum(weights[order])
+    
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Birden çok yüzdeliği (0-1) tek sıralamayla hesaplar"""
+        if not self.count:
+            return [float('nan')] * len(qs)
+        values, cumulative = self._weighted()
+        result = []
+        for q in qs:
+            if q <= 0:
+                result.append(self.min)
+            elif q >= 1:
+                result.append(self.max)
+            else:
+                position = np.searchsorted(cumulative, q * cumulative[-1])
+                result.append(float(values[min(position, len(values) - 1)]))
+        return result
+    
+    def quantile(self, q: float) -> float:
+        """q (0-1) yüzdeliğinin yaklaşık değeri"""
+        return self.quantiles([q])[0]
+    
+    def __len__(self) -> int:
+        """Taslakta tutulan öğe sayısı (bellek ölçüsü)"""
+        return sum(len(items) for items in self.levels)
+    
+    def to_dict(self) -> Dict:
+        """JSON'a yazılabilir biçim"""
+        return {'tür': 'kll', 'k': self.k, 'count': self.count,
+                'min': self.min if self.count else None,
+                'max': self.max if self.count else None,
+                'levels': [items.tolist() for items in self.levels]}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'KLLSketch':
+        sketch = cls()
+        sketch.k = data['k']
+        sketch.count = data['count']
+        if sketch.count:
+            sketch.min, sketch.max = data['min'], data['max']
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in data['levels']]
+        return sketch
+
+
+class HyperLogLog:
+    """Birleştirilebilir yaklaşık farklı değer sayacı
+    
+    Değerler pandas'ın sabit anahtarlı 64 bit özetiyle karma edilir; böylece
+    farklı süreçlerde oluşturulan sayaçlar da birleştirilebilir.
+    """
+    DEFAULT_ERROR = 0.01
+    
+    def __init__(self, relative_error: float = DEFAULT_ERROR):
+        # Standart hata ≈ 1.04 / sqrt(m), m = 2^precision
+        self.precision = int(np.clip(np.ceil(np.log2((1.04 / relative_error) ** 2)), 4, 18))
+        self.registers = np.zeros(1 << self.precision, dtype=np.uint8)
+    
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+    
+    def update(self, values: np.ndarray):
+        """Değer dizisini (metin ya da sayı) sayaca ekler"""
+        if not len(values):
+            return
+        hashes = pd.util.hash_array(np.asarray(values, dtype=object))
+        width = 64 - self.precision
+        buckets = (hashes >> np.uint64(width)).astype(np.intp)
+        rest = hashes & np.uint64((1 << width) - 1)
+        # 64 bitlik bit uzunluğu: iki 32 bitlik yarıda frexp ile (float64'te tam)
+        high = np.frexp((rest >> np.uint64(32)).astype(np.float64))[1]
+        low = np.frexp((rest & np.uint64(0xFFFFFFFF)).astype(np.float64))[1]
+        bit_length = np.where(high > 0, high + 32, low)
+        ranks = (width - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+    
+    def merge(self, other: 'HyperLogLog'):
+        if other.precision != self.precision:
+            raise ValueError("Farklı hassasiyetteki HyperLogLog sayaçları birleştirilemez")
+        np.maximum(self.registers, other.registers, out=self.registers)
+    
+    def count(self) -> int:
+        """Yaklaşık farklı değer sayısı"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # küçük aralık: doğrusal sayım
+        return int(round(estimate))
+    
+    def to_dict(self) -> Dict:
+        return {'tür': 'hll', 'precision': self.precision,
+                'registers': base64.b64encode(self.registers.tobytes()).decode('ascii')}
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'HyperLogLog':
+        sketch = cls()
+        sketch.precision = data['precision']
+        sketch.registers = np.frombuffer(base64.b64decode(data['registers']),
+                                         dtype=np.uint8).copy()
+        return sketch
+
+# --- Analiz Sınıfı ---
+class StatisticsEngine:
+    """Veri sürümü başına önbellekli, satır eklemelerinde artımlı istatistikler
+    
+    Sayı, toplam, ortalama/M2 (Chan birleştirmesi), min/max, yaş toplamı ve
+    departman sayıları yalnızca yeni satırlarla güncellenir. Kesin modda
+    sıralı maaş dizisine yalnızca yeni parti birleştirilir ve isim kümesi
+    partiden güncellenir; böylece eklemeden sonra yüzdelikler ve farklı isim
+    sayısı tüm sütun yeniden taranmadan bulunur. approximate=True
+    ise yüzdelikler KLL, farklı isim sayısı HyperLogLog taslağından gelir;
+    taslaklar da artımlı güncellenir ve tüm sütunu yeniden okumaz.
+    """
+    PERCENTILES = (50, 90, 99)
+    
+    def __init__(self, approximate: bool = False,
+                 rank_error: float = KLLSketch.DEFAULT_RANK_ERROR,
+                 distinct_error: float = HyperLogLog.DEFAULT_ERROR):
+        self.approximate = approximate
+        self.rank_error = rank_error
+        self.distinct_error = distinct_error
+        self._generation = None
+        self._version = None
+        self._cached: Dict = {}
+        self._reset()
+    
+    def _reset(self):
+        self.rows = 0
+        self.salary_sum = 0.0
+        self.salary_mean = 0.0
+        self.salary_m2 = 0.0
+        self.salary_min = np.inf
+        self.salary_max = -np.inf
+        self.age_sum = 0
+        self.dept_counts = np.zeros(0, dtype=np.int64)
+        self.salary_sketch = KLLSketch(self.rank_error) if self.approximate else None
+        self.name_sketch = HyperLogLog(self.distinct_error) if self.approximate else None
+        self.sorted_salaries = None if self.approximate else np.empty(0)
+        self.names_seen = None if self.approximate else set()
+    
+    def update(self, dataset: ColumnarDataset, start: int):
+        """start satırından itibaren eklenen satırları toplamlara katar"""
+        if isinstance(dataset, ChunkedDataset):
+            for offset, chunk in dataset.chunks(start):
+                self.update(chunk, max(start - offset, 0))
+            return
+        salaries = np.asarray(dataset.salaries[start:])
+        batch = len(salaries)
+        if not batch:
+            return
+        
+        batch_mean = salaries.mean()
+        batch_m2 = np.square(salaries - batch_mean).sum()
+        total = self.rows + batch
+        delta = batch_mean - self.salary_mean
+        self.salary_m2 += batch_m2 + delta * delta * self.rows * batch / total
+        self.salary_mean += delta * batch / total
+        
+        self.salary_sum += salaries.sum()
+        self.salary_min = min(self.salary_min, salaries.min())
+        self.salary_max = max(self.salary_max, salaries.max())
+        self.age_sum += int(dataset.ages[start:].sum(dtype=np.int64))
+        
+        batch_counts = np.bincount(dataset.dept_codes[start:], minlength=len(dataset.departments))
+        batch_counts[:len(self.dept_counts)] += self.dept_counts
+        self.dept_counts = batch_counts
+        if self.approximate:
+            self.salary_sketch.update(salaries)
+            self.name_sketch.update(dataset.names[start:])
+        else:
+            # Sıralı partiyi sıralı diziye yerleştir: O(n) kopya, tam sıralama yok
+            batch_sorted = np.sort(salaries)
+            positions = np.searchsorted(self.sorted_salaries, batch_sorted)
+            self.sorted_salaries = np.insert(self.sorted_salaries, positions, batch_sorted)
+            self.names_seen.update(dataset.names[start:].tolist())
+        self.rows = total
+    
+    def statistics(self, dataset: ColumnarDataset, generation: int, version: int) -> Dict:
+        """Verilen sürüm için istatistikleri döndürür (değişmemişse önbellekten)"""
+        METRICS.cache('istatistik_önbelleği', version == self._version)
+        if version == self._version:
+            return dict(self._cached)
+        
+        if generation != self._generation or len(dataset) < self.rows:
+            self._reset()
+            self._generation = generation
+        self.update(dataset, self.rows)
+        
+        counts = self.dept_counts
+        # value_counts gibi: çoktan aza, eşitlikte ilk görülme sırası
+        order = np.argsort(-counts, kind='stable')
+        
+        if self.approximate:
+            percentiles = self.salary_sketch.quantiles([p / 100 for p in self.PERCENTILES])
+            distinct_names = self.name_sketch.count()
+        else:
+            percentiles = self._sorted_percentiles(self.sorted_salaries)
+            distinct_names = len(self.names_seen)
+        
+        self._cached = {
+            'ortalama_maaş': float(self.salary_sum / self.rows),
+            'medyan_maaş': float(percentiles[0]),
+            'toplam_maaş': float(self.salary_sum),
+            'max_maaş': float(self.salary_max),
+            'min_maaş': float(self.salary_min),
+            'std_maaş': float(np.sqrt(self.salary_m2 / (self.rows - 1))) if self.rows > 1 else float('nan'),
+            'ortalama_yaş': self.age_sum / self.rows,
+            'kişi_sayısı': self.rows,
+            'departman_dağılımı': {dataset.departments[code]: int(counts[code])
+                                   for code in order if counts[code]},
+            'maaş_yüzdelikleri': {f"p{p}": float(value)
+                                  for p, value in zip(self.PERCENTILES, percentiles)},
+            'farklı_isim_sayısı': distinct_names,
+            'farklı_departman_sayısı': int(np.count_nonzero(counts)),
+            'yaklaşık': self.approximate,
+        }
+        self._version = version
+        return dict(self._cached)
+    
+    def _sorted_percentiles(self, values: np.ndarray) -> List[float]:
+        """Sıralı dizide np.percentile ile aynı doğrusal ara değerli yüzdelikler"""
+        positions = np.asarray(self.PERCENTILES) / 100 * (len(values) - 1)
+        low = np.floor(positions).astype(np.int64)
+        high = np.minimum(low + 1, len(values) - 1)
+        return (values[low] + (values[high] - values[low]) * (positions - low)).tolist()
+
+
+class DataAnalyzer:
+    def __init__(self, data_manager: DataManager, approximate: bool = False):
+        self.data_manager = data_manager
+        self.stats_engine = StatisticsEngine(approximate)
+        # Bellek dışı veride kesin yüzdelik ve farklı isim sayısı tüm sütunu belleğe
+        # almayı gerektirir; bu yüzden orada her zaman taslaklı motor kullanılır
+        self.chunked_stats_engine = self.stats_engine if approximate else StatisticsEngine(True)
+        self.filter_engine = FilterEngine()
+        self.aggregation_engine = AggregationEngine()
+        self.query_compiler = QueryCompiler()
+        # Motorların önbellekleri arka plan görevleri arasında paylaşılır
+        self._lock = threading.RLock()
+    
+    def calculate_statistics(self) -> Dict:
+        """Kapsamlı istatistikler hesaplar"""
+        dataset, generation, version = self.data_manager.snapshot()
+        if not dataset:
+            return {}
+        
+        engine = self.chunked_stats_engine if isinstance(dataset, ChunkedDataset) else self.stats_engine
+        with self._lock, METRICS.stage('istatistik', len(dataset)):
+            return engine.statistics(dataset, generation, version)
+    
+    def aggregate(self, keys: Sequence[Union[str, Band]] = ('departman',),
+                  metrics: Sequence[str] = ('count', 'mean'),
+                  value_column: str = 'maaş',
+                  snapshot: Optional[tuple] = None) -> Optional[AggregationResult]:
+        """Gruplama sonucunu hesaplar (aynı veri sürümünde önbellekten döner)
+        
+        snapshot: DataManager.snapshot() üçlüsü; verilmezse o anki veri kullanılır.
+        """
+        dataset, _, version = snapshot or self.data_manager.snapshot()
+        if not dataset:
+            return None
+        
+        with self._lock, METRICS.stage('toplulaştırma', len(dataset)):
+            return self.aggregation_engine.aggregate(dataset, version,
+                                                     list(keys), list(metrics), value_column)
+    
+    def filter_data(self, column: str, condition: str, value: Union[float, str]) -> Sequence[Dict]:
+        """Veriyi filtreler (değer sütun tipine çevrilir, türetilmiş sütunlar desteklenir)"""
+        try:
+            predicate = self.query_compiler.condition(column, condition, value)
+        except QuerySyntaxError as e:
+            logging.warning(f"Filtre uygulanamadı: {e}")
+            return []
+        return self.query(predicate)
+    
+    def query(self, predicate: Union[Predicate, str]) -> Sequence[Dict]:
+        """Bileşik koşulu indekslerle değerlendirip eşleşen satırların görünümünü döndürür
+        
+        predicate bir sorgu metni de olabilir, ör. "maaş > 20000 and departman in ('IT', 'Satış')";
+        hatalı metinde QuerySyntaxError yükselir.
+        """
+        if isinstance(predicate, str):
+            predicate = self.query_compiler.compile(predicate)
+        dataset, generation, _ = self.data_manager.snapshot()
+        if not dataset:
+            return []
+        
+        with self._lock, METRICS.stage('filtre', len(dataset)):
+            try:
+                if isinstance(dataset, ChunkedDataset):
+                    rows = dataset.evaluate(predicate)
+                else:
+                    self.filter_engine.sync(dataset, generation)
+                    rows = self.filter_engine.evaluate(predicate)
+            except (KeyError, TypeError, ValueError) as e:
+                logging.warning(f"Filtre uygulanamadı: {e}")
+                rows = np.empty(0, dtype=np.intp)
+        return RecordView(dataset, rows)
+
+def format_report(stats: Dict, dept_stats: Optional[AggregationResult] = None) -> str:
+    """İstatistiklerden metin raporu oluşturur (arayüz ve toplu rapor ortak)"""
+    extra = ""
+    percentiles = stats.get('maaş_yüzdelikleri')
+    if percentiles:
+        marker = " (yaklaşık)" if stats.get('yaklaşık') else ""
+        extra = f"""
+        • Maaş p90 / p99{marker}: {percentiles['p90']:,.2f} ₺ / {percentiles['p99']:,.2f} ₺
+        • Farklı İsim / Departman: {stats.get('farklı_isim_sayısı', 0)} / {stats.get('farklı_departman_sayısı', 0)}"""
+    
+    report = f"""
+        📊 VERİ ANALİZ RAPORU
+        ⏰ Oluşturulma: {datetime.now().strftime("%d/%m/%Y %H:%M")}
+        {'='*50}
+        
+        TEMEL İSTATİSTİKLER:
+        • Toplam Çalışan: {stats.get('kişi_sayısı', 0)}
+        • Ortalama Maaş: {stats.get('ortalama_maaş', 0):,.2f} ₺
+        • Medyan Maaş: {stats.get('medyan_maaş', 0):,.2f} ₺
+        • En Yüksek Maaş: {stats.get('max_maaş', 0):,.2f} ₺
+        • En Düşük Maaş: {stats.get('min_maaş', 0):,.2f} ₺
+        • Ortalama Yaş: {stats.get('ortalama_yaş', 0):.1f}{extra}
+        
+        DEPARTMAN DAĞILIMI:
+        """
+    
+    for dept, count in stats.get('departman_dağılımı', {}).items():
+        report += f"        • {dept}: {count} çalışan\n"
     
-    def get_data_as_dataframe(self) -> pd.DataFrame:
-        """Veriyi pandas DataFrame olarak döndürür"""
-        if self.data:
-            return pd.DataFrame(self.data)
-        return pd.DataFrame()
+    if dept_stats:
+        report += "\n        DEPARTMAN ORTALAMA MAAŞLARI:\n"
+        for (dept,), mean in zip(dept_stats.groups, dept_stats.metrics['mean']):
+            report += f"        • {dept}: {mean:,.2f} ₺\n"
+    
+    return report
 
-# --- Analiz Sınıfı ---
-class DataAnalyzer:
-    def __init__(self, data_manager: DataManager):
-        self.data_manager = data_manager
+# --- Parçalı Paralel Toplulaştırma ---
+class PartialAggregate:
+    """Bir parçanın birleştirilebilir istatistikleri
     
-    def calculate_statistics(self) -> Dict:
-        """Kapsamlı istatistikler hesaplar"""
-        if not self.data_manager.data:
-            return {}
+    StatisticsEngine ile aynı toplamları tutar; departmanlar kod yerine adla
+    sayılır, böylece farklı süreçlerin sonuçları birleştirilebilir.
+    """
+    def __init__(self, rank_error: float = KLLSketch.DEFAULT_RANK_ERROR,
+                 distinct_error: float = HyperLogLog.DEFAULT_ERROR):
+        self.rows = 0
+        self.salary_sum = 0.0
+        self.salary_mean = 0.0
+        self.salary_m2 = 0.0
+        self.salary_min = np.inf
+        self.salary_max = -np.inf
+        self.age_sum = 0
+        self.dept_counts: Dict[str, int] = {}
+        self.salary_sketch = KLLSketch(rank_error)
+        self.name_sketch = HyperLogLog(distinct_error)
+        self.rejected: Dict[str, int] = {}
+        self.missing_columns: List[str] = []
+    
+    def update(self, columns: Dict[str, np.ndarray]):
+        """Doğrulanmış tipli sütunları toplamlara katar"""
+        salaries = columns['maaş']
+        batch = len(salaries)
+        if not batch:
+            return
         
-        df = self.data_manager.get_data_as_dataframe()
-        df['maaş'] = df['maaş'].astype(float)
-        df['yaş'] = df['yaş'].astype(int)
-        
-        stats = {
-            'ortalama_maaş': df['maaş'].mean(),
-            'medyan_maaş': df['maaş'].median(),
-            'toplam_maaş': df['maaş'].sum(),
-            'max_maaş': df['maaş'].max(),
-            'min_maaş': df['maaş'].min(),
-            'ortalama_yaş': df['yaş'].mean(),
-            'kişi_sayısı': len(df),
-            'departman_dağılımı': df['departman'].value_counts().to_dict()
-        }
+        batch_mean = salaries.mean()
+        self._combine_moments(batch, batch_mean, np.square(salaries - batch_mean).sum())
+        self.salary_sum += salaries.sum()
+        self.salary_min = min(self.salary_min, salaries.min())
+        self.salary_max = max(self.salary_max, salaries.max())
+        self.age_sum += int(columns['yaş'].sum(dtype=np.int64))
         
-        return stats
+        labels, first, counts = np.unique(columns['departman'].astype(str),
+                                          return_index=True, return_counts=True)
+        for position in np.argsort(first):  # ilk görülme sırasını koru
+            label = str(labels[position])
+            self.dept_counts[label] = self.dept_counts.get(label, 0) + int(counts[position])
+        self.salary_sketch.update(salaries)
+        self.name_sketch.update(columns['isim'])
+        self.rows += batch
     
-    def filter_data(self, column: str, condition: str, value: float) -> List[Dict]:
-        """Veriyi filtreler"""
-        if not self.data_manager.data:
-            return []
+    def add_report(self, report: ValidationReport):
+        """Parçanın doğrulama raporunu neden başına sayı olarak ekler"""
+        for reason, count in report.summary().items():
+            self.rejected[reason] = self.rejected.get(reason, 0) + count
+        for column in report.missing_columns:
+            if column not in self.missing_columns:
+                self.missing_columns.append(column)
+    
+    def _combine_moments(self, batch: int, batch_mean: float, batch_m2: float):
+        total = self.rows + batch
+        delta = batch_mean - self.salary_mean
+        self.salary_m2 += batch_m2 + delta * delta * self.rows * batch / total
+        self.salary_mean += delta * batch / total
+    
+    def merge(self, other: 'PartialAggregate'):
+        """Sonraki bir parçanın toplamlarını bu parçaya katar (sıra korunur)"""
+        if other.rows:
+            self._combine_moments(other.rows, other.salary_mean, other.salary_m2)
+            self.salary_sum += other.salary_sum
+            self.salary_min = min(self.salary_min, other.salary_min)
+            self.salary_max = max(self.salary_max, other.salary_max)
+            self.age_sum += other.age_sum
+            for label, count in other.dept_counts.items():
+                self.dept_counts[label] = self.dept_counts.get(label, 0) + count
+            self.salary_sketch.merge(other.salary_sketch)
+            self.name_sketch.merge(other.name_sketch)
+            self.rows += other.rows
+        for reason, count in other.rejected.items():
+            self.rejected[reason] = self.rejected.get(reason, 0) + count
+        for column in other.missing_columns:
+            if column not in self.missing_columns:
+                self.missing_columns.append(column)
+    
+    def statistics(self) -> Dict:
+        """calculate_statistics(approximate=True) ile aynı yapıda sonuç"""
+        if not self.rows:
+            return {}
         
-        filtered_data = []
-        for row in self.data_manager.data:
-            try:
-                row_value = float(row[column]) if column == 'maaş' else row[column]
-                
-                if condition == ">" and row_value > value:
-                    filtered_data.append(row)
-                elif condition == ">=" and row_value >= value:
-                    filtered_data.append(row)
-                elif condition == "<" and row_value < value:
-                    filtered_data.append(row)
-                elif condition == "<=" and row_value <= value:
-                    filtered_data.append(row)
-                elif condition == "==" and row_value == value:
-                    filtered_data.append(row)
-            except (ValueError, KeyError):
+        # value_counts gibi: çoktan aza, eşitlikte ilk görülme sırası
+        distribution = sorted(self.dept_counts.items(), key=lambda item: -item[1])
+        percentiles = self.salary_sketch.quantiles([p / 100 for p in StatisticsEngine.PERCENTILES])
+        return {
+            'ortalama_maaş': float(self.salary_sum / self.rows),
+            'medyan_maaş': percentiles[0],
+            'toplam_maaş': float(self.salary_sum),
+            'max_maaş': float(self.salary_max),
+            'min_maaş': float(self.salary_min),
+            'std_maaş': float(np.sqrt(self.salary_m2 / (self.rows - 1))) if self.rows > 1 else float('nan'),
+            'ortalama_yaş': self.age_sum / self.rows,
+            'kişi_sayısı': self.rows,
+            'departman_dağılımı': dict(distribution),
+            'maaş_yüzdelikleri': {f"p{p}": value
+                                  for p, value in zip(StatisticsEngine.PERCENTILES, percentiles)},
+            'farklı_isim_sayısı': self.name_sketch.count(),
+            'farklı_departman_sayısı': len(self.dept_counts),
+            'yaklaşık': True,
+        }
+
+
+def _read_range_blocks(path: str, start: int, end: int, block_bytes: int):
+    """[start, end) aralığında başlayan satırları satır sınırlı bloklar halinde okur
+    
+    Bir satır, ilk baytının düştüğü aralığa aittir: aralık satır ortasında
+    başlıyorsa o satır atlanır, sonda yarım kalan satır sonuna kadar okunur.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start - 1)
+        f.readline()  # start-1 bir satır sonuysa hiçbir şey atlanmaz
+        position = f.tell()
+        while position < end:
+            block = f.read(min(block_bytes, end - position))
+            if not block:
+                break
+            if not block.endswith(b'\n'):
+                block += f.readline()
+            position = f.tell()
+            yield block
+
+
+def _aggregate_shard(path: str, start: int, end: int, header: List[str],
+                     rules: Dict, block_bytes: int, rank_error: float,
+                     distinct_error: float) -> PartialAggregate:
+    """Bir dosya aralığını okuyup doğrular ve kısmi toplamları döndürür (işçi süreç)"""
+    validator = DataValidator(**rules)
+    partial = PartialAggregate(rank_error, distinct_error)
+    for block in _read_range_blocks(path, start, end, block_bytes):
+        frame = pd.read_csv(io.BytesIO(block), header=None, names=header,
+                            dtype=str, keep_default_na=False, encoding='utf-8')
+        report, columns = validator.validate_frame(frame)
+        partial.add_report(report)
+        if columns is None:
+            break
+        partial.update(columns)
+    return partial
+
+
+class ShardedAggregator:
+    """Çok sayıda ve/veya çok büyük CSV için süreçler arası paralel istatistik
+    
+    Girdiler dosya başına, büyük dosyalar da satır sınırına hizalanan bayt
+    aralıklarına bölünür; her işçi bir PartialAggregate üretir ve sonuçlar
+    parça sırasıyla birleştirilir. Sonuç calculate_statistics ile aynı yapıdadır.
+    """
+    SHARD_BYTES = 256 * 1024 * 1024
+    BLOCK_BYTES = 16 * 1024 * 1024
+    
+    def __init__(self, workers: Optional[int] = None, shard_bytes: int = SHARD_BYTES,
+                 block_bytes: int = BLOCK_BYTES, validator: Optional[DataValidator] = None,
+                 lenient: bool = False, rank_error: float = KLLSketch.DEFAULT_RANK_ERROR,
+                 distinct_error: float = HyperLogLog.DEFAULT_ERROR):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_bytes = shard_bytes
+        self.block_bytes = block_bytes
+        self.validator = validator or DataValidator()
+        self.lenient = lenient
+        self.rank_error = rank_error
+        self.distinct_error = distinct_error
+        self.result: Optional[PartialAggregate] = None
+    
+    def plan(self, paths: Iterable[str]) -> List[tuple]:
+        """(yol, başlangıç, bitiş, başlık) parçalarını üretir"""
+        shards = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                header_line = f.readline()
+            header = header_line.decode('utf-8-sig').strip().split(',')
+            data_start, size = len(header_line), os.path.getsize(path)
+            if size <= data_start:
                 continue
+            count = max(1, -(-(size - data_start) // self.shard_bytes))
+            bounds = np.linspace(data_start, size, count + 1).astype(np.int64)
+            shards.extend((path, int(bounds[i]), int(bounds[i + 1]), header)
+                          for i in range(count))
+        return shards
+    
+    def run(self, paths: Iterable[str]) -> Dict:
+        """Tüm girdilerin birleşik istatistiklerini hesaplar (hata varsa {} döner)"""
+        shards = self.plan(list(paths))
+        rules = self.validator.rules()
+        merged = PartialAggregate(self.rank_error, self.distinct_error)
+        workers = min(self.workers, len(shards)) or 1
+        logging.info(f"{len(shards)} parça {workers} işçiyle işleniyor")
+        
+        if workers == 1:
+            partials = (_aggregate_shard(*shard, rules, self.block_bytes,
+                                         self.rank_error, self.distinct_error)
+                        for shard in shards)
+            for partial in partials:
+                merged.merge(partial)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_aggregate_shard, *shard, rules, self.block_bytes,
+                                       self.rank_error, self.distinct_error)
+                           for shard in shards]
+                for future in futures:  # parça sırasıyla: departman eşitlik sırası korunur
+                    merged.merge(future.result())
         
-        return filtered_data
+        self.result = merged
+        for column in merged.missing_columns:
+            logging.error(f"Eksik sütun: {column}")
+        for reason, count in merged.rejected.items():
+            logging.error(f"{count} satır geçersiz ({reason})")
+        if merged.missing_columns or (merged.rejected and not self.lenient):
+            return {}
+        return merged.statistics()
 
 # --- Grafik Sınıfı ---
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets: görsel şekli koruyarak nokta seçer
+    
+    x artan sırada olmalıdır; seçilen noktaların indekslerini döndürür.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+    selected = np.empty(threshold, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        
+        # Önceki seçili nokta, aday ve sonraki kovanın ortalaması arasındaki üçgen alanı
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    
+    return selected
+
+
+def quantile_indices(values: np.ndarray, count: int) -> np.ndarray:
+    """Değer dağılımını koruyacak şekilde eşit aralıklı sıra istatistiklerini seçer"""
+    n = len(values)
+    if count >= n:
+        return np.arange(n)
+    order = np.argsort(values, kind='stable')
+    return np.sort(order[np.linspace(0, n - 1, count).round().astype(np.intp)])
+
+
+def top_indices(values: np.ndarray, count: int) -> np.ndarray:
+    """En büyük count değerin indeksleri (büyükten küçüğe)"""
+    count = min(count, len(values))
+    if count == 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(values, len(values) - count)[-count:]
+    return top[np.argsort(values[top])[::-1]]
+
+
+def column_histogram(dataset, column: str, bins: int) -> tuple:
+    """np.histogram(sütun, bins) ile aynı (sayılar, kenarlar); parçalı veride parça parça sayılır"""
+    if not isinstance(dataset, ChunkedDataset):
+        return np.histogram(dataset.column(column), bins=bins)
+    edges = np.histogram_bin_edges(np.asarray(dataset.column_range(column), dtype=np.float64), bins)
+    counts = np.zeros(bins, dtype=np.int64)
+    for _, chunk in dataset.chunks():
+        counts += np.histogram(chunk.column(column), bins=edges)[0]
+    return counts, edges
+
+
+def top_rows(dataset, column: str, count: int) -> np.ndarray:
+    """Sütunun en büyük count değerinin satır indeksleri (parçalı veride parça başına adaylardan)"""
+    if not isinstance(dataset, ChunkedDataset):
+        return top_indices(dataset.column(column), count)
+    candidates, values = [np.empty(0, dtype=np.int64)], [np.empty(0)]
+    for offset, chunk in dataset.chunks():
+        chunk_values = np.asarray(chunk.column(column))
+        top = top_indices(chunk_values, count)
+        candidates.append(top + offset)
+        values.append(chunk_values[top])
+    values = np.concatenate(values)
+    return np.concatenate(candidates)[top_indices(values, count)]
+
+
+class ChartBitmap:
+    """Arka planda rasterleştirilmiş grafik (Tk PhotoImage için PPM verisi)"""
+    def __init__(self, width: int, height: int, ppm: bytes):
+        self.width = width
+        self.height = height
+        self.ppm = ppm
+        self.photo = None  # ilk gösterimde ana iş parçacığında oluşturulur
+
+
+class ChartCache:
+    """(grafik türü, veri sürümü, boyut) anahtarlı LRU figür ve bitmap önbelleği
+    
+    Sınırı aşan figürler açıkça kapatılır. Aynı tür ve boyutta eski sürüme ait
+    figür, yeni sürüm için yeniden kullanılmak üzere önbellekten alınabilir.
+    """
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple) -> Optional[ChartBitmap]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def take_reusable(self, chart_type: str, size: tuple) -> Optional[Figure]:
+        """Aynı tür/boyuttaki en eski figürü önbellekten çıkarıp döndürür"""
+        with self._lock:
+            for key, (fig, _) in self._entries.items():
+                if key[0] == chart_type and key[2] == size:
+                    del self._entries[key]
+                    return fig
+        return None
+    
+    def put(self, key: tuple, fig: Figure, bitmap: ChartBitmap):
+        with self._lock:
+            self._entries[key] = (fig, bitmap)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._close(evicted)
+    
+    def clear(self):
+        with self._lock:
+            for fig, _ in self._entries.values():
+                self._close(fig)
+            self._entries.clear()
+    
+    @staticmethod
+    def _close(fig: Figure):
+        close_pyplot_figure(fig)
+        fig.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class ChartManager:
-    def __init__(self):
+    LARGE_DATA_THRESHOLD = 200   # bu satır sayısının üzerinde özet grafikler çizilir
+    HISTOGRAM_BINS = 50
+    HEXBIN_GRID = 50
+    SAMPLE_POINTS = 2000         # 'sample' modunda çizilecek nokta sayısı
+    OUTLIER_LABELS = 10          # büyük veride etiketlenecek en yüksek maaş sayısı
+    DPI = 100
+
+    def __init__(self, large_data_threshold: int = LARGE_DATA_THRESHOLD,
+                 scatter_mode: str = 'hexbin'):
         self.style = 'seaborn-v0_8'
-        plt.style.use(self.style)
+        self._style_applied = False  # matplotlib ilk figürde yüklenir
+        self.large_data_threshold = large_data_threshold
+        self.scatter_mode = scatter_mode  # büyük veride 'hexbin' ya da 'sample'
+        self.cache = ChartCache()
+        self._builders = {
+            'salary': self.build_salary_figure,
+            'age_salary': self.build_age_salary_figure,
+            'department': self.build_department_figure,
+        }
+    
+    def is_large(self, dataset: ColumnarDataset) -> bool:
+        return len(dataset) > self.large_data_threshold
     
-    def create_salary_chart(self, data: List[Dict], parent_frame=None):
+    def _dataset(self, data) -> ColumnarDataset:
+        """Veriyi sütunlu depoya çevirir; küçük parçalı veri doğrudan belleğe alınır"""
+        dataset = as_dataset(data)
+        if isinstance(dataset, ChunkedDataset) and not self.is_large(dataset):
+            dataset = dataset.take(np.arange(len(dataset)))
+        return dataset
+    
+    def _new_figure(self, figsize: tuple, managed: bool, fig: Optional[Figure] = None) -> Figure:
+        """pyplot'a bağlı (plt.show için) ya da iş parçacığı güvenli bağımsız figür
+        
+        fig verilirse yeni figür açılmaz; mevcut figür temizlenip yeniden kullanılır.
+        """
+        if fig is not None:
+            fig.clear()
+            fig.set_size_inches(figsize)
+            fig.chart_state = {}
+            return fig
+        if not self._style_applied:
+            mpl_style.use(self.style)
+            self._style_applied = True
+        if managed:
+            return plt.figure(figsize=figsize, dpi=self.DPI)
+        return mpl_figure.Figure(figsize=figsize, dpi=self.DPI)
+    
+    def render_chart(self, chart_type: str, data, version: int, figsize: tuple) -> ChartBitmap:
+        """Grafiği önbellek üzerinden hazırlar (arka plan iş parçacığında çağrılabilir)
+        
+        Aynı tür, sürüm ve boyut için önbellekteki bitmap döner; yoksa aynı tür
+        ve boyuttaki eski figür yeniden kullanılır, sanatçılar mümkünse yerinde
+        güncellenir.
+        """
+        size = tuple(round(value, 2) for value in figsize)
+        key = (chart_type, version, size)
+        bitmap = self.cache.get(key)
+        METRICS.cache('grafik_önbelleği', bitmap is not None)
+        if bitmap is not None:
+            return bitmap
+        
+        with METRICS.stage('çizim', len(data) if data is not None else 0):
+            fig = self._builders[chart_type](data, size, fig=self.cache.take_reusable(chart_type, size))
+            bitmap = self.render_bitmap(fig)
+        self.cache.put(key, fig, bitmap)
+        return bitmap
+    
+    def _present(self, fig: Figure, parent_frame):
+        if parent_frame:
+            self._embed_chart(fig, parent_frame)
+        else:
+            plt.show()
+    
+    def create_salary_chart(self, data: Union[ColumnarDataset, Sequence[Dict]], parent_frame=None):
         """Maaş grafiği oluşturur"""
-        fig, ax = plt.subplots(figsize=(10, 6))
+        self._present(self.build_salary_figure(data, managed=parent_frame is None), parent_frame)
+    
+    def build_salary_figure(self, data: Union[ColumnarDataset, Sequence[Dict]],
+                            figsize: tuple = (10, 6), managed: bool = False,
+                            fig: Optional[Figure] = None) -> Figure:
+        """Maaş grafiğinin figürünü hazırlar"""
+        dataset = self._dataset(data)
+        if (fig is not None and self.is_large(dataset)
+                and getattr(fig, 'chart_state', {}).get('mode') == 'histogram'):
+            self._update_salary_histogram(fig, dataset)
+            return fig
+        
+        fig = self._new_figure(figsize, managed, fig)
+        ax = fig.subplots()
+        
+        if self.is_large(dataset):
+            self._draw_salary_histogram(ax, dataset)
+        else:
+            self._draw_salary_bars(ax, dataset)
         
-        names = [row['isim'] for row in data]
-        salaries = [float(row['maaş']) for row in data]
+        fig.tight_layout()
+        return fig
+    
+    def _draw_salary_bars(self, ax, dataset: ColumnarDataset):
+        """Kişi başına bir çubuk (küçük veri)"""
+        names = dataset.names.tolist()
+        salaries = dataset.salaries
         
         bars = ax.bar(names, salaries, color='skyblue', edgecolor='navy', alpha=0.7)
         ax.set_title('Kişi Bazlı Maaş Dağılımı', fontsize=14, fontweight='bold')
@@ -154,81 +3318,543 @@ class ChartManager:
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height + 50,
                    f'{height:,.0f}₺', ha='center', va='bottom', fontweight='bold')
+    
+    def _draw_salary_histogram(self, ax, dataset: ColumnarDataset):
+        """Maaş histogramı ve en yüksek maaşlar için etiketler (büyük veri)"""
+        counts, edges = column_histogram(dataset, 'maaş', self.HISTOGRAM_BINS)
+        bars = ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                      color='skyblue', edgecolor='navy', alpha=0.7)
+        ax.set_title(f'Maaş Dağılımı ({len(dataset):,} kişi)', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Maaş (₺)', fontweight='bold')
+        ax.set_ylabel('Kişi Sayısı', fontweight='bold')
         
-        plt.tight_layout()
+        ax.figure.chart_state = {'mode': 'histogram', 'ax': ax, 'bars': bars,
+                                 'labels': self._label_top_salaries(ax, dataset)}
+    
+    def _label_top_salaries(self, ax, dataset: ColumnarDataset) -> List:
+        """Yalnızca en yüksek maaşları etiketle"""
+        return [ax.annotate(f"{dataset.names[i]} ({dataset.salaries[i]:,.0f}₺)",
+                            (dataset.salaries[i], 0), xytext=(0, 12 + 12 * rank),
+                            textcoords='offset points', fontsize=7, ha='right',
+                            arrowprops={'arrowstyle': '-', 'alpha': 0.4})
+                for rank, i in enumerate(top_rows(dataset, 'maaş', self.OUTLIER_LABELS))]
+    
+    def _update_salary_histogram(self, fig: Figure, dataset: ColumnarDataset):
+        """Mevcut histogram çubuklarını yeni veriyle yerinde günceller"""
+        state = fig.chart_state
+        ax = state['ax']
+        counts, edges = column_histogram(dataset, 'maaş', len(state['bars']))
+        for bar, left, width, height in zip(state['bars'], edges[:-1], np.diff(edges), counts):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
         
-        if parent_frame:
-            self._embed_chart(fig, parent_frame)
-        else:
-            plt.show()
+        for label in state['labels']:
+            label.remove()
+        state['labels'] = self._label_top_salaries(ax, dataset)
+        ax.set_title(f'Maaş Dağılımı ({len(dataset):,} kişi)', fontsize=14, fontweight='bold')
+        ax.relim()
+        ax.autoscale_view()
     
-    def create_age_salary_scatter(self, data: List[Dict], parent_frame=None):
+    def create_age_salary_scatter(self, data: Union[ColumnarDataset, Sequence[Dict]], parent_frame=None):
         """Yaş-Maaş dağılım grafiği"""
-        fig, ax = plt.subplots(figsize=(10, 6))
-        
-        ages = [int(row['yaş']) for row in data]
-        salaries = [float(row['maaş']) for row in data]
-        names = [row['isim'] for row in data]
+        self._present(self.build_age_salary_figure(data, managed=parent_frame is None), parent_frame)
+    
+    def build_age_salary_figure(self, data: Union[ColumnarDataset, Sequence[Dict]],
+                                figsize: tuple = (10, 6), managed: bool = False,
+                                fig: Optional[Figure] = None) -> Figure:
+        """Yaş-Maaş grafiğinin figürünü hazırlar"""
+        dataset = self._dataset(data)
+        mode = self._age_salary_mode(dataset)
+        if (fig is not None and mode != 'hexbin'
+                and getattr(fig, 'chart_state', {}).get('mode') == mode):
+            self._update_age_salary_scatter(fig, dataset)
+            return fig
         
-        scatter = ax.scatter(ages, salaries, c=salaries, cmap='viridis', s=100, alpha=0.7)
+        fig = self._new_figure(figsize, managed, fig)
+        ax = fig.subplots()
         
-        # Renk barı ekle
-        plt.colorbar(scatter, label='Maaş (₺)')
+        ages = dataset.ages
+        salaries = dataset.salaries
         
-        # İsim etiketleri
-        for i, name in enumerate(names):
-            ax.annotate(name, (ages[i], salaries[i]), xytext=(5, 5), 
-                       textcoords='offset points', fontsize=8)
+        if mode != 'hexbin':
+            rows, labelled = self._scatter_rows(dataset, mode)
+            scatter = ax.scatter(ages[rows], salaries[rows], c=salaries[rows], cmap='viridis',
+                                 s=100 if mode == 'scatter' else 20, alpha=0.7)
+            
+            # Renk barı ekle
+            fig.colorbar(scatter, ax=ax, label='Maaş (₺)')
+            fig.chart_state = {'mode': mode, 'ax': ax, 'scatter': scatter,
+                               'labels': self._annotate_rows(ax, dataset, labelled)}
+        else:
+            if isinstance(dataset, ChunkedDataset):
+                # Noktalar parça parça ince bir ızgarada sayılır; altıgenler bu sayıları toplar
+                cell_ages, cell_salaries, cell_counts = self._binned_points(dataset)
+                hexbin = ax.hexbin(cell_ages, cell_salaries, C=cell_counts, reduce_C_function=np.sum,
+                                   gridsize=self.HEXBIN_GRID, cmap='viridis', mincnt=1)
+            else:
+                hexbin = ax.hexbin(ages, salaries, gridsize=self.HEXBIN_GRID, cmap='viridis', mincnt=1)
+            fig.colorbar(hexbin, ax=ax, label='Kişi Sayısı')
+            self._annotate_rows(ax, dataset, top_rows(dataset, 'maaş', self.OUTLIER_LABELS))
         
         ax.set_title('Yaş - Maaş İlişkisi', fontsize=14, fontweight='bold')
         ax.set_xlabel('Yaş', fontweight='bold')
         ax.set_ylabel('Maaş (₺)', fontweight='bold')
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        
-        if parent_frame:
-            self._embed_chart(fig, parent_frame)
-        else:
-            plt.show()
+        fig.tight_layout()
+        return fig
+    
+    def _age_salary_mode(self, dataset: ColumnarDataset) -> str:
+        """Yaş-maaş grafiğinin çizim biçimi: 'scatter', 'sample' ya da 'hexbin'"""
+        if not self.is_large(dataset):
+            return 'scatter'
+        if self.scatter_mode == 'sample' and not isinstance(dataset, ChunkedDataset):
+            return 'sample'
+        return 'hexbin'
     
-    def create_department_chart(self, data: List[Dict], parent_frame=None):
-        """Departman bazlı maaş grafiği"""
-        df = pd.DataFrame(data)
-        df['maaş'] = df['maaş'].astype(float)
+    def _scatter_rows(self, dataset: ColumnarDataset, mode: str) -> tuple:
+        """Çizilecek satırlar ve isimle etiketlenecek satırlar"""
+        ages = dataset.ages
+        salaries = dataset.salaries
+        if mode == 'scatter':
+            rows = np.arange(len(dataset))
+            return rows, rows
+        # Yaşa göre sıralayıp LTTB ile görsel şekli koruyan örneklem çiz
+        order = np.lexsort((salaries, ages))
+        sample = order[lttb_indices(ages[order], salaries[order], self.SAMPLE_POINTS)]
+        return sample, top_indices(salaries, self.OUTLIER_LABELS)
+    
+    def _annotate_rows(self, ax, dataset: ColumnarDataset, rows) -> list:
+        """İsim etiketleri (büyük veride yalnızca en yüksek maaşlar)"""
+        ages = dataset.ages
+        salaries = dataset.salaries
+        names = dataset.names
+        return [ax.annotate(names[i], (ages[i], salaries[i]), xytext=(5, 5),
+                            textcoords='offset points', fontsize=8)
+                for i in rows]
+    
+    def _update_age_salary_scatter(self, fig: Figure, dataset: ColumnarDataset):
+        """Mevcut dağılım noktalarını set_offsets ile yerinde günceller"""
+        state = fig.chart_state
+        ax = state['ax']
+        scatter = state['scatter']
+        rows, labelled = self._scatter_rows(dataset, state['mode'])
+        points = np.column_stack((dataset.ages[rows], dataset.salaries[rows])).astype(float)
+        scatter.set_offsets(points)
+        scatter.set_array(dataset.salaries[rows])
+        scatter.autoscale()  # renk ölçeği ve renk barı yeni maaş aralığına uyar
         
-        dept_stats = df.groupby('departman')['maaş'].agg(['mean', 'count']).reset_index()
+        for label in state['labels']:
+            label.remove()
+        state['labels'] = self._annotate_rows(ax, dataset, labelled)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        # relim koleksiyonları görmez; veri sınırları noktalardan yeniden kurulur
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(points)
+        ax.autoscale_view()
+    
+    def _binned_points(self, dataset: ChunkedDataset) -> tuple:
+        """Yaş-maaş çiftlerini parça parça sayar: dolu hücrelerin (yaş, maaş, sayı) dizileri"""
+        age_low, age_high = dataset.column_range('yaş')
+        age_edges = np.arange(age_low, age_high + 2) - 0.5  # yaşlar tam sayı: her yaş bir sütun
+        salary_edges = np.histogram_bin_edges(
+            np.asarray(dataset.column_range('maaş'), dtype=np.float64), self.HEXBIN_GRID * 10)
+        grid = np.zeros((len(age_edges) - 1, len(salary_edges) - 1), dtype=np.int64)
+        for _, chunk in dataset.chunks():
+            grid += np.histogram2d(chunk.ages, chunk.salaries,
+                                   bins=(age_edges, salary_edges))[0].astype(np.int64)
+        age_cells, salary_cells = np.nonzero(grid)
+        return (age_edges[age_cells] + 0.5,
+                (salary_edges[salary_cells] + salary_edges[salary_cells + 1]) / 2,
+                grid[age_cells, salary_cells])
+    
+    def create_department_chart(self, data: Union[ColumnarDataset, Sequence[Dict], AggregationResult],
+                                parent_frame=None):
+        """Departman bazlı maaş grafiği (hazır departman gruplaması da verilebilir)"""
+        self._present(self.build_department_figure(data, managed=parent_frame is None), parent_frame)
+    
+    def build_department_figure(self, data: Union[ColumnarDataset, Sequence[Dict], AggregationResult],
+                                figsize: tuple = (12, 5), managed: bool = False,
+                                fig: Optional[Figure] = None) -> Figure:
+        """Departman grafiğinin figürünü hazırlar"""
+        if isinstance(data, AggregationResult):
+            dept_stats = data
+        else:
+            dept_stats = group_aggregate(as_dataset(data), ['departman'], ['mean', 'count'])
+        dept_names = dept_stats.column('departman')
+        dept_means = dept_stats.metrics['mean']
+        dept_counts = dept_stats.metrics['count']
         
-        # Ortalama maaş
-        ax1.bar(dept_stats['departman'], dept_stats['mean'], color='lightcoral')
-        ax1.set_title('Departman Bazlı Ortalama Maaş')
-        ax1.set_ylabel('Ortalama Maaş (₺)')
-        ax1.tick_params(axis='x', rotation=45)
+        state = getattr(fig, 'chart_state', {}) if fig is not None else {}
+        if state.get('mode') == 'department' and state['names'] == dept_names:
+            # Aynı departmanlar: çubukları yerinde güncelle, yalnızca pastayı yeniden çiz
+            ax1, ax2 = state['axes']
+            for bar, mean in zip(state['bars'], dept_means):
+                bar.set_height(mean)
+            ax1.relim()
+            ax1.autoscale_view()
+            ax2.clear()
+        else:
+            fig = self._new_figure(figsize, managed, fig)
+            ax1, ax2 = fig.subplots(1, 2)
+            
+            # Ortalama maaş
+            bars = ax1.bar(dept_names, dept_means, color='lightcoral')
+            ax1.set_title('Departman Bazlı Ortalama Maaş')
+            ax1.set_ylabel('Ortalama Maaş (₺)')
+            ax1.tick_params(axis='x', rotation=45)
+            fig.chart_state = {'mode': 'department', 'names': dept_names,
+                               'axes': (ax1, ax2), 'bars': bars}
         
         # Çalışan sayısı
-        ax2.pie(dept_stats['count'], labels=dept_stats['departman'], autopct='%1.1f%%')
+        ax2.pie(dept_counts, labels=dept_names, autopct='%1.1f%%')
         ax2.set_title('Departman Çalışan Dağılımı')
         
-        plt.tight_layout()
+        fig.tight_layout()
+        return fig
+    
+    def figsize_for(self, parent_frame, default: tuple = (10, 6)) -> tuple:
+        """Çerçevenin piksel boyutuna uyan figür boyutu (inç); ana iş parçacığında çağrılır"""
+        width, height = parent_frame.winfo_width(), parent_frame.winfo_height()
+        if width < 100 or height < 100:
+            return default
+        return width / self.DPI, height / self.DPI
+    
+    def render_bitmap(self, fig: Figure) -> ChartBitmap:
+        """Figürü Agg ile rasterleştirir; arka plan iş parçacığında güvenle çağrılabilir"""
+        canvas = backend_agg.FigureCanvasAgg(fig)
+        canvas.draw()
+        rgba = np.asarray(canvas.buffer_rgba())
+        height, width = rgba.shape[:2]
+        header = f"P6 {width} {height} 255\n".encode('ascii')
+        return ChartBitmap(width, height, header + rgba[..., :3].tobytes())
+    
+    def show_bitmap(self, bitmap: ChartBitmap, parent_frame):
+        """Hazır bitmap'i çerçeveye yerleştirir (yalnızca ana iş parçacığında)
         
-        if parent_frame:
-            self._embed_chart(fig, parent_frame)
-        else:
-            plt.show()
+        Ana iş parçacığı yalnızca PPM'i çözer, yeniden rasterleştirmez. Çerçevede
+        önceki bir grafik etiketi varsa yeniden kullanılır; önbellekten gelen
+        bitmap'in PhotoImage'ı tekrar çözülmez.
+        """
+        with METRICS.stage('yerleştirme'):
+            if bitmap.photo is None:
+                bitmap.photo = tk.PhotoImage(data=bitmap.ppm, format='PPM')
+            
+            label = getattr(parent_frame, 'chart_label', None)
+            if label is None or not label.winfo_exists():
+                for widget in parent_frame.winfo_children():
+                    widget.destroy()
+                label = parent_frame.chart_label = tk.Label(parent_frame, borderwidth=0, padx=0,
+                                                            pady=0, highlightthickness=0)
+                label.pack(fill=tk.BOTH, expand=True)
+            label.configure(image=bitmap.photo)
+            label.image = bitmap.photo  # referansı tut, yoksa görüntü çöpe gider
+            parent_frame.chart_pixels = (bitmap.width, bitmap.height)
     
     def _embed_chart(self, fig, parent_frame):
-        """Grafiği Tkinter'a göm"""
+        """Grafiği Tkinter'a göm (çerçevedeki tuval aynı figür için yeniden kullanılır)"""
+        canvas = getattr(parent_frame, 'chart_canvas', None)
+        if canvas is not None and canvas.figure is fig and canvas.get_tk_widget().winfo_exists():
+            canvas.draw_idle()
+            return
+        
         for widget in parent_frame.winfo_children():
             widget.destroy()
+        if canvas is not None and canvas.figure is not fig:
+            close_pyplot_figure(canvas.figure)
         
-        canvas = FigureCanvasTkAgg(fig, parent_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        with METRICS.stage('yerleştirme'):
+            canvas = parent_frame.chart_canvas = backend_tkagg.FigureCanvasTkAgg(fig, parent_frame)
+            canvas.draw()
+            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+# --- Arka Plan Görev Katmanı ---
+class TaskCancelled(Exception):
+    """Görev kullanıcı tarafından iptal edildi"""
+
+
+class Task:
+    """Arka planda çalışan tek bir iş; iptal ve ilerleme bildirimi sağlar"""
+    def __init__(self, runner: 'TaskRunner', group: Optional[str],
+                 on_done: Optional[Callable], on_error: Optional[Callable],
+                 on_progress: Optional[Callable]):
+        self.runner = runner
+        self.group = group
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future = None
+        self._cancelled = threading.Event()
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def cancel(self):
+        """İşi iptal eder; çalışıyorsa bir sonraki kontrol noktasında durur"""
+        self._cancelled.set()
+        if self.future is not None and self.future.cancel():
+            # Kuyrukta bekleyen iş hiç başlamayacak; _run mesaj gönderemez, burada bildirilir
+            self.runner._messages.put((self, 'cancelled', None))
+    
+    def check_cancelled(self):
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+    
+    def report_progress(self, *args):
+        """İlerlemeyi ana döngüye iletir (aynı zamanda iptal kontrol noktasıdır)"""
+        self.check_cancelled()
+        self.runner._messages.put((self, 'progress', args))
+
+
+class TaskRunner:
+    """İşleri iş parçacığı havuzunda çalıştırır, sonuçları root.after ile Tk döngüsüne taşır
+    
+    İş fonksiyonu ilk argüman olarak Task alır; geri çağrılar (on_done, on_error,
+    on_progress) her zaman Tk iş parçacığında çalışır. İptal edilen işlerin
+    sonuçları atılır.
+    """
+    POLL_INTERVAL_MS = 16      # ~60 fps
+    POLL_BUDGET = 0.008        # bir yoklamada mesaj işlemeye ayrılan süre (sn)
+
+    def __init__(self, root, max_workers: int = 2):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='analiz')
+        self._messages: queue.Queue = queue.Queue()
+        self._active: List[Task] = []
+        self._polling = False
+    
+    def submit(self, func: Callable, *args, group: Optional[str] = None,
+               on_done: Optional[Callable] = None, on_error: Optional[Callable] = None,
+               on_progress: Optional[Callable] = None) -> Task:
+        """func(task, *args) işini arka planda başlatır"""
+        task = Task(self, group, on_done, on_error, on_progress)
+        self._active.append(task)
+        task.future = self._executor.submit(self._run, task, func, args)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
+        return task
+    
+    def _run(self, task: Task, func: Callable, args: tuple):
+        try:
+            task.check_cancelled()
+            result = METRICS.profile(func, task, *args)
+            self._messages.put((task, 'done', result))
+        except TaskCancelled:
+            self._messages.put((task, 'cancelled', None))
+        except Exception as e:
+            logging.error(f"Arka plan görevi hatası: {e}")
+            self._messages.put((task, 'error', e))
+    
+    def cancel_group(self, group: str):
+        """Bir gruptaki (ör. açık ekrana ait) tüm işleri iptal eder"""
+        for task in self._active:
+            if task.group == group:
+                task.cancel()
+    
+    def is_busy(self, group: str) -> bool:
+        """Grupta iptal edilmemiş, bitmemiş iş var mı"""
+        return any(task.group == group and not task.cancelled for task in self._active)
+    
+    def shutdown(self):
+        for task in self._active:
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _poll(self):
+        try:
+            self._dispatch()
+        finally:
+            # Bir geri çağrı hata verse de yoklama sürmeli, yoksa sonraki sonuçlar kaybolur
+            if self._active or not self._messages.empty():
+                self.root.after(self.POLL_INTERVAL_MS, self._poll)
+            else:
+                self._polling = False
+    
+    def _dispatch(self):
+        deadline = time.perf_counter() + self.POLL_BUDGET
+        progress: Dict[Task, tuple] = {}
+        while time.perf_counter() < deadline:
+            try:
+                task, kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'progress':
+                # Aynı yoklamadaki ara ilerlemelerden yalnızca sonuncusu çizilir
+                progress[task] = payload
+                continue
+            
+            progress.pop(task, None)
+            if task in self._active:
+                self._active.remove(task)
+            if task.cancelled or kind == 'cancelled':
+                continue
+            callback = task.on_done if kind == 'done' else task.on_error
+            if callback:
+                self._call(callback, payload)
+        
+        for task, payload in progress.items():
+            if task.on_progress and not task.cancelled:
+                self._call(task.on_progress, *payload)
+    
+    @staticmethod
+    def _call(callback: Callable, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            logging.exception(f"Görev geri çağrısı hatası: {e}")
+
+# --- Sanal Sonuç Tablosu ---
+class ResultCursor:
+    """Filtre sonucunun satır indeksleri üzerinde sıralama ve sayfalama (Tk'den bağımsız)"""
+    def __init__(self, view: Optional[RecordView] = None):
+        self.dataset = view.dataset if view is not None else None
+        if view is None:
+            self.indices = np.empty(0, dtype=np.intp)
+        elif view.indices is None:
+            self.indices = np.arange(len(view.dataset))
+        else:
+            self.indices = view.indices
+        self.sort_column: Optional[str] = None
+        self.descending = False
+    
+    def __len__(self) -> int:
+        return len(self.indices)
+    
+    def sort_by(self, column: str, descending: Optional[bool] = None):
+        """Satırları kopyalamadan yalnızca indeks sırasını değiştirir"""
+        if descending is None:
+            descending = column == self.sort_column and not self.descending
+        if self.dataset is None or not len(self.indices):
+            return
+        
+        if column == 'departman':
+            # Alfabetik sıralama için kategori kodlarını ad sırasına çevir
+            departments = self.dataset.departments
+            ranking = np.empty(len(departments), dtype=np.int64)
+            ranking[sorted(range(len(departments)), key=departments.__getitem__)] = np.arange(len(departments))
+            keys = ranking[self.dataset.dept_codes[self.indices]]
+        elif column == 'isim':
+            # Sabit genişlikli unicode'a çevirmek nesne karşılaştırmasından çok daha hızlı
+            keys = self.dataset.names[self.indices].astype(str)
+        else:
+            keys = self.dataset.column(column)[self.indices]
+        
+        order = np.argsort(keys, kind='stable')
+        if descending:
+            order = order[::-1]
+        self.indices = self.indices[order]
+        self.sort_column = column
+        self.descending = descending
+    
+    def rows(self, offset: int, count: int) -> List[Dict[str, str]]:
+        """Yalnızca [offset, offset+count) penceresindeki satırları oluşturur"""
+        return [self.dataset.record(i) for i in self.indices[offset:offset + count]]
+
+
+class VirtualResultTable:
+    """Yalnızca görünen pencereyi çizen sanal, sıralanabilir sonuç tablosu"""
+    COLUMNS = ('isim', 'yaş', 'maaş', 'departman')
+    HEADINGS = {'isim': 'İsim', 'yaş': 'Yaş', 'maaş': 'Maaş', 'departman': 'Departman'}
+    ROW_HEIGHT = 20
+    
+    def __init__(self, parent, visible_rows: int = 15):
+        self.cursor = ResultCursor()
+        self.offset = 0
+        self.visible_rows = visible_rows
+        
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=self.COLUMNS, show='headings',
+                                 height=visible_rows, selectmode='browse')
+        for column in self.COLUMNS:
+            self.tree.heading(column, text=self.HEADINGS[column],
+                              command=lambda c=column: self.sort_by(c))
+            self.tree.column(column, width=150, anchor=tk.W)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._on_scroll)
+        
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll_to(self.offset - e.delta // 40))
+        self.tree.bind('<Button-4>', lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_to(self.offset + 3))
+        self.tree.bind('<Configure>', self._on_resize)
+        self._render()
+    
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+    
+    def set_result(self, view: Optional[RecordView]):
+        """Yeni filtre sonucunu gösterir; yalnızca ilk pencere oluşturulur"""
+        self.cursor = ResultCursor(view)
+        self.offset = 0
+        self._update_headings()
+        self._render()
+    
+    def sort_by(self, column: str):
+        self.cursor.sort_by(column)
+        self.offset = 0
+        self._update_headings()
+        self._render()
+    
+    def scroll_to(self, offset: int):
+        max_offset = max(len(self.cursor) - self.visible_rows, 0)
+        offset = min(max(int(offset), 0), max_offset)
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+    
+    def _on_scroll(self, action: str, amount: str, unit: Optional[str] = None):
+        if action == 'moveto':
+            self.scroll_to(float(amount) * len(self.cursor))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.scroll_to(self.offset + int(amount) * step)
+    
+    def _on_resize(self, event):
+        rows = max((event.height - self.ROW_HEIGHT) // self.ROW_HEIGHT, 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.tree.configure(height=rows)
+            self.scroll_to(self.offset)
+            self._render()
+    
+    def _update_headings(self):
+        for column in self.COLUMNS:
+            arrow = ''
+            if column == self.cursor.sort_column:
+                arrow = ' ▼' if self.cursor.descending else ' ▲'
+            self.tree.heading(column, text=self.HEADINGS[column] + arrow)
+    
+    def _render(self):
+        """Görünen satır öğelerini yeniden kullanarak yalnızca değerlerini günceller"""
+        rows = self.cursor.rows(self.offset, self.visible_rows)
+        items = self.tree.get_children()
+        for i, row in enumerate(rows):
+            values = [row[column] for column in self.COLUMNS]
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert('', tk.END, values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        
+        total = len(self.cursor)
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(rows)) / total)
+        else:
+            self.scrollbar.set(0, 1)
 
 # --- Modern Tkinter Arayüzü ---
 class ModernDataAnalysisApp:
+    DEFAULT_LOAD_DELAY_MS = 300
+    WATCH_INTERVAL_MS = 2000     # canlı izlemede dosya kontrol aralığı
+    RESIZE_DELAY_MS = 250        # pencere boyutu bu süre değişmeyince grafik yeniden hazırlanır
+    RESIZE_TOLERANCE = 4         # piksel; bu kadarlık fark için yeniden çizilmez
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🏢 Profesyonel Veri Analiz Sistemi")
@@ -242,6 +3868,9 @@ class ModernDataAnalysisApp:
         self.data_manager = DataManager()
         self.analyzer = DataAnalyzer(self.data_manager)
         self.chart_manager = ChartManager()
+        self.tasks = TaskRunner(root)
+        self.current_view: Optional[Callable] = None  # veri değişince yeniden çizilecek ekran
+        self._watch_job = None
         
         # Ana frame
         self.main_frame = ttk.Frame(root, padding="10")
@@ -251,8 +3880,8 @@ class ModernDataAnalysisApp:
         self.create_sidebar()
         self.create_main_content()
         
-        # Varsayılan veriyi yükle
-        self.load_default_data()
+        # Varsayılan veri, karşılama ekranı çizildikten sonra yüklenir
+        self.root.after(self.DEFAULT_LOAD_DELAY_MS, self.load_default_data)
     
     def setup_styles(self):
         """Modern stil konfigürasyonu"""
@@ -306,7 +3935,8 @@ class ModernDataAnalysisApp:
             ("🔍 Gelişmiş Filtre", self.show_advanced_filter),
             ("📊 Rapor Oluştur", self.generate_report),
             ("🔄 Veri Yükle", self.load_custom_data),
-            ("❌ Çıkış", self.root.quit)
+            ("🩺 Tanılama", self.show_diagnostics),
+            ("❌ Çıkış", self.quit)
         ]
         
         for text, command in buttons:
@@ -315,6 +3945,18 @@ class ModernDataAnalysisApp:
                       command=command,
                       style='Accent.TButton').pack(fill=tk.X, pady=5, padx=5)
         
+        # Canlı izleme: dosyaya eklenen satırlar otomatik yüklenir
+        self.watch_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.sidebar, text="👁️ Dosyayı İzle", variable=self.watch_var,
+                        command=self.toggle_watch).pack(fill=tk.X, pady=(15, 0), padx=5)
+        self.watch_status = ttk.Label(self.sidebar, text="", font=('Arial', 9))
+        self.watch_status.pack(fill=tk.X, padx=5)
+        
+        # Bellekten büyük dosyalar diskte parça parça tutulur (çok büyük dosyalarda otomatik)
+        self.out_of_core_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.sidebar, text="💾 Bellek Dışı Mod",
+                        variable=self.out_of_core_var).pack(fill=tk.X, pady=(10, 0), padx=5)
+        
         # Ana içerik alanı
         self.content_area = ttk.Frame(content_frame, style='Card.TFrame')
         self.content_area.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
@@ -341,20 +3983,92 @@ class ModernDataAnalysisApp:
         self.welcome_label.pack(expand=True, padx=20, pady=20)
     
     def load_default_data(self):
-        """Varsayılan veriyi yükle"""
-        if not self.data_manager.load_data("veri.csv"):
-            messagebox.showerror("Hata", "Varsayılan veri dosyası yüklenemedi!")
+        """Varsayılan veriyi arka planda yükle"""
+        def on_done(loaded: bool):
+            if not loaded:
+                messagebox.showerror("Hata", "Varsayılan veri dosyası yüklenemedi!")
+        
+        self.tasks.submit(lambda task: self.data_manager.load_data("veri.csv"),
+                          group='load', on_done=on_done)
+    
+    def quit(self):
+        """Arka plan işlerini durdurup uygulamadan çık"""
+        self.tasks.shutdown()
+        self.root.quit()
     
     def clear_content(self):
-        """İçerik alanını temizle"""
-        for widget in self.content_area.winfo_children():
+        """Açık ekranın işlerini iptal et ve içerik alanını temizle"""
+        self.tasks.cancel_group('screen')
+        self.current_view = None
+        self.clear_widgets(self.content_area)
+    
+    def toggle_watch(self):
+        """Canlı izlemeyi açar ya da kapatır"""
+        if self._watch_job is not None:
+            self.root.after_cancel(self._watch_job)
+            self._watch_job = None
+        if self.watch_var.get():
+            self.watch_status.config(text="İzleniyor...")
+            self.poll_source()
+        else:
+            self.watch_status.config(text="")
+    
+    def poll_source(self):
+        """İzlenen dosyayı arka planda kontrol eder; değiştiyse açık ekranı yeniler"""
+        self._watch_job = None
+        if not self.watch_var.get():
+            return
+        
+        def schedule_next(_=None):
+            if self.watch_var.get() and self._watch_job is None:
+                self._watch_job = self.root.after(self.WATCH_INTERVAL_MS, self.poll_source)
+        
+        def on_done(status: str):
+            if status in ('eklendi', 'yeniden_yüklendi'):
+                rows = len(self.data_manager.dataset)
+                self.watch_status.config(text=f"{datetime.now():%H:%M:%S} · {rows:,} kayıt")
+                if self.current_view:
+                    self.current_view()
+            elif status == 'izlenmiyor':
+                self.watch_status.config(text="İzlenecek dosya yok")
+            schedule_next()
+        
+        if self.tasks.is_busy('load') or self.tasks.is_busy('watch'):
+            schedule_next()
+            return
+        self.tasks.submit(lambda task: self.data_manager.refresh(), group='watch',
+                          on_done=on_done, on_error=schedule_next)
+    
+    def clear_widgets(self, frame):
+        for widget in frame.winfo_children():
             widget.destroy()
     
+    def show_busy(self, parent, text: str = "Hesaplanıyor..."):
+        """Arka plan işi sürerken dönen ilerleme göstergesi"""
+        busy_frame = ttk.Frame(parent)
+        busy_frame.pack(expand=True, padx=20, pady=20)
+        ttk.Label(busy_frame, text=text, font=('Arial', 12)).pack(pady=(0, 10))
+        progress_bar = ttk.Progressbar(busy_frame, mode='indeterminate', length=300)
+        progress_bar.pack()
+        progress_bar.start(15)
+        return busy_frame
+    
+    def show_task_error(self, error: Exception):
+        messagebox.showerror("Hata", f"İşlem başarısız: {error}")
+    
     def show_statistics(self):
         """İstatistikleri göster"""
         self.clear_content()
+        self.current_view = self.show_statistics
+        self.show_busy(self.content_area)
+        
+        self.tasks.submit(lambda task: self.analyzer.calculate_statistics(), group='screen',
+                          on_done=self.render_statistics, on_error=self.show_task_error)
+    
+    def render_statistics(self, stats: Dict):
+        """İstatistik kartlarını çiz (Tk iş parçacığında)"""
+        self.clear_widgets(self.content_area)
         
-        stats = self.analyzer.calculate_statistics()
         if not stats:
             ttk.Label(self.content_area, text="Veri yüklenemedi!").pack()
             return
@@ -380,11 +4094,62 @@ class ModernDataAnalysisApp:
             ttk.Label(card, text=label, font=('Arial', 10)).pack(pady=(10, 5))
             ttk.Label(card, text=value, font=('Arial', 14, 'bold')).pack(pady=(0, 10))
     
+    def render_chart_async(self, parent_frame, chart_type: str, get_data: Callable,
+                           default_size: tuple, busy: bool = True):
+        """Grafiği önbellek üzerinden arka planda hazırlar, sonucu çerçeveye yerleştirir
+        
+        get_data(snapshot) işçide DataManager.snapshot() üçlüsünden grafiğin
+        verisini üretir. Çerçeve yeniden boyutlanınca grafik yeni boyutta yine
+        arka planda rasterleştirilir; o sırada eski bitmap ekranda kalır.
+        """
+        if busy:
+            self.show_busy(parent_frame, "Grafik hazırlanıyor...")
+            self.root.update_idletasks()
+        figsize = self.chart_manager.figsize_for(parent_frame, default_size)
+        # Veri ve sürüm birlikte alınır; işçi arada gelen eklemeyi eski sürümün anahtarına yazmasın
+        snapshot = self.data_manager.snapshot()
+        version = snapshot[2]
+        
+        def work(task: Task):
+            data = get_data(snapshot)
+            task.check_cancelled()
+            return self.chart_manager.render_chart(chart_type, data, version, figsize)
+        
+        def on_done(bitmap: ChartBitmap):
+            self.chart_manager.show_bitmap(bitmap, parent_frame)
+            if not getattr(parent_frame, 'resize_bound', False):
+                parent_frame.resize_bound = True
+                parent_frame.bind('<Configure>', lambda event: self.schedule_chart_resize(
+                    parent_frame, chart_type, get_data, default_size), add='+')
+        
+        self.tasks.submit(work, group='screen', on_done=on_done, on_error=self.show_task_error)
+    
+    def schedule_chart_resize(self, parent_frame, chart_type: str, get_data: Callable,
+                              default_size: tuple):
+        """Boyut değişikliği durulunca grafiği yeni boyutta yeniden hazırlar"""
+        job = getattr(parent_frame, 'resize_job', None)
+        if job is not None:
+            self.root.after_cancel(job)
+        
+        def rerender():
+            parent_frame.resize_job = None
+            if not parent_frame.winfo_exists():
+                return
+            width, height = getattr(parent_frame, 'chart_pixels', (0, 0))
+            if (abs(parent_frame.winfo_width() - width) <= self.RESIZE_TOLERANCE
+                    and abs(parent_frame.winfo_height() - height) <= self.RESIZE_TOLERANCE):
+                return
+            self.render_chart_async(parent_frame, chart_type, get_data, default_size, busy=False)
+        
+        parent_frame.resize_job = self.root.after(self.RESIZE_DELAY_MS, rerender)
+    
     def show_salary_analysis(self):
         """Maaş analizi göster"""
         self.clear_content()
+        self.current_view = self.show_salary_analysis
         
-        if not self.data_manager.data:
+        dataset = self.data_manager.dataset
+        if not dataset:
             ttk.Label(self.content_area, text="Veri yüklenemedi!").pack()
             return
         
@@ -399,29 +4164,34 @@ class ModernDataAnalysisApp:
         # Maaş grafiği sekmesi
         salary_tab = ttk.Frame(notebook)
         notebook.add(salary_tab, text="Maaş Dağılımı")
-        self.chart_manager.create_salary_chart(self.data_manager.data, salary_tab)
+        self.render_chart_async(salary_tab, 'salary', lambda snapshot: snapshot[0], (10, 6))
         
         # Yaş-Maaş sekmesi
         age_salary_tab = ttk.Frame(notebook)
         notebook.add(age_salary_tab, text="Yaş-Maaş İlişkisi")
-        self.chart_manager.create_age_salary_scatter(self.data_manager.data, age_salary_tab)
+        self.render_chart_async(age_salary_tab, 'age_salary', lambda snapshot: snapshot[0], (10, 6))
     
     def show_department_analysis(self):
         """Departman analizi"""
         self.clear_content()
+        self.current_view = self.show_department_analysis
         
-        if not self.data_manager.data:
+        if not self.data_manager.dataset:
             ttk.Label(self.content_area, text="Veri yüklenemedi!").pack()
             return
         
         chart_frame = ttk.Frame(self.content_area)
         chart_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.chart_manager.create_department_chart(self.data_manager.data, chart_frame)
+        self.render_chart_async(
+            chart_frame, 'department',
+            lambda snapshot: self.analyzer.aggregate(['departman'], ['count', 'mean'],
+                                                     snapshot=snapshot), (12, 5))
     
     def show_advanced_filter(self):
         """Gelişmiş filtreleme"""
         self.clear_content()
+        last_query: List[Predicate] = []  # canlı izlemede yeniden çalıştırılacak son sorgu
         
         filter_frame = ttk.Frame(self.content_area)
         filter_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -429,17 +4199,28 @@ class ModernDataAnalysisApp:
         ttk.Label(filter_frame, text="Gelişmiş Filtreleme", 
                  font=('Arial', 16, 'bold')).pack(pady=(0, 20))
         
+        # Serbest sorgu: ör. maaş > 20000 and departman in ('IT', 'Satış') and yaş between 25 and 40
+        query_frame = ttk.Frame(filter_frame)
+        query_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(query_frame, text="Sorgu:").pack(side=tk.LEFT, padx=5)
+        query_entry = ttk.Entry(query_frame)
+        query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        query_entry.insert(0, "maaş > 20000 and departman in ('IT', 'Satış') and yaş between 25 and 40")
+        ttk.Label(filter_frame, foreground='gray',
+                  text="Sütunlar: " + ", ".join(self.analyzer.query_compiler.column_names)
+                       + " · and/or/not, in (...), between ... and ...").pack(anchor=tk.W)
+        
         # Filtre kontrolleri
         control_frame = ttk.Frame(filter_frame)
         control_frame.pack(fill=tk.X, pady=10)
         
         ttk.Label(control_frame, text="Sütun:").grid(row=0, column=0, padx=5)
-        column_combo = ttk.Combobox(control_frame, values=['maaş', 'yaş', 'departman'])
+        column_combo = ttk.Combobox(control_frame, values=['maaş', 'yaş', 'departman', 'yıllık_maaş'])
         column_combo.grid(row=0, column=1, padx=5)
         column_combo.set('maaş')
         
         ttk.Label(control_frame, text="Koşul:").grid(row=0, column=2, padx=5)
-        condition_combo = ttk.Combobox(control_frame, values=['>', '>=', '<', '<=', '=='])
+        condition_combo = ttk.Combobox(control_frame, values=['>', '>=', '<', '<=', '==', '!='])
         condition_combo.grid(row=0, column=3, padx=5)
         condition_combo.set('>')
         
@@ -447,55 +4228,134 @@ class ModernDataAnalysisApp:
         value_entry = ttk.Entry(control_frame)
         value_entry.grid(row=0, column=5, padx=5)
         
-        result_text = tk.Text(filter_frame, height=15, width=80)
-        result_text.pack(fill=tk.BOTH, expand=True, pady=10)
+        count_label = ttk.Label(filter_frame, text="", font=('Arial', 11, 'bold'))
+        count_label.pack(anchor=tk.W, pady=(10, 0))
+        
+        result_table = VirtualResultTable(filter_frame)
+        result_table.pack(fill=tk.BOTH, expand=True, pady=10)
+        
+        def show_result(filtered: Sequence[Dict]):
+            if filtered:
+                count_label.config(text=f"Bulunan {len(filtered):,} kayıt:")
+            else:
+                count_label.config(text="Filtreye uygun kayıt bulunamadı.")
+            result_table.set_result(filtered if isinstance(filtered, RecordView) else None)
+        
+        def run_query(predicate: Predicate):
+            # Önceki sorgu hâlâ sürüyorsa sonucunu bekleme
+            last_query[:] = [predicate]
+            self.tasks.cancel_group('screen')
+            count_label.config(text="Filtreleniyor...")
+            self.tasks.submit(lambda task: self.analyzer.query(predicate),
+                              group='screen', on_done=show_result, on_error=self.show_task_error)
         
         def apply_filter():
             try:
-                column = column_combo.get()
-                condition = condition_combo.get()
-                value = float(value_entry.get()) if column in ['maaş', 'yaş'] else value_entry.get()
-                
-                filtered = self.analyzer.filter_data(column, condition, value)
-                
-                result_text.delete(1.0, tk.END)
-                if filtered:
-                    result_text.insert(tk.END, f"Bulunan {len(filtered)} kayıt:\n\n")
-                    for row in filtered:
-                        result_text.insert(tk.END, f"İsim: {row['isim']}, Yaş: {row['yaş']}, Maaş: {row['maaş']}, Departman: {row['departman']}\n")
-                else:
-                    result_text.insert(tk.END, "Filtreye uygun kayıt bulunamadı.")
-                    
-            except ValueError:
+                predicate = self.analyzer.query_compiler.condition(
+                    column_combo.get(), condition_combo.get(), value_entry.get())
+            except QuerySyntaxError:
                 messagebox.showerror("Hata", "Geçerli bir değer girin!")
+                return
+            run_query(predicate)
+        
+        def apply_query(event=None):
+            # Derleme ucuz ve önbellekli; sözdizimi hatası hemen gösterilsin diye burada yapılır
+            try:
+                predicate = self.analyzer.query_compiler.compile(query_entry.get())
+            except QuerySyntaxError as e:
+                messagebox.showerror("Sorgu Hatası", str(e))
+                return
+            run_query(predicate)
         
         ttk.Button(control_frame, text="Filtre Uygula", 
                   command=apply_filter).grid(row=0, column=6, padx=10)
+        ttk.Button(query_frame, text="Sorgula", command=apply_query).pack(side=tk.LEFT, padx=5)
+        query_entry.bind('<Return>', apply_query)
+        
+        def refresh_view():
+            # Veri değişince ekranı baştan kurmak yerine son sorguyu yeni veride yeniden çalıştır
+            if last_query:
+                run_query(last_query[0])
+        
+        self.current_view = refresh_view
     
     def generate_report(self):
         """Rapor oluştur"""
-        stats = self.analyzer.calculate_statistics()
+        def work(task: Task):
+            return (self.analyzer.calculate_statistics(),
+                    self.analyzer.aggregate(['departman'], ['count', 'mean']))
         
-        report = f"""
-        📊 VERİ ANALİZ RAPORU
-        ⏰ Oluşturulma: {datetime.now().strftime("%d/%m/%Y %H:%M")}
-        {'='*50}
+        self.tasks.submit(work, on_done=lambda result: self.show_report(*result),
+                          on_error=self.show_task_error)
+    
+    def show_report(self, stats: Dict, dept_stats: Optional[AggregationResult]):
+        """Hazır istatistiklerden rapor penceresini göster"""
+        messagebox.showinfo("Analiz Raporu", format_report(stats, dept_stats))
+    
+    def show_diagnostics(self):
+        """Aşama süreleri, önbellek isabetleri, bellek ve son profil çıktısı"""
+        self.clear_content()
+        self.current_view = self.show_diagnostics
         
-        TEMEL İSTATİSTİKLER:
-        • Toplam Çalışan: {stats.get('kişi_sayısı', 0)}
-        • Ortalama Maaş: {stats.get('ortalama_maaş', 0):,.2f} ₺
-        • Medyan Maaş: {stats.get('medyan_maaş', 0):,.2f} ₺
-        • En Yüksek Maaş: {stats.get('max_maaş', 0):,.2f} ₺
-        • En Düşük Maaş: {stats.get('min_maaş', 0):,.2f} ₺
-        • Ortalama Yaş: {stats.get('ortalama_yaş', 0):.1f}
+        panel = ttk.Frame(self.content_area)
+        panel.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        ttk.Label(panel, text="Tanılama", font=('Arial', 16, 'bold')).pack(anchor=tk.W)
         
-        DEPARTMAN DAĞILIMI:
-        """
+        controls = ttk.Frame(panel)
+        controls.pack(fill=tk.X, pady=10)
+        enabled = tk.BooleanVar(value=METRICS.enabled)
+        
+        def toggle():
+            if enabled.get():
+                METRICS.enable()
+            else:
+                METRICS.disable()
+        
+        def reset():
+            METRICS.reset()
+            self.show_diagnostics()
+        
+        def arm_profile():
+            METRICS.profile_next()
+            profile_label.config(text="Sıradaki arka plan işi profillenecek...")
+        
+        ttk.Checkbutton(controls, text="Ölçüm açık", variable=enabled,
+                        command=toggle).pack(side=tk.LEFT)
+        ttk.Button(controls, text="Yenile", command=self.show_diagnostics).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Sıfırla", command=reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Sonraki işi profille",
+                   command=arm_profile).pack(side=tk.LEFT, padx=5)
+        
+        snapshot = METRICS.snapshot()
+        columns = ('çağrı', 'toplam', 'ortalama', 'en_uzun', 'hız', 'rss')
+        table = ttk.Treeview(panel, columns=columns, height=8)
+        table.heading('#0', text='Aşama')
+        for column, title in zip(columns, ('Çağrı', 'Toplam ms', 'Ort. ms', 'En uzun ms',
+                                           'Satır/sn', 'RSS artışı MB')):
+            table.heading(column, text=title)
+            table.column(column, width=90, anchor=tk.E)
+        for name, stats in snapshot['aşamalar'].items():
+            speed = f"{stats['satır_per_sn']:,.0f}" if stats['satır_per_sn'] else "-"
+            table.insert('', tk.END, text=name, values=(
+                stats['çağrı'], f"{stats['toplam_sn'] * 1000:,.1f}",
+                f"{stats['ortalama_sn'] * 1000:,.1f}", f"{stats['en_uzun_sn'] * 1000:,.1f}",
+                speed, f"{stats['rss_artışı'] / 2**20:,.1f}"))
+        table.pack(fill=tk.X)
         
-        for dept, count in stats.get('departman_dağılımı', {}).items():
-            report += f"        • {dept}: {count} çalışan\n"
+        caches = ", ".join(f"{name}: %{stats['oran'] * 100:.0f} ({stats['isabet']}/{stats['isabet'] + stats['ıska']})"
+                           for name, stats in snapshot['önbellekler'].items()) or "-"
+        memory = snapshot['bellek']
+        ttk.Label(panel, text=f"Önbellek isabetleri: {caches}", wraplength=600).pack(anchor=tk.W, pady=(10, 0))
+        ttk.Label(panel, text=f"Bellek: {memory['rss'] / 2**20:,.0f} MB "
+                              f"(en yüksek {memory['en_yüksek_rss'] / 2**20:,.0f} MB)").pack(anchor=tk.W)
         
-        messagebox.showinfo("Analiz Raporu", report)
+        profile_label = ttk.Label(panel, text="Son profil:" if METRICS.last_profile else "")
+        profile_label.pack(anchor=tk.W, pady=(10, 0))
+        if METRICS.last_profile:
+            profile_text = tk.Text(panel, height=12, font=('Courier', 9), wrap=tk.NONE)
+            profile_text.insert('1.0', METRICS.last_profile)
+            profile_text.config(state=tk.DISABLED)
+            profile_text.pack(fill=tk.BOTH, expand=True)
     
     def load_custom_data(self):
         """Özel veri yükle"""
@@ -506,16 +4366,83 @@ class ModernDataAnalysisApp:
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         
-        if filename and self.data_manager.load_data(filename):
+        if filename:
+            self.start_load(filename)
+    
+    def start_load(self, filename: str, lenient: bool = False):
+        """Dosyayı arka planda yükler; ilerleme çubuğu ana döngüde güncellenir"""
+        self.tasks.cancel_group('load')
+        update_progress = self.create_progress_display()
+        if not self.out_of_core_var.get() and DataManager.needs_out_of_core(filename):
+            self.out_of_core_var.set(True)
+        out_of_core = self.out_of_core_var.get()
+        
+        def work(task: Task) -> bool:
+            return self.data_manager.load_data(filename, lenient=lenient, out_of_core=out_of_core,
+                                               progress_callback=task.report_progress)
+        
+        self.tasks.submit(work, group='load', on_progress=update_progress,
+                          on_done=lambda loaded: self.finish_load(filename, lenient, loaded),
+                          on_error=self.show_task_error)
+    
+    def finish_load(self, filename: str, lenient: bool, loaded: bool):
+        """Yükleme sonucunu kullanıcıya bildir"""
+        if self.progress_frame.winfo_exists():
+            # Kullanıcı bu arada başka ekrana geçmediyse karşılama ekranına dön
+            self.clear_widgets(self.content_area)
+            self.create_main_content()
+        
+        if loaded and lenient:
+            rejected = len(self.data_manager.quarantine) if self.data_manager.quarantine is not None else 0
+            messagebox.showinfo("Başarılı", f"Veri yüklendi, {rejected} satır karantinaya alındı.")
+            return
+        if loaded:
             messagebox.showinfo("Başarılı", "Veri başarıyla yüklendi!")
-        elif filename:
-            messagebox.showerror("Hata", "Veri yüklenemedi!")
+            return
+        
+        report = self.data_manager.last_report
+        if not lenient and report and not report.missing_columns and report.summary():
+            details = "\n".join(f"• {reason}: {count}" for reason, count in report.summary().items())
+            if messagebox.askyesno("Geçersiz Satırlar",
+                                   f"Dosyada geçersiz satırlar var:\n{details}\n\n"
+                                   "Geçersiz satırlar atlanarak yüklensin mi?"):
+                self.start_load(filename, lenient=True)
+                return
+        
+        messagebox.showerror("Hata", "Veri yüklenemedi!")
+    
+    def create_progress_display(self) -> Callable[[int, int, int], None]:
+        """Yükleme ilerlemesini gösteren çubuğu kurar ve güncelleme fonksiyonunu döndürür"""
+        self.clear_content()
+        
+        progress_frame = self.progress_frame = ttk.Frame(self.content_area)
+        progress_frame.pack(expand=True, padx=20, pady=20)
+        
+        status_label = ttk.Label(progress_frame, text="Veri yükleniyor...", font=('Arial', 12))
+        status_label.pack(pady=(0, 10))
+        progress_bar = ttk.Progressbar(progress_frame, length=400, maximum=100)
+        progress_bar.pack()
+        
+        def update(rows: int, bytes_read: int, total_bytes: int):
+            if not progress_bar.winfo_exists():
+                return
+            progress_bar['value'] = 100 * bytes_read / total_bytes if total_bytes else 100
+            status_label.config(text=f"Veri yükleniyor... {rows:,} kayıt")
+        
+        return update
 
 # --- Ana Program ---
+_IMPORT_END = time.perf_counter()
+
 if __name__ == "__main__":
+    setup_logging()
     try:
         root = tk.Tk()
         app = ModernDataAnalysisApp(root)
+        if '--startup-profile' in sys.argv:
+            root.update()
+            print("İlk pencere hazır\n" + startup_report())
+            atexit.register(lambda: print("Çıkışta\n" + startup_report()))
         root.mainloop()
     except Exception as e:
         logging.critical(f"Uygulama hatası: {e}")
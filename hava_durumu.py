@@ -1,35 +1,299 @@
+import atexit
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 
-def hava_durumu_getir(sehir):
-    API_KEY = "YOUR_API_KEY_HERE"  # 🔑 Buraya kendi OpenWeather API anahtarını yaz
-    url = f"https://api.openweathermap.org/data/2.5/weather?q={sehir}&appid={API_KEY}&units=metric&lang=tr"
+API_KEY = "YOUR_API_KEY_HERE"  # 🔑 Buraya kendi OpenWeather API anahtarını yaz
+API_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+ZAMAN_ASIMI = (3.05, 10)        # (bağlantı, okuma) saniye
+ES_ZAMANLI_ISTEK = 16           # toplu sorguda aynı anda en fazla istek
+DENEME_SAYISI = 4               # ilk istek + yeniden denemeler
+BEKLEME_TABANI = 0.5            # üstel geri çekilme tabanı (saniye)
+BEKLEME_TAVANI = 8.0            # tek beklemenin üst sınırı; Retry-After da buna kırpılır
+TEKRAR_DENENECEK_KODLAR = {429, 500, 502, 503, 504}
+
+ONBELLEK_TTL = 600              # taze kabul süresi (saniye)
+BAYAT_TTL = 1800                # TTL sonrası arka planda yenilenirken bayat yanıt verme süresi
+ONBELLEK_KAPASITE = 1000        # LRU sınırı (şehir sayısı)
+ONBELLEK_DOSYASI = os.environ.get("HAVA_ONBELLEK_DOSYASI")  # yeniden başlatmada sıcak kalmak için
+
+
+class YanitOnbellegi:
+    """TTL ve LRU sınırlı yanıt önbelleği
+
+    Aynı anahtar için eş zamanlı istekler tek bir uçuştaki isteği paylaşır;
+    TTL dolmuş ama bayat süresi içindeki girdiler hemen döndürülüp arka planda
+    yenilenir. Zaman damgaları duvar saatidir, böylece diske yazılabilir.
+    """
+
+    def __init__(self, ttl=ONBELLEK_TTL, bayat_ttl=BAYAT_TTL, kapasite=ONBELLEK_KAPASITE,
+                 dosya=None, saat=time.time):
+        self.ttl = ttl
+        self.bayat_ttl = bayat_ttl
+        self.kapasite = kapasite
+        self.dosya = dosya
+        self.saat = saat
+        self._girdiler = OrderedDict()   # anahtar -> (değer, kayıt zamanı)
+        self._ucustakiler = {}           # anahtar -> Future
+        self._kilit = threading.Lock()
+        self.sayaclar = {"isabet": 0, "bayat_isabet": 0, "iskalama": 0,
+                         "birlestirilen": 0, "yenileme": 0}
+        if dosya:
+            self.yukle()
+            atexit.register(self.kaydet)
+
+    def getir(self, anahtar, getirici, saklanir=lambda deger: True):
+        """Önbellekten döndürür; yoksa getirici() ile bir kez getirip saklar"""
+        with self._kilit:
+            girdi = self._girdiler.get(anahtar)
+            if girdi is not None:
+                deger, zaman = girdi
+                yas = self.saat() - zaman
+                if yas < self.ttl:
+                    self._girdiler.move_to_end(anahtar)
+                    self.sayaclar["isabet"] += 1
+                    return deger
+                if yas < self.ttl + self.bayat_ttl:
+                    self._girdiler.move_to_end(anahtar)
+                    self.sayaclar["bayat_isabet"] += 1
+                    if anahtar not in self._ucustakiler:
+                        self.sayaclar["yenileme"] += 1
+                        self._ucustakiler[anahtar] = Future()
+                        threading.Thread(target=self._arka_planda_yenile,
+                                         args=(anahtar, getirici, saklanir), daemon=True).start()
+                    return deger
+
+            bekleyen = self._ucustakiler.get(anahtar)
+            if bekleyen is not None:
+                self.sayaclar["birlestirilen"] += 1
+            else:
+                self.sayaclar["iskalama"] += 1
+                self._ucustakiler[anahtar] = Future()
+
+        if bekleyen is not None:
+            return bekleyen.result()
+        return self._getir_ve_sakla(anahtar, getirici, saklanir)
+
+    def _arka_planda_yenile(self, anahtar, getirici, saklanir):
+        try:
+            self._getir_ve_sakla(anahtar, getirici, saklanir)
+        except Exception:
+            pass  # yenileme başarısızsa bayat girdi süresi dolana kadar kullanılmaya devam eder
+
+    def _getir_ve_sakla(self, anahtar, getirici, saklanir):
+        gelecek = self._ucustakiler[anahtar]
+        try:
+            deger = getirici()
+        except Exception as e:
+            with self._kilit:
+                del self._ucustakiler[anahtar]
+            gelecek.set_exception(e)
+            raise
+        with self._kilit:
+            if saklanir(deger):
+                self._girdiler[anahtar] = (deger, self.saat())
+                self._girdiler.move_to_end(anahtar)
+                while len(self._girdiler) > self.kapasite:
+                    self._girdiler.popitem(last=False)
+            del self._ucustakiler[anahtar]
+        gelecek.set_result(deger)
+        return deger
+
+    def istatistikler(self):
+        """Sayaçlar, isabet oranı ve doluluk"""
+        sayaclar = dict(self.sayaclar)
+        toplam = sayaclar["isabet"] + sayaclar["bayat_isabet"] + sayaclar["iskalama"]
+        sayaclar["isabet_orani"] = ((sayaclar["isabet"] + sayaclar["bayat_isabet"]) / toplam
+                                    if toplam else 0.0)
+        sayaclar["girdi"] = len(self._girdiler)
+        return sayaclar
+
+    def temizle(self):
+        with self._kilit:
+            self._girdiler.clear()
+
+    def kaydet(self):
+        """Süresi tamamen dolmamış girdileri JSON dosyasına yazar"""
+        if not self.dosya:
+            return
+        simdi = self.saat()
+        with self._kilit:
+            girdiler = [[anahtar, deger, zaman] for anahtar, (deger, zaman) in self._girdiler.items()
+                        if simdi - zaman < self.ttl + self.bayat_ttl]
+        gecici = f"{self.dosya}.tmp"
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump(girdiler, f, ensure_ascii=False)
+        os.replace(gecici, self.dosya)
+
+    def yukle(self):
+        """Kaydedilmiş girdileri yükler (dosya yoksa ya da bozuksa boş başlar)"""
+        try:
+            with open(self.dosya, encoding="utf-8") as f:
+                girdiler = json.load(f)
+        except (OSError, ValueError):
+            return
+        simdi = self.saat()
+        with self._kilit:
+            for anahtar, deger, zaman in girdiler[-self.kapasite:]:
+                if simdi - zaman < self.ttl + self.bayat_ttl:
+                    self._girdiler[anahtar] = (deger, zaman)
+
+
+ONBELLEK = YanitOnbellegi(dosya=ONBELLEK_DOSYASI)
+
+
+def oturum_olustur(baglanti_sayisi=ES_ZAMANLI_ISTEK):
+    """Bağlantıları (keep-alive) yeniden kullanan paylaşımlı oturum oluşturur"""
+    oturum = requests.Session()
+    adaptor = HTTPAdapter(pool_connections=baglanti_sayisi, pool_maxsize=baglanti_sayisi)
+    oturum.mount("https://", adaptor)
+    oturum.mount("http://", adaptor)
+    return oturum
+
+
+def bekleme_suresi(deneme, yanit=None):
+    """Retry-After başlığına ya da üstel geri çekilmeye (+rastgele pay) göre bekleme
 
+    Sunucu ne isterse istesin bekleme BEKLEME_TAVANI'nı aşmaz.
+    """
+    if yanit is not None:
+        retry_after = yanit.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), BEKLEME_TAVANI)
+    return min(BEKLEME_TABANI * (2 ** deneme) * (1 + random.random() / 2), BEKLEME_TAVANI)
+
+
+def veriyi_ayristir(data):
+    """OpenWeather yanıtından kullanılan alanları çıkarır"""
+    return {
+        "ad": data["name"],
+        "sicaklik": data["main"]["temp"],
+        "aciklama": data["weather"][0]["description"].capitalize(),
+        "ruzgar": data["wind"]["speed"],
+        "nem": data["main"]["humidity"],
+    }
+
+
+def hava_durumu_sorgula(sehir, oturum=None, api_url=API_URL, api_key=API_KEY,
+                        zaman_asimi=ZAMAN_ASIMI, deneme_sayisi=DENEME_SAYISI):
+    """Tek şehir için hava durumunu sorgular ve yapılandırılmış sonuç döndürür
+
+    Sonuç: {"sehir", "durum" ("tamam" / "bulunamadi" / "hata"), "kod", "veri",
+    "hata", "deneme", "sure"}. 429 ve 5xx yanıtlarında geri çekilerek yeniden dener.
+    """
+    oturum = oturum or requests
+    parametreler = {"q": sehir, "appid": api_key, "units": "metric", "lang": "tr"}
+    sonuc = {"sehir": sehir, "durum": "hata", "kod": None, "veri": None, "hata": None,
+             "deneme": 0, "sure": 0.0}
+    baslangic = time.perf_counter()
+
+    for deneme in range(deneme_sayisi):
+        sonuc["deneme"] = deneme + 1
+        yanit = None
+        try:
+            yanit = oturum.get(api_url, params=parametreler, timeout=zaman_asimi)
+            sonuc["kod"] = yanit.status_code
+            if yanit.status_code == 200:
+                sonuc["durum"], sonuc["veri"], sonuc["hata"] = "tamam", veriyi_ayristir(yanit.json()), None
+                break
+            if yanit.status_code == 404:
+                sonuc["durum"], sonuc["hata"] = "bulunamadi", None
+                break
+            sonuc["hata"] = yanit.text[:200]
+            if yanit.status_code not in TEKRAR_DENENECEK_KODLAR:
+                break
+        except requests.exceptions.RequestException as e:
+            sonuc["hata"] = f"Bağlantı hatası: {e}"
+        except (ValueError, KeyError, IndexError) as e:
+            sonuc["hata"] = f"Beklenmeyen yanıt: {e}"
+            break
+
+        if deneme + 1 < deneme_sayisi:
+            time.sleep(bekleme_suresi(deneme, yanit))
+
+    sonuc["sure"] = time.perf_counter() - baslangic
+    return sonuc
+
+
+def onbellekli_sorgula(sehir, oturum=None, onbellek=ONBELLEK, **secenekler):
+    """hava_durumu_sorgula'nın önbellekli hali (hata yanıtları saklanmaz)"""
+    if onbellek is None:
+        return hava_durumu_sorgula(sehir, oturum, **secenekler)
+    anahtar = f"{secenekler.get('api_url', API_URL)}|{sehir.strip().casefold()}"
+    return onbellek.getir(anahtar,
+                          lambda: hava_durumu_sorgula(sehir, oturum, **secenekler),
+                          saklanir=lambda sonuc: sonuc["durum"] != "hata")
+
+
+def hava_durumlari_getir(sehirler, es_zamanli=ES_ZAMANLI_ISTEK, oturum=None,
+                         onbellek=ONBELLEK, **secenekler):
+    """Şehir listesini paylaşımlı oturumla eş zamanlı sorgular
+
+    Sonuçlar girdi sırasıyla döner; toplam süre en yavaş isteğe yakındır
+    (şehir sayısı es_zamanli sınırını aşmadıkça).
+    """
+    sehirler = list(sehirler)
+    if not sehirler:
+        return []
+
+    kendi_oturumu = oturum is None
+    oturum = oturum or oturum_olustur(es_zamanli)
     try:
-        response = requests.get(url)
-        data = response.json()
-
-        if response.status_code == 200:
-            print(f"\n🌆 Şehir: {data['name']}")
-            print(f"🌡️ Sıcaklık: {data['main']['temp']}°C")
-            print(f"☁️ Hava Durumu: {data['weather'][0]['description'].capitalize()}")
-            print(f"💨 Rüzgar Hızı: {data['wind']['speed']} m/s")
-            print(f"💧 Nem Oranı: {data['main']['humidity']}%")
-        elif response.status_code == 404:
-            print("⚠️ Şehir bulunamadı. Lütfen doğru bir şehir adı girin.")
-        else:
-            print("❌ Bir hata oluştu:", data)
-    except requests.exceptions.RequestException as e:
-        print("🌐 Bağlantı hatası:", e)
+        with ThreadPoolExecutor(max_workers=min(es_zamanli, len(sehirler))) as havuz:
+            return list(havuz.map(lambda sehir: onbellekli_sorgula(sehir, oturum, onbellek,
+                                                                   **secenekler),
+                                  sehirler))
+    finally:
+        if kendi_oturumu:
+            oturum.close()
+
+
+def sonucu_yazdir(sonuc):
+    if sonuc["durum"] == "tamam":
+        veri = sonuc["veri"]
+        print(f"\n🌆 Şehir: {veri['ad']}")
+        print(f"🌡️ Sıcaklık: {veri['sicaklik']}°C")
+        print(f"☁️ Hava Durumu: {veri['aciklama']}")
+        print(f"💨 Rüzgar Hızı: {veri['ruzgar']} m/s")
+        print(f"💧 Nem Oranı: {veri['nem']}%")
+    elif sonuc["durum"] == "bulunamadi":
+        print(f"⚠️ Şehir bulunamadı ({sonuc['sehir']}). Lütfen doğru bir şehir adı girin.")
+    elif sonuc["kod"] is None:
+        print("🌐", sonuc["hata"])
+    else:
+        print("❌ Bir hata oluştu:", sonuc["hata"])
+
+
+def hava_durumu_getir(sehir):
+    sonuc = onbellekli_sorgula(sehir)
+    sonucu_yazdir(sonuc)
+    return sonuc
 
 
 def main():
     print("=== 🌦️ HAVA DURUMU UYGULAMASI ===")
     while True:
-        sehir = input("\nŞehir adı girin (Çıkmak için 'q'): ").strip()
-        if sehir.lower() == "q":
+        girdi = input("\nŞehir adı girin (birden fazlası için virgülle ayırın, çıkmak için 'q'): ").strip()
+        if girdi.lower() == "q":
+            sayaclar = ONBELLEK.istatistikler()
+            print(f"Önbellek: {sayaclar['isabet']} isabet, {sayaclar['bayat_isabet']} bayat, "
+                  f"{sayaclar['iskalama']} ıskalama")
             print("Görüşürüz 👋")
             break
-        hava_durumu_getir(sehir)
+        sehirler = [sehir.strip() for sehir in girdi.split(",") if sehir.strip()]
+        if len(sehirler) == 1:
+            hava_durumu_getir(sehirler[0])
+        else:
+            for sonuc in hava_durumlari_getir(sehirler):
+                sonucu_yazdir(sonuc)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+"""Kıyaslama: analiz hattının aşamalarını sentetik verilerle ölçer.
+
+Her boyut ayrı bir süreçte (temiz bellek ile) çalıştırılır; sonuçlar JSON
+olarak yazılır ve isteğe bağlı olarak kayıtlı bir taban çizgisiyle karşılaştırılır.
+
+Örnek:
+    python kiyaslama.py --sizes 1e3 1e5 1e6 -o sonuc.json
+    python kiyaslama.py --sizes 1e6 --baseline kiyaslama_taban.json   # gerilemede çıkış kodu 1
+    python kiyaslama.py --sizes 1e5 --save-baseline kiyaslama_taban.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')  # ekran olmadan çizim; finans modülünden önce seçilmeli
+
+import numpy as np
+import pandas as pd
+
+import veri_analiz
+from finans_yonetim_sistemi import (DataManager, DataAnalyzer, DataValidator, ChartManager,
+                                    Condition, current_rss)
+
+TEMEL_DEPARTMANLAR = ['IT', 'Satış', 'Yönetim', 'İnsan Kaynakları', 'Muhasebe']
+URETIM_BLOK = 1_000_000
+GERILEME_ESIGI = 1.25             # taban süresinin bu katından yavaşsa gerileme
+LISTE_TABANLI_SINIR = 1_000_000   # veri_analiz'in liste tabanlı fonksiyonları için üst sınır
+GECERSIZ_DEGERLER = [('yaş', 'x'), ('yaş', '150'), ('departman', ''), ('maaş', '-1'), ('isim', '')]
+
+
+# --- Veri Üretici ---
+def departman_adlari(sayi):
+    """İlk beşi gerçek departman adları, fazlası numaralı"""
+    return (TEMEL_DEPARTMANLAR + [f"Departman {i:03d}" for i in range(len(TEMEL_DEPARTMANLAR), sayi)])[:sayi]
+
+
+def veri_uret(yol, satir, departman_sayisi=5, gecersiz_orani=0.0, tohum=42):
+    """isim,yaş,maaş,departman şemasında tohumlu CSV üretir (bloklar halinde, sabit bellek)"""
+    rng = np.random.default_rng(tohum)
+    departmanlar = np.array(departman_adlari(departman_sayisi), dtype=object)
+    gecici = f"{yol}.tmp"
+    with open(gecici, 'w', encoding='utf-8', newline='') as f:
+        f.write('isim,yaş,maaş,departman\n')
+        for bas in range(0, satir, URETIM_BLOK):
+            n = min(URETIM_BLOK, satir - bas)
+            blok = pd.DataFrame({
+                'isim': [f"Kişi {i}" for i in range(bas, bas + n)],
+                'yaş': rng.integers(20, 66, n).astype(str).astype(object),
+                'maaş': rng.integers(8000, 60001, n).astype(str).astype(object),
+                'departman': departmanlar[rng.integers(0, len(departmanlar), n)],
+            })
+            if gecersiz_orani:
+                bozuk = np.flatnonzero(rng.random(n) < gecersiz_orani)
+                turler = rng.integers(0, len(GECERSIZ_DEGERLER), len(bozuk))
+                for tur, (sutun, deger) in enumerate(GECERSIZ_DEGERLER):
+                    blok.loc[bozuk[turler == tur], sutun] = deger
+            blok.to_csv(f, header=False, index=False, lineterminator='\n')
+    os.replace(gecici, yol)
+
+
+def veri_dosyasi(klasor, satir, departman_sayisi, gecersiz_orani, tohum):
+    """Parametrelere göre adlandırılmış veri dosyasını gerekirse üretir"""
+    ad = f"veri_{satir}_{departman_sayisi}d_{gecersiz_orani:g}g_{tohum}t.csv"
+    yol = os.path.join(klasor, ad)
+    if not os.path.exists(yol):
+        baslangic = time.perf_counter()
+        veri_uret(yol, satir, departman_sayisi, gecersiz_orani, tohum)
+        print(f"  {ad} üretildi ({time.perf_counter() - baslangic:.1f} sn)", file=sys.stderr)
+    return yol
+
+
+# --- Ölçüm ---
+class BellekIzleyici:
+    """Bir aşama boyunca RSS'i arka planda örnekleyip en yüksek değeri tutar"""
+
+    def __init__(self, aralik=0.005):
+        self.aralik = aralik
+        self.en_yuksek = 0
+        self._dur = threading.Event()
+
+    def _ornekle(self):
+        while not self._dur.wait(self.aralik):
+            self.en_yuksek = max(self.en_yuksek, current_rss())
+
+    def __enter__(self):
+        self.en_yuksek = current_rss()
+        self._is = threading.Thread(target=self._ornekle, daemon=True)
+        self._is.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._dur.set()
+        self._is.join()
+        self.en_yuksek = max(self.en_yuksek, current_rss())
+
+
+def olc(sonuclar, satir, asama, fonksiyon, tekrar=1):
+    """Aşamayı tekrar sayısı kadar çalıştırıp en iyi süreyi ve en yüksek RSS'i kaydeder"""
+    sureler = []
+    with BellekIzleyici() as bellek:
+        for _ in range(tekrar):
+            baslangic = time.perf_counter()
+            deger = fonksiyon()
+            sureler.append(time.perf_counter() - baslangic)
+    sure = min(sureler)
+    sonuclar.append({
+        'satır': satir,
+        'aşama': asama,
+        'süre': sure,
+        'satır_per_sn': satir / sure if sure > 0 else None,
+        'en_yüksek_rss_mb': bellek.en_yuksek / 2**20,
+    })
+    return deger
+
+
+def boyutu_olc(yol, satir, tekrar, veri_analiz_sinir):
+    """Tek veri dosyası için tüm aşamaları ölçer (ayrı süreçte çalışır)"""
+    logging.disable(logging.CRITICAL)  # reddedilen satır logları ölçümü ve çıktıyı kirletmesin
+    sonuclar = []
+    lenient = True  # geçersiz satır oranı > 0 ise katı yükleme ilk parçada durur
+
+    olc(sonuclar, satir, 'yükleme', lambda: DataManager().load_data(yol, lenient=lenient, use_cache=False))
+    onbellekli = DataManager()
+    onbellekli.load_data(yol, lenient=lenient)  # önbelleği hazırla
+    if onbellekli.last_report.is_valid:  # geçersiz satırlı dosyalar önbelleğe yazılmaz
+        olc(sonuclar, satir, 'yükleme_önbellekten',
+            lambda: DataManager().load_data(yol, lenient=lenient), tekrar)
+
+    data_manager = DataManager()
+    data_manager.load_data(yol, lenient=lenient, use_cache=False)
+    cerceve = pd.read_csv(yol, dtype=str, keep_default_na=False, encoding='utf-8')
+    olc(sonuclar, satir, 'doğrulama', lambda cerceve=cerceve: DataValidator().validate_frame(cerceve), tekrar)
+    if satir <= veri_analiz_sinir:
+        kayitlar = cerceve.head(satir).to_dict('records')
+        olc(sonuclar, satir, 'doğrulama_kayıtlar', lambda kayitlar=kayitlar: DataValidator.validate_csv_data(kayitlar))
+        del kayitlar
+    del cerceve
+
+    olc(sonuclar, satir, 'istatistik', lambda: DataAnalyzer(data_manager).calculate_statistics(), tekrar)
+    olc(sonuclar, satir, 'istatistik_yaklaşık',
+        lambda: DataAnalyzer(data_manager, approximate=True).calculate_statistics(), tekrar)
+
+    analyzer = DataAnalyzer(data_manager)
+    olc(sonuclar, satir, 'filtre_ilk', lambda: analyzer.filter_data('maaş', '>', 30000))
+    olc(sonuclar, satir, 'filtre_indeksli', lambda: analyzer.filter_data('maaş', '>', 45000), tekrar)
+    olc(sonuclar, satir, 'filtre_bileşik',
+        lambda: analyzer.query(Condition('maaş', '>', 20000) & Condition('departman', '==', 'IT')
+                               & Condition('yaş', 'between', (25, 40))), tekrar)
+    olc(sonuclar, satir, 'filtre_sorgu_metni',
+        lambda: analyzer.query("maaş > 20000 and departman in ('IT', 'Satış') "
+                               "and yaş_bandı != '55+'"), tekrar)
+    olc(sonuclar, satir, 'gruplama',
+        lambda: DataAnalyzer(data_manager).aggregate(['departman'], ['count', 'mean', 'p50']), tekrar)
+
+    bellek_disi = DataManager()
+    olc(sonuclar, satir, 'yükleme_bellek_dışı',
+        lambda: bellek_disi.load_data(yol, lenient=lenient, use_cache=False, out_of_core=True))
+    olc(sonuclar, satir, 'istatistik_bellek_dışı',
+        lambda: DataAnalyzer(bellek_disi).calculate_statistics(), tekrar)
+    olc(sonuclar, satir, 'gruplama_bellek_dışı',
+        lambda: DataAnalyzer(bellek_disi).aggregate(['departman'], ['count', 'mean', 'p50']), tekrar)
+    olc(sonuclar, satir, 'filtre_bellek_dışı',
+        lambda: DataAnalyzer(bellek_disi).query("maaş > 20000 and departman in ('IT', 'Satış')"), tekrar)
+
+    grafikler = ChartManager()
+    dataset = data_manager.dataset
+    departmanlar = analyzer.aggregate(['departman'], ['count', 'mean'])
+    for grafik, olusturucu, veri in (('maas', grafikler.build_salary_figure, dataset),
+                                     ('yas_maas', grafikler.build_age_salary_figure, dataset),
+                                     ('departman', grafikler.build_department_figure, departmanlar)):
+        olc(sonuclar, satir, f"grafik_{grafik}",
+            lambda: grafikler.render_bitmap(olusturucu(veri, (10, 6))), tekrar)
+
+    olc(sonuclar, satir, 'veri_analiz_akış',
+        lambda: veri_analiz.akis_analizi(veri_analiz.satirlari_oku(yol), 'maaş', 30000))
+    if satir <= veri_analiz_sinir:
+        def liste_tabanli():
+            veri = veri_analiz.dosya_oku(yol)
+            return (veri_analiz.ortalama_hesapla(veri, 'maaş'), veri_analiz.en_yuksek_bul(veri, 'maaş'),
+                    veri_analiz.en_dusuk_bul(veri, 'maaş'), veri_analiz.filtrele(veri, 'maaş', 30000))
+        olc(sonuclar, satir, 'veri_analiz_liste', liste_tabanli)
+
+    return sonuclar
+
+
+# --- Karşılaştırma ---
+def karsilastir(sonuclar, taban, esik=GERILEME_ESIGI):
+    """(satır, aşama) başına süre oranlarını döndürür; esik üstü gerileme sayılır"""
+    taban_sureleri = {(s['satır'], s['aşama']): s['süre'] for s in taban['sonuçlar']}
+    satirlar = []
+    for sonuc in sonuclar:
+        onceki = taban_sureleri.get((sonuc['satır'], sonuc['aşama']))
+        if not onceki:
+            continue
+        oran = sonuc['süre'] / onceki
+        satirlar.append({**sonuc, 'taban_süre': onceki, 'oran': oran, 'gerileme': oran > esik})
+    return satirlar
+
+
+def ortam_bilgisi():
+    return {
+        'zaman': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__,
+    }
+
+
+def arguman_ayristir(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz hattı için sentetik veriyle kıyaslama")
+    parser.add_argument('--sizes', nargs='+', type=lambda v: int(float(v)),
+                        default=[10**3, 10**4, 10**5, 10**6],
+                        help="Satır sayıları (10^3 - 10^8; 1e6 gibi yazılabilir)")
+    parser.add_argument('--departments', type=int, default=5, help="Departman sayısı (kardinalite)")
+    parser.add_argument('--invalid-rate', type=float, default=0.0, help="Geçersiz satır oranı (0-1)")
+    parser.add_argument('--seed', type=int, default=42, help="Üretici tohumu")
+    parser.add_argument('--repeat', type=int, default=3, help="Hızlı aşamalar için tekrar (en iyisi alınır)")
+    parser.add_argument('--data-dir', default='kiyaslama_veri', help="Üretilen CSV'lerin klasörü")
+    parser.add_argument('-o', '--output', help="Sonuç JSON dosyası (verilmezse stdout)")
+    parser.add_argument('--baseline', help="Karşılaştırılacak taban JSON dosyası")
+    parser.add_argument('--threshold', type=float, default=GERILEME_ESIGI,
+                        help="Gerileme eşiği (taban süresinin katı)")
+    parser.add_argument('--save-baseline', help="Sonuçları taban olarak bu dosyaya da yaz")
+    parser.add_argument('--list-limit', type=int, default=LISTE_TABANLI_SINIR,
+                        help="Liste tabanlı (satır sözlüğü) aşamaların çalıştırılacağı en büyük boyut")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = arguman_ayristir(argv)
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    sonuclar = []
+    for satir in args.sizes:
+        print(f"▶ {satir:,} satır", file=sys.stderr)
+        yol = veri_dosyasi(args.data_dir, satir, args.departments, args.invalid_rate, args.seed)
+        # Her boyut temiz bir süreçte: en yüksek RSS önceki boyutlardan etkilenmez
+        with ProcessPoolExecutor(max_workers=1) as havuz:
+            boyut_sonuclari = havuz.submit(boyutu_olc, yol, satir, args.repeat, args.list_limit).result()
+        for sonuc in boyut_sonuclari:
+            print(f"  {sonuc['aşama']:<22} {sonuc['süre'] * 1000:>10.1f} ms "
+                  f"{sonuc['en_yüksek_rss_mb']:>8.0f} MB", file=sys.stderr)
+        sonuclar.extend(boyut_sonuclari)
+
+    rapor = {
+        'ortam': ortam_bilgisi(),
+        'parametreler': {'departman': args.departments, 'geçersiz_oranı': args.invalid_rate,
+                         'tohum': args.seed, 'tekrar': args.repeat},
+        'sonuçlar': sonuclar,
+    }
+
+    cikis_kodu = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            karsilastirma = karsilastir(sonuclar, json.load(f), args.threshold)
+        rapor['karşılaştırma'] = karsilastirma
+        gerilemeler = [k for k in karsilastirma if k['gerileme']]
+        for k in gerilemeler:
+            print(f"✘ Gerileme: {k['satır']:,} satır {k['aşama']}: "
+                  f"{k['taban_süre'] * 1000:.1f} → {k['süre'] * 1000:.1f} ms ({k['oran']:.2f}x)",
+                  file=sys.stderr)
+        print(f"{len(karsilastirma)} ölçüm karşılaştırıldı, {len(gerilemeler)} gerileme", file=sys.stderr)
+        cikis_kodu = 1 if gerilemeler else 0
+
+    metin = json.dumps(rapor, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(metin)
+    else:
+        print(metin)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(metin)
+    return cikis_kodu
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+"""Toplu raporlama: Tkinter olmadan çok sayıda CSV için rapor ve grafik üretir.
+
+Örnek:
+    python toplu_rapor.py veriler/*.csv -o raporlar --workers 8 --format text json --charts png
+    python toplu_rapor.py veriler/ --birlestir --workers 16   # tüm parçalar için tek rapor
+    python toplu_rapor.py arsiv/2023.csv --bellek-disi        # bellekten büyük dosya
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')  # ekran olmayan sunucular için; finans modülünden önce seçilmeli
+
+from finans_yonetim_sistemi import (DataManager, DataAnalyzer, ChartManager, METRICS,
+                                    ShardedAggregator, format_report, setup_logging)
+
+GRAFIKLER = {
+    'maas': 'build_salary_figure',
+    'yas_maas': 'build_age_salary_figure',
+    'departman': 'build_department_figure',
+}
+
+
+def girdileri_topla(yollar):
+    """Dosya, klasör ve glob desenlerini tekil CSV yol listesine açar"""
+    dosyalar = []
+    for yol in yollar:
+        if os.path.isdir(yol):
+            eslesenler = sorted(glob.glob(os.path.join(yol, '*.csv')))
+        else:
+            eslesenler = sorted(glob.glob(yol)) or [yol]
+        for dosya in eslesenler:
+            if dosya not in dosyalar:
+                dosyalar.append(dosya)
+    return dosyalar
+
+
+def cikti_adlari(dosyalar):
+    """Her girdi için çıktı dosyası adı: ortak kök klasöre göre göreli yol, uzantısız
+
+    Aynı klasördeki dosyalarda ad dosyanın kendi adıdır; farklı klasörlerde aynı
+    adı taşıyan dosyalar (a/IT.csv, b/IT.csv) klasör adıyla ayrışır (a__IT, b__IT).
+    """
+    kok = os.path.commonpath([os.path.dirname(os.path.abspath(dosya)) for dosya in dosyalar])
+    adlar = {}
+    for dosya in dosyalar:
+        goreli = os.path.splitext(os.path.relpath(os.path.abspath(dosya), kok))[0]
+        adlar[dosya] = goreli.replace(os.sep, '__')
+    return adlar
+
+
+def json_uyumlu(deger):
+    """NumPy sayılarını json.dump'ın yazabileceği tiplere çevirir"""
+    if isinstance(deger, dict):
+        return {str(k): json_uyumlu(v) for k, v in deger.items()}
+    if isinstance(deger, (list, tuple)):
+        return [json_uyumlu(v) for v in deger]
+    if hasattr(deger, 'item'):
+        return deger.item()
+    return deger
+
+
+def dosya_isle(dosya, cikti_klasoru, bicimler, grafik_bicimleri, lenient=False, use_cache=True,
+               yaklasik=False, metrik=False, bellek_disi=False, ad=None):
+    """Tek bir CSV için istatistik, rapor ve grafikleri üretir (işçi süreçte çalışır)"""
+    baslangic = time.perf_counter()
+    if metrik:
+        METRICS.reset()  # işçi süreç önceki dosyanın ölçümlerini taşımasın
+        METRICS.enable()
+    ad = ad or os.path.splitext(os.path.basename(dosya))[0]
+
+    data_manager = DataManager()
+    if not data_manager.load_data(dosya, lenient=lenient, use_cache=use_cache,
+                                  out_of_core=bellek_disi):
+        return {'dosya': dosya, 'durum': 'hata', 'hata': 'Veri yüklenemedi'}
+
+    analyzer = DataAnalyzer(data_manager, approximate=yaklasik)
+    stats = analyzer.calculate_statistics()
+    dept_stats = analyzer.aggregate(['departman'], ['count', 'mean', 'min', 'max', 'p50'])
+
+    ciktilar = []
+    if 'text' in bicimler:
+        yol = os.path.join(cikti_klasoru, f"{ad}_rapor.txt")
+        with open(yol, 'w', encoding='utf-8') as f:
+            f.write(format_report(stats, dept_stats))
+        ciktilar.append(yol)
+
+    if 'json' in bicimler:
+        yol = os.path.join(cikti_klasoru, f"{ad}_rapor.json")
+        rapor = {
+            'dosya': dosya,
+            'istatistikler': stats,
+            'departmanlar': [dict(departman=grup[0], **metrikler)
+                             for grup, metrikler in dept_stats.to_dict().items()],
+            'reddedilen_satır': len(data_manager.last_report.rejected_rows),
+        }
+        if metrik:
+            rapor['metrikler'] = METRICS.snapshot()
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(json_uyumlu(rapor), f, ensure_ascii=False, indent=2)
+        ciktilar.append(yol)
+
+    if grafik_bicimleri:
+        chart_manager = ChartManager()
+        for grafik, olusturucu in GRAFIKLER.items():
+            veri = dept_stats if grafik == 'departman' else data_manager.dataset
+            fig = getattr(chart_manager, olusturucu)(veri)
+            for bicim in grafik_bicimleri:
+                yol = os.path.join(cikti_klasoru, f"{ad}_{grafik}.{bicim}")
+                fig.savefig(yol, format=bicim)
+                ciktilar.append(yol)
+            fig.clear()
+
+    return {
+        'dosya': dosya,
+        'durum': 'tamam',
+        'kayıt': stats['kişi_sayısı'],
+        'süre': time.perf_counter() - baslangic,
+        'çıktılar': ciktilar,
+    }
+
+
+def birlesik_rapor(dosyalar, cikti_klasoru, bicimler, workers, lenient=False):
+    """Tüm girdileri parçalara bölüp tek bir birleşik rapor üretir"""
+    toplayici = ShardedAggregator(workers=workers, lenient=lenient)
+    stats = toplayici.run(dosyalar)
+    if not stats:
+        return []
+
+    ciktilar = []
+    if 'text' in bicimler:
+        yol = os.path.join(cikti_klasoru, "birlesik_rapor.txt")
+        with open(yol, 'w', encoding='utf-8') as f:
+            f.write(format_report(stats))
+        ciktilar.append(yol)
+
+    if 'json' in bicimler:
+        yol = os.path.join(cikti_klasoru, "birlesik_rapor.json")
+        rapor = {
+            'dosyalar': dosyalar,
+            'istatistikler': stats,
+            'reddedilen_satır': sum(toplayici.result.rejected.values()),
+        }
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(json_uyumlu(rapor), f, ensure_ascii=False, indent=2)
+        ciktilar.append(yol)
+    return ciktilar
+
+
+def arguman_ayristir(argv=None):
+    parser = argparse.ArgumentParser(
+        description="CSV dosyaları için arayüzsüz toplu rapor ve grafik üretimi")
+    parser.add_argument('girdiler', nargs='+', help="CSV dosyaları, klasörler ya da glob desenleri")
+    parser.add_argument('-o', '--cikti', default='raporlar', help="Çıktı klasörü (varsayılan: raporlar)")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count(),
+                        help="Paralel işçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--format', nargs='+', choices=['text', 'json'], default=['text', 'json'],
+                        dest='bicimler', help="Rapor biçimleri")
+    parser.add_argument('--charts', nargs='*', choices=['png', 'svg'], default=['png'],
+                        dest='grafikler', help="Grafik biçimleri (boş bırakılırsa grafik üretilmez)")
+    parser.add_argument('--lenient', action='store_true',
+                        help="Geçersiz satırları atlayarak yükle")
+    parser.add_argument('--no-cache', action='store_true', help="İkili önbelleği kullanma")
+    parser.add_argument('--birlestir', action='store_true',
+                        help="Dosya başına rapor yerine tüm girdiler için tek birleşik rapor üret "
+                             "(büyük dosyalar bayt aralıklarına bölünür, yüzdelikler yaklaşıktır)")
+    parser.add_argument('--metrik', action='store_true',
+                        help="Aşama sürelerini ve önbellek isabetlerini JSON rapora ekle")
+    parser.add_argument('--yaklasik', action='store_true',
+                        help="Dosya başına raporlarda yüzdelik ve farklı sayıları taslaklarla hesapla")
+    parser.add_argument('--bellek-disi', action='store_true',
+                        help="Sütunları diskte parça parça tut (bellekten büyük dosyalar; "
+                             "yüzdelikler yaklaşıktır)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = arguman_ayristir(argv)
+    setup_logging()
+    dosyalar = girdileri_topla(args.girdiler)
+    if not dosyalar:
+        print("İşlenecek CSV dosyası bulunamadı.", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.cikti, exist_ok=True)
+    baslangic = time.perf_counter()
+
+    if args.birlestir:
+        ciktilar = birlesik_rapor(dosyalar, args.cikti, args.bicimler, args.workers, args.lenient)
+        if not ciktilar:
+            print("✘ Birleşik rapor üretilemedi (ayrıntılar logda)", file=sys.stderr)
+            return 1
+        print(f"✔ {len(dosyalar)} dosya birleştirildi: {', '.join(ciktilar)} "
+              f"({time.perf_counter() - baslangic:.2f} sn, {args.workers} işçi)")
+        return 0
+
+    adlar = cikti_adlari(dosyalar)
+    cakisanlar = sorted(ad for ad, sayi in Counter(adlar.values()).items() if sayi > 1)
+    if cakisanlar:
+        # Aynı adlı çıktılar birbirinin üzerine yazılırdı; hiçbir iş başlatılmadan dur
+        print(f"Çıktı adları çakışıyor: {', '.join(cakisanlar)}", file=sys.stderr)
+        return 2
+
+    hatali = 0
+
+    with ProcessPoolExecutor(max_workers=max(args.workers, 1)) as havuz:
+        isler = {havuz.submit(dosya_isle, dosya, args.cikti, args.bicimler, args.grafikler,
+                              args.lenient, not args.no_cache, args.yaklasik,
+                              args.metrik, args.bellek_disi, adlar[dosya]): dosya
+                 for dosya in dosyalar}
+        for is_ in as_completed(isler):
+            try:
+                sonuc = is_.result()
+            except Exception as e:
+                sonuc = {'dosya': isler[is_], 'durum': 'hata', 'hata': str(e)}
+
+            if sonuc['durum'] == 'tamam':
+                print(f"✔ {sonuc['dosya']}: {sonuc['kayıt']} kayıt, {sonuc['süre']:.2f} sn")
+            else:
+                hatali += 1
+                print(f"✘ {sonuc['dosya']}: {sonuc['hata']}", file=sys.stderr)
+
+    print(f"\n{len(dosyalar) - hatali}/{len(dosyalar)} dosya işlendi "
+          f"({time.perf_counter() - baslangic:.2f} sn, {args.workers} işçi)")
+    return 1 if hatali else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,21 +20,78 @@ def en_dusuk_bul(veri, sutun):
 def filtrele(veri, sutun, alt_limit):
     return [satir for satir in veri if float(satir[sutun]) > alt_limit]
 
+def satirlari_oku(dosya_adi):
+    """Dosyayı satır satır okur; tamamı belleğe alınmaz"""
+    with open(dosya_adi, newline='', encoding='utf-8') as f:
+        yield from csv.DictReader(f)
+
+def akis_analizi(satirlar, sutun, alt_limit=None, hedef=None):
+    """Tek geçişte ortalama, en yüksek, en düşük ve filtre sonucunu hesaplar.
+
+    Sonuçlar ortalama_hesapla, en_yuksek_bul, en_dusuk_bul ve filtrele ile
+    aynıdır. Filtreye uyan satırlar biriktirilmez, hedef(satir) ile hemen
+    yazılır (ör. liste.append ya da csv.DictWriter.writerow). Hiç satır
+    yoksa ortalama, en_yuksek ve en_dusuk None döner.
+    """
+    toplam = 0
+    sayi = 0
+    en_yuksek = en_dusuk = None
+    en_yuksek_deger = en_dusuk_deger = None
+    eslesen = 0
+
+    for satir in satirlar:
+        deger = float(satir[sutun])
+        toplam += deger
+        sayi += 1
+        # max/min gibi eşitlikte ilk satır korunur
+        if en_yuksek is None or deger > en_yuksek_deger:
+            en_yuksek, en_yuksek_deger = satir, deger
+        if en_dusuk is None or deger < en_dusuk_deger:
+            en_dusuk, en_dusuk_deger = satir, deger
+        if alt_limit is not None and deger > alt_limit:
+            eslesen += 1
+            if hedef is not None:
+                hedef(satir)
+
+    return {
+        'ortalama': toplam / sayi if sayi else None,
+        'en_yuksek': en_yuksek,
+        'en_dusuk': en_dusuk,
+        'kayit_sayisi': sayi,
+        'filtrelenen_sayisi': eslesen,
+    }
+
+def akis_ozeti(dosya_adi, sutun, alt_limit, cikti_dosyasi):
+    """Dosyayı tek geçişte özetler, limit üzerindeki satırları cikti_dosyasi'na yazar"""
+    with open(dosya_adi, newline='', encoding='utf-8') as girdi, \
+            open(cikti_dosyasi, 'w', newline='', encoding='utf-8') as f:
+        okuyucu = csv.DictReader(girdi)
+        # Başlık, filtreye hiç satır uymasa da girdinin sütunlarıyla yazılır
+        yazici = csv.DictWriter(f, fieldnames=okuyucu.fieldnames or [])
+        yazici.writeheader()
+        return akis_analizi(okuyucu, sutun, alt_limit, yazici.writerow)
+
 def menu():
     print("\n--- Veri Analiz Uygulaması ---")
     print("1. Ortalama maaş")
     print("2. En yüksek maaş")
     print("3. En düşük maaş")
     print("4. Belirli maaşın üzerindekileri listele")
-    print("5. Çıkış")
+    print("5. Akış modunda özet (büyük dosyalar için)")
+    print("6. Çıkış")
 
 def main():
-    veri = dosya_oku("veri.csv")
+    # Dosya yalnızca 1-4 seçeneklerinden biri ilk kez istendiğinde belleğe alınır;
+    # akış modu (5) tüm dosyayı hiç yüklemez
+    veri = None
 
     while True:
         menu()
         secim = input("Seçiminiz: ")
 
+        if secim in ("1", "2", "3", "4") and veri is None:
+            veri = dosya_oku("veri.csv")
+
         if secim == "1":
             print(f"Ortalama maaş: {ortalama_hesapla(veri, 'maaş'):.2f} ₺")
 
@@ -57,6 +114,19 @@ def main():
                 print("Bu değerin üzerinde maaş alan yok.")
 
         elif secim == "5":
+            limit = float(input("Alt limit maaş değeri girin: "))
+            cikti = input("Filtre sonucunun yazılacağı dosya [filtrelenmis.csv]: ").strip() or "filtrelenmis.csv"
+            ozet = akis_ozeti("veri.csv", 'maaş', limit, cikti)
+            if not ozet['kayit_sayisi']:
+                print("Dosyada analiz edilecek kayıt yok.")
+                continue
+            print(f"Kayıt sayısı: {ozet['kayit_sayisi']}")
+            print(f"Ortalama maaş: {ozet['ortalama']:.2f} ₺")
+            print(f"En yüksek maaş: {ozet['en_yuksek']['isim']} ({ozet['en_yuksek']['maaş']} ₺)")
+            print(f"En düşük maaş: {ozet['en_dusuk']['isim']} ({ozet['en_dusuk']['maaş']} ₺)")
+            print(f"{limit} ₺ üzerindeki {ozet['filtrelenen_sayisi']} kişi {cikti} dosyasına yazıldı.")
+
+        elif secim == "6":
             print("Program sonlandırıldı.")
             break
         else: